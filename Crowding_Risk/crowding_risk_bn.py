@@ -9,11 +9,31 @@ scenario testing in Today Mode and Future Mode (with TELe/CRL).
 
 import numpy as np
 import pandas as pd
+import threading
+from collections import OrderedDict
 from itertools import product
+from string import ascii_letters
 import warnings
+from network_model import NetworkModel
 warnings.filterwarnings('ignore')
 
 
+# Largest joint (in cells) that inference(method='auto') will materialize
+JOINT_MAX_CELLS = 1_000_000
+
+# Evidence patterns whose marginal tables are built with the joint
+# (GUI inputs, scenario analysis and dashboard presets)
+COMMON_EVIDENCE_PATTERNS = [
+    ('D', 'M', 'S', 'T', 'W'),
+    ('M', 'S', 'T', 'W'),
+    ('D', 'M', 'S', 'T'),
+    ('M',),
+]
+
+# Most results kept by the inference() memo cache (least recently used evicted)
+INFERENCE_CACHE_SIZE = 1024
+
+
 class BayesianNetwork:
     """
     Bayesian Network for Crowding Risk Prediction
@@ -40,9 +60,50 @@ class BayesianNetwork:
             'C': ['Low', 'Medium', 'High']
         }
         
+        # Parents of each variable, in the key order of its CPT
+        self.parents = {
+            'W': [],
+            'T': [],
+            'D': [],
+            'M': [],
+            'S': ['M'],
+            'P': ['W', 'T', 'D', 'M'],
+            'C': ['P', 'S', 'M']
+        }
+        
+        # Generic DAG model holding the structure and the compiled ndarray CPTs
+        self.model = NetworkModel()
+        for var, parents in self.parents.items():
+            self.model.add_node(var, self.domains[var], parents)
+        self.domains, self.parents = self.model.domains, self.model.parents
+        
         # Initialize CPTs
         self.cpts = {}
         self._initialize_cpts()
+        
+        # Compiled (ndarray) form of the CPTs, rebuilt when cpt_version changes
+        self.cpt_version = 0
+        self._tensors_version = None
+        self._letters = dict(zip(self.domains, ascii_letters))
+        self._einsum_plans = {}  # (query_var, evidence vars) -> compiled contraction steps
+        self._variable_elimination = None
+        self._junction_tree = None
+        self._samplers = {}
+        self._joint = None
+        self._joint_version = None
+        self._marginal_tables = {}  # (query_var, evidence vars) -> ndarray
+        self._batch_tables = {}     # query_var -> joint marginal with 'unobserved' slots
+        self._value_index = {var: {value: i for i, value in enumerate(values)}
+                             for var, values in self.domains.items()}
+        self._joint_cells = float(np.prod([len(values) for values in self.domains.values()],
+                                          dtype=float))
+        
+        # Memoized inference results, keyed on the CPT version so edits invalidate them;
+        # the lock makes lookups and evictions safe from threaded servers
+        self._inference_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
     
     def _initialize_cpts(self):
         """Initialize Conditional Probability Tables (CPTs)"""
@@ -204,48 +265,361 @@ class BayesianNetwork:
     
     def get_probability(self, var, value, evidence=None):
         """
-        Get probability P(var=value | evidence)
+        Get probability P(var=value | parents) from the CPT
         
         Args:
             var: Variable name
             value: Value of the variable
-            evidence: Dictionary of evidence {var: value}
+            evidence: Dictionary {var: value} giving every parent of var
         
         Returns:
             Probability
         """
-        if evidence is None:
-            evidence = {}
-        
-        cpt = self.cpts[var]
-        
-        # Simple variables (no parents)
-        if var in ['W', 'T', 'D', 'M']:
-            return cpt[value]
-        
-        # S depends on M
-        if var == 'S':
-            mode = evidence.get('M', 'Today')
-            return cpt[mode][value]
-        
-        # P depends on W, T, D, M
-        if var == 'P':
-            key = (evidence.get('W', 'Clear'),
-                   evidence.get('T', 'Morning'),
-                   evidence.get('D', 'Weekday'),
-                   evidence.get('M', 'Today'))
-            return cpt[key][value]
-        
-        # C depends on P, S, M
-        if var == 'C':
-            key = (evidence.get('P', 'Medium'),
-                   evidence.get('S', 'Normal'),
-                   evidence.get('M', 'Today'))
-            return cpt[key][value]
-    
-    def inference(self, query_var, evidence):
+        self.get_tensors()
+        return self.model.probability(var, value, evidence or {})
+    
+    def mark_cpts_changed(self):
+        """Call after editing self.cpts so compiled tables and cached results are rebuilt"""
+        self.cpt_version += 1
+        self.clear_inference_cache()
+    
+    def clear_inference_cache(self):
+        """Drop all memoized inference results (statistics are kept)"""
+        with self._cache_lock:
+            self._inference_cache.clear()
+    
+    def cache_info(self):
+        """Hit/miss statistics of the inference() memo cache"""
+        with self._cache_lock:
+            hits, misses, size = self._cache_hits, self._cache_misses, len(self._inference_cache)
+        lookups = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / lookups if lookups else 0.0,
+            'size': size,
+            'maxsize': INFERENCE_CACHE_SIZE
+        }
+    
+    def get_tensors(self):
+        """
+        CPTs as ndarrays, one axis per parent (in self.parents order) and a
+        last axis for the variable itself; compiled from self.cpts into the
+        model (and validated) until the CPTs change
+        """
+        if self._tensors_version != self.cpt_version:
+            for var, parents in self.parents.items():
+                shape = [len(self.domains[v]) for v in parents] + [len(self.domains[var])]
+                table = np.empty(shape)
+                for index in np.ndindex(*shape[:-1]):
+                    values = tuple(self.domains[p][i] for p, i in zip(parents, index))
+                    row = self.cpts[var]
+                    if len(values) == 1:
+                        row = row[values[0]]
+                    elif values:
+                        row = row[values]
+                    table[index] = [row[v] for v in self.domains[var]]
+                self.model.set_cpt(var, table)
+            self.model.validate()
+            self._tensors_version = self.cpt_version
+        return self.model.get_tensors()
+    
+    def _contract(self, query_var, evidence):
         """
-        Perform exact inference using enumeration
+        Unnormalized P(query_var, evidence) as an ndarray via one einsum
+        
+        Evidence is applied by indexing each CPT; the contraction path for a
+        (query variable, evidence variables) pattern is computed and compiled
+        once, then reused.
+        """
+        tensors = self.get_tensors()
+        observed = {var: self.domains[var].index(value)
+                    for var, value in evidence.items() if var != query_var}
+        
+        operands = []
+        inputs = []
+        for var, parents in self.parents.items():
+            axes = parents + [var]
+            index = tuple(observed.get(axis, slice(None)) for axis in axes)
+            operands.append(tensors[var][index])
+            inputs.append(''.join(self._letters[axis] for axis in axes if axis not in observed))
+        
+        key = (query_var, tuple(sorted(observed)))
+        if key not in self._einsum_plans:
+            self._einsum_plans[key] = self._compile_plan(inputs, self._letters[query_var], operands)
+        for positions, subscripts in self._einsum_plans[key]:
+            pair = [operands.pop(i) for i in positions]
+            operands.append(np.einsum(subscripts, *pair))
+        return operands[0]
+    
+    @staticmethod
+    def _compile_plan(inputs, output, operands):
+        """
+        Turn the greedy einsum path into a list of pairwise steps
+        (operand positions to pop, subscripts), so each query runs plain
+        C-level einsum calls instead of re-planning the whole expression
+        """
+        subscripts = ','.join(inputs) + '->' + output
+        path, _ = np.einsum_path(subscripts, *operands, optimize='greedy')
+        inputs = list(inputs)
+        steps = []
+        for contraction in path[1:]:
+            positions = sorted(contraction, reverse=True)
+            pair = [inputs.pop(i) for i in positions]
+            keep = set(output).union(*inputs)
+            result = ''.join(sorted(set(''.join(pair)) & keep))
+            if not inputs:
+                result = output
+            steps.append((positions, ','.join(pair) + '->' + result))
+            inputs.append(result)
+        return steps
+    
+    def get_joint(self):
+        """
+        Full joint distribution as an ndarray (axes in self.domains order),
+        materialized once and rebuilt when the CPTs change
+        """
+        if self._joint is None or self._joint_version != self.cpt_version:
+            tensors = self.get_tensors()
+            subscripts = (','.join(''.join(self._letters[v] for v in self.parents[var] + [var])
+                                   for var in self.parents)
+                          + '->' + ''.join(self._letters[v] for v in self.domains))
+            self._joint = np.einsum(subscripts, *[tensors[var] for var in self.parents],
+                                    optimize='greedy')
+            self._joint_version = self.cpt_version
+            self._marginal_tables = {}
+            self._batch_tables = {}
+            for pattern in COMMON_EVIDENCE_PATTERNS:
+                for query_var in ('C', 'P'):
+                    if query_var not in pattern:
+                        self._marginal_table(query_var, pattern)
+        return self._joint
+    
+    def _marginal_table(self, query_var, evidence_vars):
+        """
+        P(evidence vars..., query_var) summed out of the joint, axes in that
+        order; cached per (query, evidence pattern) until the CPTs change
+        """
+        key = (query_var, evidence_vars)
+        table = self._marginal_tables.get(key)
+        if table is None:
+            joint = self.get_joint()
+            names = list(self.domains)
+            keep = list(evidence_vars) + [query_var]
+            summed = tuple(i for i, var in enumerate(names) if var not in keep)
+            table = joint.sum(axis=summed)
+            remaining = [var for var in names if var in keep]
+            table = np.ascontiguousarray(table.transpose([remaining.index(v) for v in keep]))
+            self._marginal_tables[key] = table
+        return table
+    
+    def _joint_lookup(self, query_var, evidence):
+        """Unnormalized P(query_var, evidence): one slice of a cached marginal table"""
+        if self._joint_version != self.cpt_version:
+            self.get_joint()
+        evidence_vars = tuple(sorted(var for var in evidence if var != query_var))
+        table = self._marginal_table(query_var, evidence_vars)
+        return table[tuple(self._value_index[var][evidence[var]] for var in evidence_vars)]
+    
+    def inference(self, query_var, evidence, method='auto', ordering='min_fill', use_cache=True):
+        """
+        Perform exact inference
+        
+        Args:
+            query_var: Variable to query (e.g., 'C')
+            evidence: Dictionary of observed variables {var: value}
+            method: 'auto' ('joint' while the joint has at most JOINT_MAX_CELLS
+                    cells, else 'einsum'), 'joint' (lookup in the materialized
+                    joint), 'einsum' (tensor contraction), 've' (variable
+                    elimination), 'junction_tree', 'enumeration', or the
+                    sampling estimates 'likelihood_weighting' and 'gibbs'
+            ordering: Elimination heuristic for 've' ('min_fill' or 'min_degree')
+            use_cache: Reuse results memoized for the same query, evidence and
+                       CPT version (False always recomputes, e.g. for timing)
+        
+        Returns:
+            Dictionary of probabilities for each value of query_var (a new
+            dictionary on every call, so callers may modify it)
+        """
+        if not use_cache:
+            return self._infer(query_var, evidence, method, ordering)
+        
+        # Evidence on the query variable is ignored by every method
+        key = (query_var,
+               frozenset((var, value) for var, value in evidence.items() if var != query_var),
+               method, ordering, self.cpt_version)
+        with self._cache_lock:
+            cached = self._inference_cache.get(key)
+            if cached is not None:
+                self._cache_hits += 1
+                self._inference_cache.move_to_end(key)
+                return dict(zip(self.domains[query_var], cached))
+            self._cache_misses += 1
+        
+        # Computed outside the lock; a concurrent miss on the same key just stores it twice
+        result = self._infer(query_var, evidence, method, ordering)
+        with self._cache_lock:
+            self._inference_cache[key] = tuple(result[value] for value in self.domains[query_var])
+            while len(self._inference_cache) > INFERENCE_CACHE_SIZE:
+                self._inference_cache.popitem(last=False)
+        return result
+    
+    def _infer(self, query_var, evidence, method, ordering):
+        """Run one inference method without the memo cache"""
+        if method == 'auto':
+            method = 'joint' if self._joint_cells <= JOINT_MAX_CELLS else 'einsum'
+        if method == 'joint':
+            table = self._joint_lookup(query_var, evidence)
+            total = table.sum()
+            if total > 0:
+                table = table / total
+            return dict(zip(self.domains[query_var], table.tolist()))
+        if method == 'enumeration':
+            return self.inference_enumeration(query_var, evidence)
+        if method == 've':
+            table = self.get_variable_elimination().query(query_var, evidence, ordering)
+            return dict(zip(self.domains[query_var], table.tolist()))
+        if method == 'junction_tree':
+            evidence = {var: value for var, value in evidence.items() if var != query_var}
+            return self.get_junction_tree().marginal(query_var, evidence)
+        if method in ('likelihood_weighting', 'gibbs'):
+            table = self.get_sampler(method).query(query_var, evidence)
+            return dict(zip(self.domains[query_var], table.tolist()))
+        if method != 'einsum':
+            raise ValueError(f"Unknown inference method: {method}")
+        
+        table = self._contract(query_var, evidence)
+        total = table.sum()
+        if total > 0:
+            table = table / total
+        return dict(zip(self.domains[query_var], table.tolist()))
+    
+    def get_batch_table(self, query_var):
+        """
+        Joint marginal of every variable with one extra slot on each
+        non-query axis holding the sum over that axis, so that an
+        unobserved variable is just one more index
+        """
+        if self._joint_version != self.cpt_version:
+            self.get_joint()
+        table = self._batch_tables.get(query_var)
+        if table is None:
+            table = self._joint
+            for axis, var in enumerate(self.domains):
+                if var != query_var:
+                    table = np.concatenate([table, table.sum(axis=axis, keepdims=True)],
+                                           axis=axis)
+            self._batch_tables[query_var] = table
+        return table
+    
+    def _evidence_codes(self, var, column):
+        """
+        Value indices of one evidence column; missing entries (None, NaN)
+        become len(domain), i.e. unobserved
+        """
+        domain = self.domains[var]
+        series = pd.Series(column)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy()
+            lookup = pd.Index(domain).get_indexer(series.cat.categories)
+        else:
+            codes, uniques = pd.factorize(series)
+            lookup = pd.Index(domain).get_indexer(uniques)
+        if (lookup < 0).any():
+            unknown = (series.cat.categories if isinstance(series.dtype, pd.CategoricalDtype)
+                       else uniques)[lookup < 0]
+            raise ValueError(f"Unknown value(s) for {var}: {list(unknown)}")
+        return np.append(lookup, len(domain))[codes]
+    
+    def inference_batch(self, query_var, evidence_table):
+        """
+        Posteriors of query_var for many evidence rows at once
+        
+        Args:
+            query_var: Variable to query (e.g., 'C')
+            evidence_table: pandas DataFrame or dict of equal-length arrays, one
+                            column per observed variable; None/NaN leaves the
+                            variable unobserved in that row
+        
+        Returns:
+            (posteriors, risk_scores): an (n_rows x domain size) array in
+            domain order, and the expected score per row with the values
+            weighted 1, 2, 3, ... (Low=1, Medium=2, High=3)
+        """
+        columns = dict(evidence_table.items())
+        unknown = set(columns) - set(self.domains)
+        if unknown:
+            raise ValueError(f"Unknown variable(s): {sorted(unknown)}")
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("Evidence columns must have the same length")
+        n_rows = lengths.pop() if lengths else 0
+        
+        if self._joint_cells > JOINT_MAX_CELLS:
+            return self._inference_batch_rows(query_var, columns, n_rows)
+        
+        # One fancy index into the extended joint marginal gives every row
+        index = []
+        for var in self.domains:
+            if var == query_var:
+                index.append(slice(None))
+            elif var in columns:
+                index.append(self._evidence_codes(var, columns[var]))
+            else:
+                index.append(np.full(n_rows, len(self.domains[var])))
+        table = self.get_batch_table(query_var)[tuple(index)]
+        total = table.sum(axis=1, keepdims=True)
+        posteriors = np.divide(table, total, out=np.zeros_like(table), where=total > 0)
+        return posteriors, posteriors @ np.arange(1.0, len(self.domains[query_var]) + 1)
+    
+    def _inference_batch_rows(self, query_var, columns, n_rows):
+        """inference_batch for networks too large to materialize: once per distinct row"""
+        codes = np.column_stack([self._evidence_codes(var, column)
+                                 for var, column in columns.items()] or [np.zeros(n_rows, int)])
+        distinct, inverse = np.unique(codes, axis=0, return_inverse=True)
+        results = np.empty((len(distinct), len(self.domains[query_var])))
+        for k, row in enumerate(distinct):
+            evidence = {var: self.domains[var][i] for var, i in zip(columns, row)
+                        if i < len(self.domains[var])}
+            result = self.inference(query_var, evidence)
+            results[k] = [result[value] for value in self.domains[query_var]]
+        posteriors = results[inverse.reshape(-1)]
+        return posteriors, posteriors @ np.arange(1.0, len(self.domains[query_var]) + 1)
+    
+    def get_variable_elimination(self):
+        """Variable elimination engine over this network, created on first use"""
+        if self._variable_elimination is None:
+            from variable_elimination import VariableElimination
+            self._variable_elimination = VariableElimination(self)
+        return self._variable_elimination
+    
+    def get_junction_tree(self):
+        """Compiled junction tree of this network, created on first use"""
+        if self._junction_tree is None:
+            from junction_tree import JunctionTree
+            self._junction_tree = JunctionTree(self)
+        return self._junction_tree
+    
+    def get_sampler(self, method):
+        """Seeded approximate inference engine ('likelihood_weighting' or 'gibbs')"""
+        if method not in self._samplers:
+            from approximate_inference import LikelihoodWeighting, GibbsSampler
+            engine = {'likelihood_weighting': LikelihoodWeighting,
+                      'gibbs': GibbsSampler}[method]
+            self._samplers[method] = engine(self)
+        return self._samplers[method]
+    
+    def posterior_marginals(self, evidence):
+        """
+        Posterior marginals of all variables in one junction-tree calibration
+        
+        Returns {var: {value: probability}}; observed variables are point masses.
+        """
+        return self.get_junction_tree().marginals(evidence)
+    
+    def inference_enumeration(self, query_var, evidence):
+        """
+        Perform exact inference by enumerating the full joint (reference method)
         
         Args:
             query_var: Variable to query (e.g., 'C')
@@ -290,32 +664,8 @@ class BayesianNetwork:
         Compute joint probability of a complete assignment
         P(W,T,D,M,S,P,C) = P(W)P(T)P(D)P(M)P(S|M)P(P|W,T,D,M)P(C|P,S,M)
         """
-        prob = 1.0
-        
-        # P(W)
-        prob *= self.cpts['W'][assignment['W']]
-        
-        # P(T)
-        prob *= self.cpts['T'][assignment['T']]
-        
-        # P(D)
-        prob *= self.cpts['D'][assignment['D']]
-        
-        # P(M)
-        prob *= self.cpts['M'][assignment['M']]
-        
-        # P(S|M)
-        prob *= self.cpts['S'][assignment['M']][assignment['S']]
-        
-        # P(P|W,T,D,M)
-        p_key = (assignment['W'], assignment['T'], assignment['D'], assignment['M'])
-        prob *= self.cpts['P'][p_key][assignment['P']]
-        
-        # P(C|P,S,M)
-        c_key = (assignment['P'], assignment['S'], assignment['M'])
-        prob *= self.cpts['C'][c_key][assignment['C']]
-        
-        return prob
+        self.get_tensors()
+        return self.model.joint_probability(assignment)
 
 
 def run_scenario_analysis():
@@ -410,9 +760,24 @@ def run_scenario_analysis():
             'Risk Score': risk_score
         })
     
+    info = bn.cache_info()
+    print(f"\nInference cache: {info['hits']} hits, {info['misses']} misses "
+          f"(hit rate {info['hit_rate']:.0%})")
+    
     return pd.DataFrame(results), bn
 
 
+def score_scenario_grid(bn, variables=('W', 'T', 'D', 'M', 'S')):
+    """Crowding risk for every combination of the given inputs, in one batch"""
+    grid = pd.DataFrame(list(product(*[bn.domains[v] for v in variables])),
+                        columns=list(variables))
+    posteriors, risk_scores = bn.inference_batch('C', grid)
+    for i, value in enumerate(bn.domains['C']):
+        grid[f'P({value})'] = posteriors[:, i]
+    grid['Risk Score'] = risk_scores
+    return grid
+
+
 def generate_comparison_analysis(results_df):
     """Generate comparative analysis between Today and Future modes"""
     
@@ -470,6 +835,11 @@ if __name__ == "__main__":
     # Generate comparative analysis
     generate_comparison_analysis(results_df)
     
+    # Score every weather x time x day x mode x service combination
+    grid = score_scenario_grid(bn)
+    print(f"\nHighest-risk combinations (of {len(grid)}):")
+    print(grid.nlargest(5, 'Risk Score').to_string(index=False, float_format='%.4f'))
+    
     # Save results
     results_df.to_csv('/home/claude/scenario_results.csv', index=False)
     print("\n\nResults saved to scenario_results.csv")
@@ -568,12 +568,12 @@ Key Insights:
         future_evidence = {var: val.get() for var, val in self.future_vars.items()}
         future_evidence['M'] = 'Future'
         
-        # Run inference
-        today_crowding = self.bn.inference('C', today_evidence)
-        today_demand = self.bn.inference('P', today_evidence)
+        # Run inference (one junction-tree calibration per mode gives every marginal)
+        today_marginals = self.bn.posterior_marginals(today_evidence)
+        today_crowding, today_demand = today_marginals['C'], today_marginals['P']
         
-        future_crowding = self.bn.inference('C', future_evidence)
-        future_demand = self.bn.inference('P', future_evidence)
+        future_marginals = self.bn.posterior_marginals(future_evidence)
+        future_crowding, future_demand = future_marginals['C'], future_marginals['P']
         
         # Plot Today mode
         self.plot_mode_results(self.today_fig, today_crowding, today_demand, 
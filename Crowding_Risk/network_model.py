@@ -0,0 +1,248 @@
+"""
+Generic Discrete Bayesian Network Model
+Nodes with finite domains, parent lists and ndarray CPTs on any DAG, with
+topological ordering, validation and shared CPT storage
+
+Each CPT is an ndarray with one axis per parent (in the declared parent
+order) and a last axis for the node itself, the layout every inference
+engine in this directory expects from get_tensors(). CPTs live in a store
+keyed by name; a node either owns the entry under its own name or points at
+a shared key, so hundreds of structurally identical nodes (one crowding
+node per corridor station, say) keep a single table. Declaring a node is
+O(1); cycle, shape and normalization checks run once in validate().
+"""
+
+import time
+from collections import deque
+
+import numpy as np
+
+
+NORMALIZATION_TOLERANCE = 1e-6
+
+
+def topological_order(parents):
+    """Variables ordered so that every parent comes before its children (Kahn)"""
+    children = {var: [] for var in parents}
+    missing = {var: 0 for var in parents}
+    for var, var_parents in parents.items():
+        for parent in var_parents:
+            if parent not in children:
+                raise ValueError(f"Unknown parent {parent} of {var}")
+            children[parent].append(var)
+            missing[var] += 1
+    ready = deque(var for var, count in missing.items() if count == 0)
+    order = []
+    while ready:
+        var = ready.popleft()
+        order.append(var)
+        for child in children[var]:
+            missing[child] -= 1
+            if missing[child] == 0:
+                ready.append(child)
+    if len(order) < len(parents):
+        raise ValueError(f"Network has a cycle among "
+                         f"{sorted(var for var, count in missing.items() if count)}")
+    return order
+
+
+class NetworkModel:
+    """Discrete Bayesian network on a DAG with (optionally shared) ndarray CPTs"""
+
+    def __init__(self):
+        self.domains = {}     # node -> list of values
+        self.parents = {}     # node -> list of parents, in CPT axis order
+        self.cpt_keys = {}    # node -> key of its CPT in cpt_store
+        self.cpt_store = {}   # key -> ndarray (parent axes..., node axis)
+        self.cpt_version = 0
+        self._order = None
+        self._tensors = None
+        self._flat = None  # node -> (CPT as a flat list, [(family member, stride)])
+        self._value_index = {}
+
+    def add_node(self, name, values, parents=(), cpt=None, share=None):
+        """
+        Declare a node
+
+        Args:
+            name: Node name
+            values: Domain of the node
+            parents: Parent nodes (may be declared later), in CPT axis order
+            cpt: ndarray CPT owned by this node, or
+            share: key of a CPT in the store shared with other nodes
+        """
+        if name in self.domains:
+            raise ValueError(f"Duplicate node: {name}")
+        if cpt is not None and share is not None:
+            raise ValueError(f"Node {name}: give either cpt or share, not both")
+        self.domains[name] = list(values)
+        self.parents[name] = list(parents)
+        self._value_index[name] = {value: i for i, value in enumerate(self.domains[name])}
+        self.cpt_keys[name] = name if share is None else share
+        if cpt is not None:
+            self.set_cpt(name, cpt)
+        self._order = None
+        self._tensors = None
+        self._flat = None
+
+    def set_cpt(self, key, table):
+        """Store a CPT under a node name or shared key (rows over the last axis sum to 1)"""
+        self.cpt_store[key] = np.asarray(table, dtype=np.float64)
+        self.cpt_version += 1
+        self._tensors = None
+        self._flat = None
+
+    def cpt_shape(self, node):
+        return tuple(len(self.domains[v]) for v in self.parents[node] + [node])
+
+    def topological_order(self):
+        """Nodes with parents first, cached until the structure changes"""
+        if self._order is None:
+            self._order = topological_order(self.parents)
+        return self._order
+
+    def validate(self):
+        """Check parents, acyclicity, CPT shapes and normalization; raise ValueError"""
+        self.topological_order()
+        checked = {}
+        for node, key in self.cpt_keys.items():
+            if key not in self.cpt_store:
+                raise ValueError(f"Node {node} has no CPT ({key})")
+            shape = self.cpt_shape(node)
+            table = self.cpt_store[key]
+            if table.shape != shape:
+                raise ValueError(f"CPT {key} of node {node} has shape {table.shape}, "
+                                 f"expected {shape}")
+            if key in checked:
+                continue
+            if (table < 0).any():
+                raise ValueError(f"CPT {key} has negative entries")
+            if not np.allclose(table.sum(axis=-1), 1.0, atol=NORMALIZATION_TOLERANCE):
+                raise ValueError(f"CPT {key} rows do not sum to 1")
+            checked[key] = True
+
+    def get_tensors(self):
+        """{node: CPT ndarray}; nodes sharing a key get the same array"""
+        if self._tensors is None:
+            self._tensors = {node: self.cpt_store[key] for node, key in self.cpt_keys.items()}
+        return self._tensors
+
+    def storage_bytes(self):
+        """Memory held by the CPT store (shared tables counted once)"""
+        return sum(table.nbytes for table in self.cpt_store.values())
+
+    def probability(self, node, value, parent_values):
+        """P(node=value | parents) from the CPT; every parent must be given"""
+        missing = [p for p in self.parents[node] if p not in parent_values]
+        if missing:
+            raise ValueError(f"Missing parent value(s) for {node}: {missing}")
+        index = tuple(self._value_index[p][parent_values[p]] for p in self.parents[node])
+        index += (self._value_index[node][value],)
+        return float(self.cpt_store[self.cpt_keys[node]][index])
+
+    def joint_probability(self, assignment):
+        """Probability of a complete assignment {node: value}: product of all CPT entries"""
+        if self._flat is None:
+            flat_lists = {key: table.ravel().tolist() for key, table in self.cpt_store.items()}
+            self._flat = {}
+            for node, key in self.cpt_keys.items():
+                shape = self.cpt_shape(node)
+                family = self.parents[node] + [node]
+                strides = [int(np.prod(shape[i + 1:], dtype=np.int64)) for i in range(len(shape))]
+                self._flat[node] = (flat_lists[key], list(zip(family, strides)))
+        value_index = self._value_index
+        prob = 1.0
+        for table, strides in self._flat.values():
+            index = 0
+            for member, stride in strides:
+                index += value_index[member][assignment[member]] * stride
+            prob *= table[index]
+        return prob
+
+
+def corridor_model(stations, bn=None):
+    """
+    Per-station crowding model: the crowding network's W, T, D, M and S
+    shared by one demand node P_i and one crowding node C_i per station,
+    all stations sharing the demand and crowding CPTs
+    """
+    if bn is None:
+        from crowding_risk_bn import BayesianNetwork
+        bn = BayesianNetwork()
+    tensors = bn.get_tensors()
+    model = NetworkModel()
+    for var in ['W', 'T', 'D', 'M', 'S']:
+        model.add_node(var, bn.domains[var], bn.parents[var], cpt=tensors[var])
+    model.set_cpt('demand', tensors['P'])
+    model.set_cpt('crowding', tensors['C'])
+    for station in stations:
+        model.add_node(f'P_{station}', bn.domains['P'], ['W', 'T', 'D', 'M'], share='demand')
+        model.add_node(f'C_{station}', bn.domains['C'], [f'P_{station}', 'S', 'M'],
+                       share='crowding')
+    return model
+
+
+def main():
+    """Build a large corridor model, validate it and query it"""
+    from crowding_risk_bn import BayesianNetwork
+    from variable_elimination import VariableElimination
+    from approximate_inference import LikelihoodWeighting
+
+    print("Generic Bayesian Network Model")
+    print("=" * 80)
+
+    bn = BayesianNetwork()
+    stations = [f'S{i:03d}' for i in range(300)]
+
+    start_time = time.perf_counter()
+    model = corridor_model(stations, bn)
+    build_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    model.validate()
+    validate_time = time.perf_counter() - start_time
+    unshared = sum(np.prod(model.cpt_shape(node)) * 8 for node in model.domains)
+    print(f"{len(model.domains)} nodes: built in {build_time * 1000:.1f} ms, "
+          f"validated (incl. topological order) in {validate_time * 1000:.1f} ms")
+    print(f"CPT storage {model.storage_bytes() / 1024:.1f} KB shared "
+          f"vs {unshared / 1024:.1f} KB with one table per node")
+
+    print("\nQueries on the corridor model")
+    print("-" * 80)
+    evidence = {'W': 'Rainy', 'T': 'Evening', 'S': 'Reduced', 'M': 'Today'}
+    exact = bn.inference('C', evidence)
+    engine = VariableElimination(model)
+    result = engine.query('C_S150', evidence)
+    print(f"  P(C_S150 | evidence) by VE: {np.round(result, 4)} "
+          f"(single-station network: {np.round(list(exact.values()), 4)}); "
+          f"{len(engine.last_stats['pruned'])} nodes pruned in "
+          f"{engine.last_stats['runtime'] * 1000:.1f} ms")
+
+    # Crowding observed at neighbouring stations shifts the shared demand drivers
+    observed = {**{f'C_S{i:03d}': 'High' for i in range(140, 150)}, 'M': 'Today'}
+    exact = VariableElimination(model).query('C_S150', observed)
+    sampler = LikelihoodWeighting(model, seed=0)
+    estimate = sampler.query('C_S150', observed, target_se=0.005)
+    print(f"  P(C_S150 | 10 neighbours High): VE {np.round(exact, 4)}, "
+          f"likelihood weighting {np.round(estimate, 4)} "
+          f"(SE {sampler.last_stats['standard_error'].max():.4f}, "
+          f"{sampler.last_stats['samples']:,} samples)")
+
+    print("\nValidation errors")
+    print("-" * 80)
+    cyclic = NetworkModel()
+    cyclic.add_node('A', [0, 1], ['B'], cpt=np.full((2, 2), 0.5))
+    cyclic.add_node('B', [0, 1], ['A'], cpt=np.full((2, 2), 0.5))
+    unnormalized = corridor_model(stations[:3], bn)
+    unnormalized.set_cpt('crowding', np.full((3, 3, 2, 3), 0.5))
+    wrong_shape = corridor_model(stations[:3], bn)
+    wrong_shape.set_cpt('demand', np.full((3, 3, 2, 3), 1 / 3))
+    for label, case in [("cycle", cyclic), ("unnormalized", unnormalized),
+                        ("wrong shape", wrong_shape)]:
+        try:
+            case.validate()
+        except ValueError as e:
+            print(f"  {label}: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2 @@
+// Generated by posterior_table.py from crowding_risk_bn.py - do not edit
+window.POSTERIOR_TABLE = {"format":"crowding-posterior-table/1","fingerprint":"1be7b2b355a73570a2805e9947c7e031c403a25d","domains":{"W":["Clear","Rainy","Thunderstorms"],"T":["Morning","Afternoon","Evening"],"D":["Weekday","Weekend"],"M":["Today","Future"],"S":["Normal","Reduced","Disrupted"],"P":["Low","Medium","High"],"C":["Low","Medium","High"]},"tables":{"C":{"axes":["W","T","D","M","S","P"],"strides":[576,144,48,16,4,1],"rows":2304,"data":"MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/zcxMPh+Fyz57FM4+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/gNnoPNOp5T5K5AU/MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/KGvRPFgvxj77XBY/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/icwXPhU30D6m4uM+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+CZKXPuJb5D4VEoQ+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/RfOFPZiMBD//adU+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/tQY5PQWn6z4lOP0+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+L6ZyPol76z5fMZs+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+fqp/PiNe2D6ezKc+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/LS08Pcly9j6RB/I+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/7ccJPduc1T4TlQw/Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/XDlFPk/Z3T4Cir8+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/cT2KPnE9yj4fhas+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/gJuKPbU66j5sHvM+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/CyB1PW9yyj7IdAs/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/XoZVPpio0D45lMQ+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+8lm3PoiO4T4ML04+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/ndLzPdjPBT+pa7c+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/EyW7Paoj7z4RE+I+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+tcKXPmEU6j7VUXw+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+zpKhPuZM1j5LIIg+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/PXK8PTkM+j4419Y+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/wCeVPTyO2T7qkwA/Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/8kKBPnxe3T6SXqE+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/rkdhPn8nyz6qNMQ+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/ZF0iPcr35j5EXgI/MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw//9MQPRZnxz41PxM/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/WG8pPoRX0D7Q8No+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+laagPu2O4z79lHc+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/p1elPfPoBD8w2Mw+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/+hlvPQ+m7D6xdvU+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+RQWCPuwU6z7Q5ZI+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+H3mJPu3G1z70v54+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/ZxhyPQ569z7lQuo+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/haU3PUC91j4IJwk/Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/8bxWPji23T5Q67Y+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/UriePh+Fyz6PwpU+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/g+OyPR1b7z4C7OM+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/RL6dPfMnzz4+tAQ/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/6vt3PgEN0z4L9bA+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+Q83JPl8T4j67Pig+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/drUXPmq4Bz9ytKQ+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/TpTsPeWY8z4IQtE+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+MSWpPsh36z4OxlY+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+8gC1Ps0v1z6Bnmc+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/SeDtPdKN/j4c+sU+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/hDS+PUgp3j6XSfI+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/k5GSPmRC3z4JLI4+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/XI/CPnE9yj5mZmY+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/UqQBPv/r8z7ZQcs+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/gPPjPQpr0z4WmPM+SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/39qaPoN+0z6eppE+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+LJXpPgVG3z48k9w9AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/IqVOPqr7CD8btoY+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/A5slPooV9z70HLY+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+zpTHPp8Q6j4ltRw+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+gb7WPpEe1T7bRSg+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/9x0mPqETAT/Cyao+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/JzwHPqga4j5ER9o+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/1zexPpHH3j4xAWA+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/w/WoPn8nyz6+4os+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/1dvJPRSp8D7239w+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/es2xPbFf0D54lgE/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/XM+EPm8t0z41A6g+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+z+HSPmpG4T6Orxc+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/p2cnPsUUCD+iIpw+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/+M4DPu+X9D6VgMk+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+XtexPioR6z7wLkY+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+0qS+PpiY1j4thVU+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/82oEPhaV/z5wNb4+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/UCPVPaxJ3z5/bes+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/XVObPkwf3z5WjYU+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/H4VrPsP1yD6uR8E+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/+aZEPUwa5T5rKAE/MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/j8MuPeu8xT5SNRI/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/0hAzPi9Ezj5oM9g+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+oeakPrAJ4T5eH3Q+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/Tjq4PUfnAz/fIso+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/2bWJPW+u6j4b5PI+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+OGCGPvqw6D7O7pA+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+qiSOPv9p1T5WcZw+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/MASLPaGK9T5TtOc+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/+DVYPTDz1D4IAwg/Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/oehfPpR62z4bkbQ+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/mpmZPhSuxz5SuJ4+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/nbiyPS2r6T6spuk+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/A5edPQIAyj4fTQc/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/p8pwPrG1zj775Lg+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+i67EPlU83j5AKjo+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/0wwTPocqBT+IJKw+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/klfoPRQr7j4Hv9c+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+1c+kPtFJ5z60zGc+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+OuKvPsNY0z4Gink+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/11/pPREk+T75g8w+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/xV68PZHk2D6+A/g+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/lJqOPsH/2j6rZZY+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/AACAPiOYyD7dZ7c+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/npdyPUNo5j7JRPs+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/+uFWPaj0xj6MFw8/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/obNEPp1kzj6SQc8+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+LfutPro84D4xkGM+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/sJ7XPaJDBD8PkcE+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/fL+kPXqt6z6oIus+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+ZRKPPlxK6D4/o4g+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+isiXPsrS1D6sZJM+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/zvmlPeWR9j6n798+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/yAmDPZUT1j79lAQ/Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/NmxxPnxX2z5p8qs+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/Njx9Ptqsyj4LtbY+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/svVgPRnG6D4wG/s+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/1n1HPW4WyT7s/A4/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/+39BPkKJ0D7Bts4+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+VAytPpZ84j4s7mA+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/JynQPQ9qBT+ZIcE+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/JGmcPYEI7j423eo+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E++uONPnSO6j6RjYc+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+J6KWPtH91j4IYJI+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/as2dPa/n+D72pN8+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/Iyh2Pe5M2D4HdwQ/Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/+KNuPtuL3T4pIqs+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/JXWiPixlyT6vJZQ+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/+d/APftW7T4HceI+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/J/SpPYVZzT65FAQ/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/zzl/PsT60D5UaK8+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+PdTMPjuv3z4P+SY+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/PwQfPk+tBj9CI6M+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/3Qr7PSaF8T4juM8+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+l1OsPkwn6T46ClU+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+tl+4PpXs1D5qZ2U+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/ECn8PSCB/D6cdMQ+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/21fLPU8+3D676/A+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/QPiVPggR3T649ow+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/jNuIPjpPyj461aw+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/K3OHPREU6j4lD/Q+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/QZxvPStOyj4m3ws/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/yiJTPrGp0D7rxMU+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+4CC2PqCv4T7/XlA+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/iY3vPWrGBT/Jj7g+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/xnK3PYsH7z7DG+M+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+J5aWPtYn6j4FhH4+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+B0agPptm1j5eU4k+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/B8O4PfTu+T5K4Nc+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/3QKSPVNt2T77CAE/Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/xhOAPsNo3T53g6I+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/H4VrPsP1yD6uR8E+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/+aZEPUwa5T5rKAE/MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/j8MuPeu8xT5SNRI/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/0hAzPi9Ezj5oM9g+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+oeakPrAJ4T5eH3Q+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/Tjq4PUfnAz/fIso+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/2bWJPW+u6j4b5PI+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+OGCGPvqw6D7O7pA+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+qiSOPv9p1T5WcZw+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/MASLPaGK9T5TtOc+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/+DVYPTDz1D4IAwg/Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/oehfPpR62z4bkbQ+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/mpmZPhSuxz5SuJ4+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/nbiyPS2r6T6spuk+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/A5edPQIAyj4fTQc/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/p8pwPrG1zj775Lg+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+i67EPlU83j5AKjo+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/0wwTPocqBT+IJKw+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/klfoPRQr7j4Hv9c+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+1c+kPtFJ5z60zGc+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+OuKvPsNY0z4Gink+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/11/pPREk+T75g8w+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/xV68PZHk2D6+A/g+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/lJqOPsH/2j6rZZY+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/AACAPiOYyD7dZ7c+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/npdyPUNo5j7JRPs+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/+uFWPaj0xj6MFw8/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/obNEPp1kzj6SQc8+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+LfutPro84D4xkGM+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/sJ7XPaJDBD8PkcE+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/fL+kPXqt6z6oIus+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+ZRKPPlxK6D4/o4g+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+isiXPsrS1D6sZJM+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/zvmlPeWR9j6n798+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/yAmDPZUT1j79lAQ/Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/NmxxPnxX2z5p8qs+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/exSuPsP1yD7D9Yg+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/oADbPZbL7j5CdNo+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/QcXAPYa1zj6VjAA/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/GaCJPhoa0T7NRaU+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+2yHXPi3B3j7vORQ+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/+tgwPhkTBz9SbZk+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/ZuMMPk+g8j7+7cY+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+UjK2Pjit6D7tQEI+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+XVDDPqo71D7x51A+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/8WYNPqql/T7eprs+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/imvlPZ1/3T6BJek+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/NemfPqnj3D4iM4M+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/hevRPhSuxz7NzEw+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/4LIVPndc8z4ZysE+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/P30DPp340j7ESOs+SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/BH2oPpyL0T5g94U+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+xOn2PtPz2z6kibQ9AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/pshnPllWCD/13XY+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/QjQ8PvQc9j7qyKs+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+76HUPg9G5z4EMAg+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+7A3lPm4q0j5LjxE+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/xJQ8Po2fAD+EdqA+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/qtcaPv1w4T4uI9E+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/eY++PtZo3D5iD0o+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/7FG4PiOYyD7jK34+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/8vjxPY0Z8D42aNM+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/d9TUPUPtzz6f3fo+SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/gXGSPog60T73U5w+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+ZzbgPjj03T7CqgM+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/K4tAPnRvBz+C25A+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/N2gaPlqf8z6LLL8+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+f+S+PppG6D7PqTE+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+PfTMPnSk0z6dzj4+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/wOEaPu6s/j4y4rM+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/VVr8PQGg3j5pSeI+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/AKuoPpHA3D7eKHU+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/uB6FPmZmxj7herQ+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/mXCKPcSK5D4V2fg+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/idF0PX1KxT6pDQ4/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/G1VOPkhRzD4qhMw+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+OjuyPn233T6SGmA+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/VoHqPfZBAz+/274+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/WOi2Pdm16T4RkOg+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+WG2TPmrm5T4+rIY+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+FnScPtx10j4OFpE+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/yvG3PXmi9D4VYd0+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/AVKTPYVJ1D79cAM/Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/5pd6Ptkb2T40mKk+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/w/WoPrgexT6F65E+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/udXaPaYb6T7sLuA+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/AJ7APZSNyT52JQM/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/eAeGPsvCzD6+Na0+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+IwPSPiPq2j50JSY+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/VzAsPjaFBD9o3aA+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/CMUKPn4y7T7+as0+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+9tyxPkF/5D6TR1M+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+pTG+PqBk0D5202I+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/uCYLPuk7+D67MMI+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/y5XjPeU62D6o3+4+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/N/KbPgah2D7EbIs+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/KVyPPscIxj4Qm6o+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/7GihPbvY5T4KzfE+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/+neOPTuCxj7j7wo/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/6vdfPrdxzD5UksM+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+xk+7Pojq3D5li08+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/3PIEPlGeAz/vSbY+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/+vHRPeS06j6ezuA+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+hR+cPsx/5T5ewXw+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+9hemPqbe0T5kCYg+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/aOfSPb2p9T5pnNU+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/zUCqPepp1T7yAgA/Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/vQ2GPsH42D6C+aA+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/RPqNPn4dyD4+6Kk+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/9peYPZI26D5xo/E+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/6MWGPQCkyD5D1Qo/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/Q8RcPlyWzj6DB8M+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+7WC6PmMq3z5g6Uw+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/GDgBPr7EBD952rU+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/opvJPesP7T4sieA+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+G/GaPuTD5z4Clno+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+kvGkPq4J1D7ABIc+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/BLvKPYf/9z64UdU+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/F0uiPUOj1z73yf8+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/nqmEPiAt2z5CKaA+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/TtGxPtDVxj7iWIc+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/Fv3oPXPH7D5H+dg+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/JPvMPRfnzD4g2v8+SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/DD+NPt4Hzz4WuaM+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+1ijaPgld3D5D9BI+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/xCc4Pv4HBj8i3Jc+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/rR4UPpCM8D4ZZMU+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+uGC5Prxc5j4ZhUA+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+Iq/GPnL40T7asE4+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/VYsUPveY+z5eIbo+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/4I7yPaOU2z6lx+c+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/4k+jPk2y2j7R/YE+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/tTeYPt6/xz5tCKA+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/SJCvPYmE6T5ll+o+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/HtWaPb7byT59twc/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/EmduPsq2zj6tFbo+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+eHXDPm5d3j4zWjw+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/SeoQPhkhBT+pSK0+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/RaXkPfYO7j65x9g+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+SKOjPkZd5z7k/mk+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+cpWuPnhy0z4s8Hs+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/obDlPcwG+T4Mjc0+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/4zm5PajD2D7g7fg+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/aGuNPggK2z6Pipc+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/JQaBPsP1yD4ZBLY+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/O+x0PY4K5z7rV/o+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/WetYPT2Ixz4srQ4/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/f01GPl7Vzj7jA84+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+evKuPsmU4D578WA+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/CR/aPaSJBD/2ZMA+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/CoamPTVF7D5IGeo+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+pPCPPjmw6D4jX4c+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+AceYPogt1T53C5I+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/IcanPaMp9z7V5N4+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/S16EPd+o1j7HHwQ/Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/YxdzPszC2z6Dsao+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/L92kPhSuxz68dJM+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/PdvKPW+b6z7CreE+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/6KqyPVTLyz75xAM/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/qgOCPuBGzz52ta4+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+Y7rOPm7H3T5e/CY+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/MP8jPuTMBT+fZqI+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/4ZMCPtvB7z419M4+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+QWCuPhBJ5z5erVQ+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+kYS6Pkwc0z5HvmQ+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/5BADPhPD+j57tMM+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/FaLUPUCa2j47PfA+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/9TGYPvhH2z4Show+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/lkOLPiOYyD5HJKw+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/cG6RPYVY6D7fS/M+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/4oSAPfq/yD5njws/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/TvBXPsz1zj4NEsU+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+Bge4PtTH3z5OYlA+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/a4P5Pf/lBD8m07c+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/rI/BPUBE7T7VV+I+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+0KKYPptJ6D4pJ34+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+4WqiPlKW1D7N/og+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/vrvCPecw+D4pINc+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/F02bPUTJ1z67sQA/Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/fE2CPrSf2z7QEqI+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/EFi5PsP1yD5aZHs+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/QCPzPdi78D5Ye9I+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/J9nVPdiA0D7eCPo+SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/cD6TPkmr0T5HFps+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+tC3hPkZM3j4MDAE+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/WMtBPna1Bz9pr48+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/fksbPhY39D4rI74+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+vcK/Pnis6D6WIS8+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+tPLNPjP/0z4yHDw+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/6scbPqtE/z5g17I+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/2a79PUw13z7+XuE+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/loCpPuAr3T4Sp3I+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/Gy/dPhSuxz6iRTY+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/MMQhPrlM9T4v0bk+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/MQcOPu/D1D54OOQ+SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/WhuyPssc0j62j3c+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+znoAP+x+2z7eLY49AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/BLt4Prb4CD8jYmM+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/W5xKPruz9z4Y/qI+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+WjLePk9F5z5bIeo9l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+Q7DvPvft0T4Yh/k9eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/vfVKPg5vAT8Gp5c+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/UfkmPqwm4z6rXMk+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/2ibIPg2x3D4yUDY+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/gZXDPiOYyD64pGc+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/yQ0FPs8J8j5Mb8s+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/XOjpPZa40T5TzfM+SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/1w+cPrfL0T5yJJI+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+P0LqPlF/3T6/+eA9AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/iX1RPtERCD+ZHYc+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/UNAoPiA29T64YbY+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+6nTIPtpF6D54ih4+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+lJbXPv1n0z7eAio+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/uEIpPvglAD+0Eqs+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/004KPrBV4D7mgto+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/YUKyPsgI3T6uaWE+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/TmKQPmZmxj5MN6k+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/OpOiPQZ75j4r4PA+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/qnyPPc8Vxz6DhQo/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/yJFhPnfizD6lVMI+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+Eke8PpZC3T6v7Ew+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/CTMGPlPkAz/WHbU+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/iLjTPaBM6z4+xd8+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+xP2cPqnl5T4lOXo+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+bRanPmU50j4usIY+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/u7PUPXpB9j6XkdQ+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/UZWrPTT/1T54G/8+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/VOOGPhBk2T6cuJ8+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/WDm0PrgexT7wp4Y+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/WvjyPegL6z4CNtg+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/5bHVPeZYyz6gOv8+SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/zqWPPvpTzT44BqM+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw++w7cPjx12j6R9xI+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/tSI9PpQnBT9/H5c+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/IC0ZPkXJ7j4roMQ+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+YW27PoB+5D49KEA+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+/NPIPiko0D63B04+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/sYcZPuva+T49Ybk+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/Gtn7PZXw2T4lGec+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/mImlPj3p2D4rjYE+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/vp+aPscIxj57V58+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/jIu5Pf3I5z4f1Ok+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/34ujPY1NyD6+Zwc/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/lzRzPuYCzT7PYrk+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+nlvFPqF13D6CXTw+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/OuUVPq9ABD8GjKw+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/K8LuPapL7D7LA9g+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+8a+lPgt/5T4Iomk+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+TbqwPi+i0T4JR3s+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/WKnvPb9I9z7rzMw+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/HITCPZkf1z5gP/g+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/HqWPPvhA2T7pGZc+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/2T2ZPn4dyD6ppJ4+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/l7qwPdQm6j6Hquk+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/zdmbPVNvyj4dTQc/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/8ABwPosnzz7917g+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+xWzEPny13j59uzk+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/dSoSPhtnBT+QHKw+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/02vmPbGm7j5avtc+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+hoGkPiTD5z6rdmc+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+6ZOvPjbN0z7APXk+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/9HznPYme+T46gsw+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/Zo66PfJY2T50A/g+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI//0COPld12z6pSZY+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/5BS9PtDVxj6ZKng+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/248APrW37j5dANE+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/CQ/iPWqyzj7Uyfg+SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/Yt2WPg2Zzz6RiZk+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+rjTkPiLo2z7AjP89AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/IRpJPluqBj85Ho4+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/xoYiPlcj8j5Gmbw+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+I/HCPvtb5j7DZS0+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+eFHRPvq70T4b5Tk+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/TewiPvk3/T7gUbE+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/GGkFPlNK3T4hAeA+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/Q+esPoT62j5yPHA+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/SnujPt6/xz7YxJQ+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/6bLHPct06z57nuI+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/A+mvPRCnyz5YLwQ/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/4NGAPvlHzz4n5q8+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+UYHNPofo3T5QLCk+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/ptwhPnbDBT/AiqM+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/u7oAPryl7z7n/M8+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+szOtPoZc5z6N31Y+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+yTe5PgE20z5tJGc+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/STkBPs6l+j6OvcQ+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/Mn3RPVd52j5dJ/E+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/yQKXPkBS2z73qo0+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/QBNhPqwcyj60WcU+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/XMonPVOl5T6xsAI/MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/CZAVPU81xj5YjBM/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/Za4pPnc6zz5W7ts+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+vWigPr124j4LQXo+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/2a+mPQZKBD/+v80+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/HGNzPVBb6z5MOPY+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E++u+BPmry6T6cHZQ+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+ekyJPjG11j5V/p8+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/hTl2PVox9j52B+s+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/PjI8PTGB1T5EfAk/Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/LMdWPnGW3D75Bbg+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/qmCUPv7UyD5YyqI+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/TkqkPTQ26j45t+w+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/QP2QPWZ4yj4lpAg/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/OmhnPvqrzz7qn7w+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+pjDAPmOp3z7tS0A+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/mEcKPkaNBT+nwa8+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/R1PYPfXX7j45E9s+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+l1+gPkGL6D5QKm4+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+CQqrPvSj1D4CUoA+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/aXjZPcrK+T4c188+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/6VyuPZJy2T409vo+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/2gmKPp0b3D6J2pk+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/Io51Pg2/yT7jebs+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/AbtVPUrz5j5WVf4+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/dK49PQxtxz6TbhA/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/NFE7PuZazz6A/NI+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+SX2pPsip4T7esWk+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/OxTGPWKmBD8uLsU+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/MLuUPVta7D7Zdu4+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+JqKKPsyL6T4N0os+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+WvCSPvsd1j6r8ZY+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/YBKWPZ449z7KQuM+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/1g9qPZah1j44DgY/Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/wUpoPllz3D5HZ68+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/jNuoPqwcyj7IB40+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/UZLMPZ1W7z7PhN0+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/fyu0Peotzz6b4wE/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/4+6EPmIQ0j67AKk+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+96PSPjsu4D6cWxo+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/wBMoPth1Bz9wCp0+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/QOEEPjBN8z4wQso+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+E8KxPqnu6T6Inkg+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+LXi+PtuG1T7vAVg+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/OnMFPmJM/j4B+r4+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/rWnXPZ0N3j73F+w+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/e1ibPoX/3T4AqIY+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/lrLMPv7UyD7Y8FQ+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/uXsOPn7n8z6m2sQ+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/umD6PQFx0z7R9u0+SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/zcujPuWB0j5Psok+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+4GvyPuBg3T7+zMA9AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/bANfPhi5CD8zGH4+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/HTI0PtXJ9j4cHa8+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+sDHQPoCH6D6gjQ4+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+vDXgPp910z5JqRg+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/DaE0PunyAD+nyaM+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/u9YTPv7+4T6kFdQ+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/v/65PrKE3T4e+VA+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw//BizPg2/yT73J4M+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/pIrjPZSk8D7DeNY+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/tDrIPadl0D6si/0+SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/SsCNPtEw0j7lDqA+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+g7jbPkVh3z5vzAk+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/8cU3PjPSBz+heJQ+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/EmYSPjtM9D68gMI+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+QHS6PguI6T5qBzg+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+DRzIPqbv1D6b6EU+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/Ce4SPqdT/z5VNbc+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/eVjuPQIu3z7gO+U+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/RRqkPm7c3T6aEnw+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/kst/PlCNxz7njLg+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/lgR4PcsV5T6i6fs+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/A55bPeHCxT6vZA8/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/rvJEPpFHzT4YP9A+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+Vr2tPosk3z4/PGY+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/4vbYPbWkAz/deMI+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/DOSmPbpi6j5D5Os+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+Gv2OPton5z4M24k+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+5puXPg3B0z4No5Q+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/XAqoPTFJ9T44tOA+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/JFCFPYbX1D456gQ/Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/cXZxPrU32j4SDa0+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/07yjPqJFxj6L/ZU+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/a2fMPaym6T55P+M+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/PQS0PfgFyj58fAQ/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/QVaBPhO5zT6s8LA+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+P4XNPjBX3D4hRyw+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/HWsjPvbnBD+HeqQ+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/48ICPmDf7T4vv9A+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+t2ytPrLA5T4vpVk+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+dVm5PtGv0T507Wk+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/ATMDPqLi+D7eg8U+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/7pPVPebI2D4e0vE+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/fGGXPuK82T6i4Y4+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/OiOKPrAvxz4Wra4+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/nfqSPcJj5j6W3fQ+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/N96BPZ/6xj7qRgw/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/fZVWPv9nzT5DTcc+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+4dG2PpZX3j4SrVU+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/RFv4PREBBD8O57k+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/r+3BPcVh6z7PIuQ+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+R6+XPjzB5j59j4E+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+xT+hPtgp0z5jlos+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/+v/CPXZQ9j6M79g+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/8D6cPev31T4tfAE/Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/A32BPp4U2j5gbqQ+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/VcGIPmdEyT5E+q0+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/pymKPZnB6D79s/Q+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/S1h0PWUcyT5JLAw/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/1mFTPqSMzz5xwsY+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+COO1PnGX4D4NC1M+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/u+XwPX0nBT+Yd7k+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/V5e5Pcy87T5e3eM+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+3ICWPlUF6T7PeYA+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+YhmgPt9U1T6/kYo+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/ltO6PUCm+D7bpNg+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/OkmUPUQx2D43XgE/Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/5BiAPv1I3D4gnqM+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/X5isPrn8xz7oaos+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/x47aPXpS7T7UCdw+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/YWHAPXtfzT4WRAE/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/1Y2IPib+zz4EdKc+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+8qrVPhbK3T7wFRk+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/iWIvPr1qBj9BeZs+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/iBwMPnE58T5LuMg+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+efC0Piye5z604kY+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+8dbBPqND0z7YylU+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/npcMPrA//D6BdL0+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/A43kPaQi3D4buuo+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/J7+ePinO2z6vcoU+MzMzPwAAgD7NzEw9mpmZPgAAAD/NzEw+zczMPTMzsz7NzAw/xf6SPsjmyD5zGqQ+zczMPjMzsz4AAIA+wzciPEcUGD+0xco+q2cHPMlpvj59rR4/+iGhPZAP6j7yp+0+MzOzPpqZmT4zM7M+6JAaPIfUBD9qgvE+IQgCPCmKoj7Lsiw/WzuOPSJUyj6EDgk/SOEaP83MjD6PwvU9pQhaPoJMBT+pYog+2l6UPdDGsz69kBM/pQRlPhKtzz6b0L0+J4E4P91gij6GmhM8zczMPs3MDD/NzEw9zcxMPs3MzD7NzMw+lPe+PnzK3z7ge0I+AAAAP83MzD7NzMw9zczMPWZmJj8AAIA+hpoTPHGh5j7dYAo/DyUIPtiDBT/I5bA+ZmbmPjMzsz7NzEw+zcxMPZqZGT8zM7M+yz0NPOaexj6Wexo/+qDUPde77j7rG9w+fXspPxkxmT5ovx49ppukPtNNEj/RIts95OAbPlgE0T43C+E+CTOfPree6D5/XHA+l/E1Pz5ehT5J6es8MBW0PuaeBj8VtPo9k10bPv5wwD444PE+Qr2pPqm91D4VhYE+eQ3lPolTvz77PTc+kl1XPd3cHj+VWqc+6i4NPK120T7uDxU/M8nVPYWt+T4v4NA+SEjIPiQkpD6Uk5M+kh7WPOlhDT9F2tc+waUGPIVlsT6mMiU/BjirPalR2T5W4Ps+Yi4iP/P+kj4ikaI9/M+IPivNCz9eKz8+URDmPZRlwj4sCwI/rtqIPuUl3D5t/5o+"},"P":{"axes":["W","T","D","M","S","C"],"strides":[576,144,48,16,4,1],"rows":2304,"data":"MzMzPmZmBj+amZk+F84APado4T7LPgc/KIfLO0MWMj5h41E/zcxMPTMzsz6amRk/GyE0Pyiv+T0BpDI+v8wfPZBT7T7Ysv4+usnDPNWxhz7ICDY/zcxMPTMzsz6amRk/dD8vPzZDBD75vj4+FroePTE28D6M8vs+phP0PMbpjz6AajA/zcxMPTMzsz6amRk/7/RQPgSyAD+BIZY+l30KPWRy5T71ngQ/Kd1cPAN/Vj7L7EY/zcxMPTMzsz6amRk/0Uz5Pfgh8j7Uis8+bzT4PNj63D7xwAk/AuPkOgDxij1uL24/zcxMPTMzsz6amRk/1rPDPuL9CD+WQak9hjcePfL24D4OoQU/nIhEPGv1Vj6DMEc/zcxMPTMzsz6amRk/3QX/PuVZxj76gOo9EL0bPZib6T5jdgE/oqOlPI+ifT4/ajs/zcxMPTMzsz6amRk/xwsPPoIh8z6aWMU+PzsFPQOs3j5LVgg/un3RO98I/T3pu14/zcxMPTMzsz6amRk/wb4RPvtx/D6krro+xnn8PLP93j5YnQg/LfePO1LeBT59aF0/zcxMPTMzsz6amRk/hEn5PpEXzT6te+Y9Rv4ePRgH5z6PjAI/LQ6bPMLRdz4eMz0/zcxMPTMzsz6amRk/AdoUP1U+iz5UGxY+k14dPT427T7wHf8+Mv3WPM2SiT6wfjQ/zcxMPTMzsz6amRk/OWkoPl+e+D4ELbM+DLMHPejZ4T7blwY/bdItPKfaMj4MklA/zcxMPTMzsz6amRk/chzHPjmO4z6rqio+LW7CPcmeAT/jJsw+Kme3PI2JdD5jIj0/mpkZPs3MzD5mZuY+zfNiP4evbz2jE2E98QbrPbT4BD/cTLs++ryhPQfQqj5dYBY/mpkZPs3MzD5mZuY+gpRgP3wjgT3icHQ98BPpPcFfBj+C+7g+7F/FPfRVsT4IqQ4/mpkZPs3MzD5mZuY+v9PePukf0T6vGCA+YEvPPXjVAj83gsY+QAdAPc4Wjj4l9Cw/mpkZPs3MzD5mZuY+6JCaPvvB5D4drYA+XXe8PZav/z6SMtE+YuvbO+5syz2M2mQ/mpkZPs3MzD5mZuY+c0UhP9AFrD5Vegs9+RXrPSOt/j5fjcY+64ArPW7rjj460i0/mpkZPs3MzD5mZuY+FRo9P+oeYD4F4y09mTPmPTOLAz+0XL8+SSWLPStWoj5CcB0/mpkZPs3MzD5mZuY+X4mrPjUj3j7Xpmw+gAvJPfQAAD85u80+m0bBPKndMT5hfk0/mpkZPs3MzD5mZuY+C/esPt1C5D4xjF0+9y6/PRWnAD8Y5s4+1xiFPAuXPD52sUw/mpkZPs3MzD5mZuY+nrI6Py0Oaj5pnSw9kA7rPZIdAj84AcE+NgKDPU+Inz6S2x8/mpkZPs3MzD5mZuY+KUBOPwIAEz5l/U89qcbnPc8XBT+43rs+xUuwPffnqz6MAhQ/mpkZPs3MzD5mZuY+1bfAPnvD2D5gCU0+gv3LPWlWAT/NU8o+Z70aPcuecj53rDk/mpkZPs3MzD5mZuY+AACAPnFW/j6PqYE+tMVKPREI6z45n/s+dfYnPB+vQj5etEw/D+qgPaiDuj7qoA4/avhKP25Yuj1C5O09FLJ5PTee9T6GK+s+vf0dPeYMkT6xmS0/D+qgPaiDuj7qoA4/mBpHPxsOxz2SDgA+ned3PUt9+D7Cheg+UNVDPQ31mD4kSCc/D+qgPaiDuj7qoA4/XxeTPg8D8D4ky3k+6H5ZPbOq7j5wJfY+KaC0PDJfaD4yQ0A/D+qgPaiDuj7qoA4/ps44PnPF7T4607U+R7RDPQPP5j46XQA/NN4/O+ZImj0F92s/D+qgPaiDuj7qoA4/2iT5Pj4G5z49p349oPN3PeSC6T6ofvc+HeGgPJ0XaT4Qs0A/D+qgPaiDuj7qoA4/6A4bP8jBnz6fgag9orNzPYQe8j4Ha+8+1EEGPQkqiD7ehjM/D+qgPaiDuj7qoA4/ocBRPkAh7D5v/qo+fbhRPd8n6D4Rof0+G+UtPAEeCz7rgFo/D+qgPaiDuj7qoA4/vvdUPv1S9D4kMaE+sepGPV+66D5LaP4+tyDvO2lGEz4kUFk/D+qgPaiDuj7qoA4/wj4YP9PrpT6iWqY97c54PUx17z7WcPE+Ab37PG0+hT7hgjU/D+qgPaiDuj7qoA4/qX0vP4d2WT6sJdE9XP91PUmZ9T7Lpus+7yQtPf7Ekj4yyys/D+qgPaiDuj7qoA4/uw9zPlOp7T7Qzpg+r19VPQc36z4DHfo+pwKPPDntQj6dzEo/D+qgPaiDuj7qoA4/zjnnPr733j7OOec9F84APtnnED9CyZ0+wQgMPdmJnT6Ieig/zcxMPmZm5j4zM7M+5HZqP7/tUD39owc9LlQZPo9jEj/Ljo4+mAfmPRj6zD4ChPk+zcxMPmZm5j4zM7M+WKhoP2fCYT0XuBM9YtoXPgG8Ez/Mmow+OEcKPlOn0T4RNek+zcxMPmZm5j4zM7M+e9H/Ps2Syj7ibtY9P6EIPg6FET9EpZg+1TaOPTuTsT6IbxU/zcxMPmZm5j4zM7M+5z67PrbS6T7G3DU+KLb6PUJ+Dz/yVaI+e6wzPNE6DD6aIlo/zcxMPmZm5j4zM7M+TsssP8aDmz7SWa48JIUaPrI9DT8JQpg+36d+PQkOsz5+jhY/zcxMPmZm5j4zM7M+ZHNHP2RzRz5c+NU8wKgWPktHET8KHZI+4m/IPSJOxT7zSgQ/zcxMPmZm5j4zM7M+STXNPjY44D4BJSU+Xz0FPrgnDz/hEZ8+MmAXPWoUaz7ixDs/zcxMPmZm5j4zM7M+Fd3NPk065T470Rk+f9z9PVsjED8rQqA+W5jQPENieT6sIjs/zcxMPmZm5j4zM7M+EjRFP8yYUD5Tt9Q8N+4ZPubJDz8ZdZM+q469PfrCwj6t7AY/zcxMPmZm5j4zM7M+hKZXPxivAT63tv08ZFAXPiWgEj+EF48+aHz5PRtDzT7LXfQ+zcxMPmZm5j4zM7M+iJ3iPkoQ1z5bpAw+lNcGPtZFED+KCJw+1i1qPePmmj6x6SM/zcxMPmZm5j4zM7M+Q3kNP/Mayj42lFc9LW5CPnsGIj/mdzU+iYiIPTmO4z6lT/o+mpmZPgAAAD/NzEw+xaVyP9QpID1351U8IrBhPhGcHz+a3x8+FHVBPqVj/z7R4Z8+mpmZPgAAAD/NzEw+CYBxP8OVLT2jpmk8DDBfPhbXID+ecx0+4P1hPifP/T7pMZE+mpmZPgAAAD/NzEw+9Z8ZP+o4tD5hOUQ934NMPoFZIT8bFi4+HpYBPvy27z71fc8+mpmZPgAAAD/NzEw+bqfyPnl04D5hkLM9wGQ+PhhwIT/g2js+JpLNPPywbT4wJz4/mpmZPgAAAD/NzEw+JUk+P9u2fT4lSRI8waRlPuN8Gz+0Zyw+JITpPfs+8z78X9I+mpmZPgAAAD/NzEw+frJVP1RLHj5lqy48scxePn4kHz9WoSQ+H7wsPq7n+z5Duq0+mpmZPgAAAD/NzEw+gG8CP+oj0z5W9J89ug5JPsIDID8+4jY+gZmbPfT9sj7WDRM/mpmZPgAAAD/NzEw+iyMCP/mt1j7HK5Q9Lj5APv20IT/e7Tg+LVdXPdCzvj6lMBM/mpmZPgAAAD/NzEw+F8tTP63yJT5bDy48La1jPqGJHT9QLCY+9cwkPiza+j5av7I+mpmZPgAAAD/NzEw+G3tjPwmqyj0K6Us8VwNfPogTID+KriA+HLJPPq8n/T5D/5o+mpmZPgAAAD/NzEw+K5EMP9ChxT5p74Q94bJKPvqlID84tTI+vfHePYt52j4Gyu0+mpmZPgAAAD/NzEw+ED74Ppka2D5enb49g3gTPmXGFT/1too+AVYrPVkDrj70SB4/oQ5qPtu27T7UQZ0+s3dtPzcIPz0o+dI8dkguPqo3Fj/h2Hg+qqMHPkk72j7i8uE+oQ5qPtu27T7UQZ0+iOVrP+KlTj04A+Y8O4gsPpuIFz9aVXU+ItUhPtOC3T6cktE+oQ5qPtu27T7UQZ0+33kIP50gwz6Wrq89Aw4cPqIMFj+534U+7i6rPWD3wD5yHgo/oQ5qPtu27T7UQZ0+48fMPr3b5j7AuBg+3cUPPh+TFD/U9o4+GsJjPON5ID5/UlQ/oQ5qPtu27T7UQZ0+lPYyP1hokT77p4o8TiAwPqhWET+IQoU+H4GZPe3gwj5mXws/oQ5qPtu27T7UQZ0+m5BMPzetOD7kgqg8CXsrPq1HFT9CZn8+PuPtPXFn0z6/H/E+oQ5qPtu27T7UQZ0+VQ7fPpwG3D4f1gk+nIgYPp7zEz931Is+rHs7PVNsgz4ckjI/oQ5qPtu27T7UQZ0+N2DfPrGL4D4wKAA+gHYRPo0fFT+mBY0+CU0BPS2Oiz4ZJDI/oQ5qPtu27T7UQZ0+zW5KP3RPQT66qqc8dzYvPqbBEz944YA+CHzhPbgm0T5GevY+oQ5qPtu27T7UQZ0+lvBbPxfP7j3asMY8zw4sPmGEFj+t33k+o7cSPvXy2T46sdw+oQ5qPtu27T7UQZ0+PGP0Ppdh0T607Og9LzMaPsDxFD/oAok+HnSOPX0iqj4+IBk/oQ5qPtu27T7UQZ0+etObPji96T6c3nQ+JHKCPb9H5D64G/s+sgFZPHzhPT6aI00/zczMPTMzsz7NzAw/DElVP0/Skz1R5cE93DCgPT/o7T6KC+o+yfZKPQqrjD4O+yw/zczMPTMzsz7NzAw/n/9RP019nj24hdE98BWfPTPB8D5Reec+TAN7PbwAlD5tTyY/zczMPTMzsz7NzAw/ciOxPoEy2j4bVGk+j8yLPVud5z6Bb/U+68zoPKsWYj7uM0A/zczMPTMzsz7NzAw/mCVlPhOP3j4h3q4+KN57PbU94D5DIwA/96d3O8NVlj2gPWw/zczMPTMzsz7NzAw/H0sOP/g1xz5RnmE90f2ePeYQ4j6mL/Y+t3/PPLDzYj4Wx0A/zczMPTMzsz7NzAw/tVIrP1RAhT4HaZA9B2KcPQuT6j5zVO4+u64sPcc1hD4xGjM/zczMPTMzsz7NzAw/EyeBPkuE2z6iVKM+YdSGPc5X4T4a8/w+QVJgPEN5Bz5moFo/zczMPTMzsz7NzAw/gRKDPscH4z645Zk+T/h/PcQT4j4y7f0+lmoaPBeWDz7QsFk/zczMPTMzsz7NzAw/mLgoPyfPij6l/o49mZSfPYjh5z5SOfA+BfchPWtugT5aKTU/zczMPTMzsz7NzAw/UrY9P3R3MT6IXq899tudPT3z7T7Fleo+pDZePUcyjj5yAys/zczMPTMzsz7NzAw/JFeUPjn92j6iq5A+LSqJPUFK5D40a/k+aGK4POq4PT6yzko/zczMPTMzsz7NzAw/7+7uPs3MzD6JiAg+NUgDPjVIAz99y7c+CCEEPQghhD5rrTU/zcxMPs3MzD7NzMw+LK9qP3fjOT3EKRs9iQ8dPmFKBT9546Y+qmPgPe67sT6UFQs/zcxMPs3MzD7NzMw+TOJoP8reSD1x/Cg9probPuCrBj/uyqQ+tp8HPhHItj4KtAI/zcxMPs3MzD7NzMw+0roDP55xuT71Yvw9y38LPj4RBD+fHbI+8BuIPYkRlz69cyM/zcxMPs3MzD7NzMw+vR7APtdA1T7XQFU+KAv/PeDAAT91u7w+62AiPOBM4T3gTGE/zcxMPs3MzD7NzMw+vUQyP2Sdjj4mks084HsdPk3p/z7DWLE+GqdzPXBImD5WoSQ/zcxMPs3MzD7NzMw+kRZLP9aFND45//g86RcaPn8UBD8Oy6o+v2jCPacbqj4VpRI/zcxMPs3MzD7NzMw+j5rSPvSLzD76skE+wKUHPmuMAT9KFLk+zEEMPYWcQT7C1EY/zcxMPs3MzD7NzMw+ONvTPn6w0T6V6DQ+pDwBPl5zAj/zero+jJ3BPGvBTT65gkY/zcxMPs3MzD7NzMw+5gFJPwP/PD4ny/c8ZkYdPtGWAj8sL6w+O3+3PS2Wpz4CRRU/zcxMPs3MzD7NzMw+S8BZP4vL6D08ZBI9UP0aPux/BT9/gac+j7nzPfI9sj7VaQg/zcxMPs3MzD7NzMw+feroPpR7xD7fMyU+G3cJPr28Aj/5yrU+N19dPQ4pgj6GFTE/zcxMPs3MzD7NzMw+7FG4PjDR3z7IuU8+mgWoPe8H7j6q9uc+1AOTPGxFUD6GVkc/O6gDPqiDuj4d1AE/OkteP0tweT0M7pA9JcvMPTk39j7+ldY+3iKGPRCElj6c+SM/O6gDPqiDuj4d1AE/1ZZbPxcphj1FIJ09b0nLPTYM+T5vIdQ+MuGkPQtmnT7UsBw/O6gDPqiDuj4d1AE/bVTPPta9zj5620M+nqGzPZ3r8D77K+I+xR0cPex4dT7p3zg/O6gDPqiDuj4d1AE/2Z6LPqGN2z6G05g+PX6iPSA66j5RJu0+7cqqO3Hbpz38rmk/O6gDPqiDuj4d1AE/LVAcP6onsT7hvzE9K9zLPcGm6j40YuI+NEwLPUesdj4roDk/O6gDPqiDuj4d1AE/Wh84P6HbZz7Tm149vTbIPeUd8z5r1No+71dlPSsljj7slyo/O6gDPqiDuj4d1AE/5/WbPvWW1j4kc40+yKatPQXy6j5JpOk+EvaYPDuQFT5B1FU/O6gDPqiDuj4d1AE/e9GdPgRK3T6B5IQ+QQKlPTr16z42yuo+iLlSPF2fHj5DDVU/O6gDPqiDuj4d1AE/ELE1PwMEcj773lw9s1HMPcJW8D7RlNw+4nZXPS5jiz771iw/O6gDPqiDuj4d1AE/djpJP2JiGD6PZ4U90OTJPfBb9j7cKtc+C4ySPT3Ulz5gxCE/O6gDPqiDuj4d1AE/KuOwPnxk0z60cHc+BHewPavB7T6UIOY+NvP4PIVdTz4FYUQ/O6gDPqiDuj4d1AE/f0mqPmaB7j42ak4+DfqXPSRW+D5Zq+E+dt6GPLVhXD6fsEQ/16PwPaabxD5kO/8+NxNbPwHGjT1FoJk9eEG5PWlzAD/QyNA+b1R1PZzDnj7rSCE/16PwPaabxD5kO/8+uSlYP/VUmD1AXaY928+3PQPfAT8DTs4+lMqWPZAJpj7mIRo/16PwPaabxD5kO/8+kJzAPjKJ3T58tEM+2HmiPTVZ+z5VCNw+FgwPPb+3gT5fMzY/16PwPaabxD5kO/8+G0mAPsiu6D4dCJc+mAaTPV5z9D78yuY+numdOysDsz3HY2g/16PwPaabxD5kO/8+yPgTPwxvwT4q+zQ9C7O4Pck39T51m9w+3y3/PORNgj6f3zY/16PwPaabxD5kO/8+nTwxP3W3gD6FemY9mCm1PdS8/T7G+NQ+J9ZRPcQClj484Sc/16PwPaabxD5kO/8+nrePPgYW5D5cMow+PyqdPXpE9T72cOM+fOiMPEPrHj7r3VM/16PwPaabxD5kO/8+VlSRPqkL6z4CoIM+a0eVPRg49j4OduQ+I+tBPKxeKD6o4FI/16PwPaabxD5kO/8+d6UuP84phj4aWmQ9Jfm4Pf33+j65ydY+2ipFPVcfkz6nHSo/16PwPaabxD5kO/8+L8tDP/kEKz6TnIs9g5y2PbuCAD9pU9E+yQuGPeUvoD6UJh8/16PwPaabxD5kO/8+QYqjPjRu4T4WD3Y+IKqfPSIh+D5W9N8+G5jkPGGgWz4n80E/16PwPaabxD5kO/8+Qaz1PrgX0j4b8OA9p40NPlk6DT98xJ4+7/EZPVaXmT42lSk/UrhePj813j6YbrI+iX1sP3TjOj31h/o8XCkoPh9iDj8TJ48+7sr7PTX7xj4PEvo+UrhePj813j6YbrI+R9ZqP9YWSj28hAg9xpcmPie8Dz/PO40+RRYXPjcnyz6nTek+UrhePj813j6YbrI+gicHP8/TvT61dM89wA4WPpi8DT9vf5k+NwacPT3GrD4aHBY/UrhePj813j6YbrI+xJ7IPi0t3j4daDI+HsgJPuDeCz8xXqM+SOJEPDNGCD7q2lo/UrhePj813j6YbrI+JEczP7UXjz4ioKU8qVcpPkFGCT+qx5g+msyLPelYrj74WRc/UrhePj813j6YbrI+DGhMP+RGNT5Xx8g8PUAlPmtRDT8LvZI+BJfbPRCzvz6YswQ/UrhePj813j6YbrI+TAvbPllB1D61ZiE+J1YSPopvCz/Z9Z8++PUlPf+QZD5hfDw/UrhePj813j6YbrI+z8jbPk0J2T7HWxY+AIELPop9DD9tRKE+qAnlPODWcj77ITw/UrhePj813j6YbrI+ZE9KP6LIPT5nzsc8HMIoPkTNCz9qBJQ+db3PPaBKvT4BYwc/UrhePj813j6YbrI+FF5bP+b76T3cTew8p/wlPsSkDj8kuI8+c20IPj8Wxz4Is/Q+UrhePj813j6YbrI+8trwPoq2yj4I3Qg+aRgUPvaFDD/f55w+IW2APcCslj78myQ/UrhePj813j6YbrI+19rDPnfe5D5jjS4+7EW9PToFAT8SpM4+LD6xPMCjcT4fDT4/wJMVPhvsyz4FSuk+ECliP884dD03Nmk97ATlPat8BD9uxb0+NuWcPd5sqT7qrBc/wJMVPhvsyz4FSuk+VLtfP22Lgz3jM3095SHjPVDkBT/obrs+aKK/PRwNsD4lBRA/wJMVPhvsyz4FSuk+SXLbPqGV0j4s8CM+dNzJPT5FAj9n/sg+pt85PfGgjD6NES4/wJMVPhvsyz4FSuk+UIeXPopO5T4mKoM+02y3Pbpx/j4Rs9M+X+nTO21tyD2ASmU/wJMVPhvsyz4FSuk+xdgfP6dWrj5/vg896v3kPZmn/T7tGMk+rfolPWFtjT6k6S4/wJMVPhvsyz4FSuk+Htw7PyyoYz5znTM9hkbgPUkKAz/N2cE+bOKGPavnoD7drx4/wJMVPhvsyz4FSuk+qVioPvPo3j7IfHE+RrfDPdjT/j5XPtA+AZe6PFKTLz5zRk4/wJMVPhvsyz4FSuk+FM2pPlcg5T4qJWI+zRa6PZMKAD8nZdE+onqAPD0kOj4cc00/wJMVPhvsyz4FSuk+/G45Px6zbT7HQzI9XgHlPf2dAT+vg8M+XO59PTsWnj79FSE/wJMVPhvsyz4FSuk+eixNP5eFFT7/IVc90tbhPdmZBD+aVr4+/hGrPRGQqj64VRU/wJMVPhvsyz4FSuk+8Ge9Po/U2T4Bh1E+lZzGPYjCAD/L08w+VKAVPTbhbz6trTo/wJMVPhvsyz4FSuk+etObPji96T6c3nQ+JHKCPb9H5D64G/s+sgFZPHzhPT6aI00/zczMPTMzsz7NzAw/DElVP0/Skz1R5cE93DCgPT/o7T6KC+o+yfZKPQqrjD4O+yw/zczMPTMzsz7NzAw/n/9RP019nj24hdE98BWfPTPB8D5Reec+TAN7PbwAlD5tTyY/zczMPTMzsz7NzAw/ciOxPoEy2j4bVGk+j8yLPVud5z6Bb/U+68zoPKsWYj7uM0A/zczMPTMzsz7NzAw/mCVlPhOP3j4h3q4+KN57PbU94D5DIwA/96d3O8NVlj2gPWw/zczMPTMzsz7NzAw/H0sOP/g1xz5RnmE90f2ePeYQ4j6mL/Y+t3/PPLDzYj4Wx0A/zczMPTMzsz7NzAw/tVIrP1RAhT4HaZA9B2KcPQuT6j5zVO4+u64sPcc1hD4xGjM/zczMPTMzsz7NzAw/EyeBPkuE2z6iVKM+YdSGPc5X4T4a8/w+QVJgPEN5Bz5moFo/zczMPTMzsz7NzAw/gRKDPscH4z645Zk+T/h/PcQT4j4y7f0+lmoaPBeWDz7QsFk/zczMPTMzsz7NzAw/mLgoPyfPij6l/o49mZSfPYjh5z5SOfA+BfchPWtugT5aKTU/zczMPTMzsz7NzAw/UrY9P3R3MT6IXq899tudPT3z7T7Fleo+pDZePUcyjj5yAys/zczMPTMzsz7NzAw/JFeUPjn92j6iq5A+LSqJPUFK5D40a/k+aGK4POq4PT6yzko/zczMPTMzsz7NzAw/7+7uPs3MzD6JiAg+NUgDPjVIAz99y7c+CCEEPQghhD5rrTU/zcxMPs3MzD7NzMw+LK9qP3fjOT3EKRs9iQ8dPmFKBT9546Y+qmPgPe67sT6UFQs/zcxMPs3MzD7NzMw+TOJoP8reSD1x/Cg9probPuCrBj/uyqQ+tp8HPhHItj4KtAI/zcxMPs3MzD7NzMw+0roDP55xuT71Yvw9y38LPj4RBD+fHbI+8BuIPYkRlz69cyM/zcxMPs3MzD7NzMw+vR7APtdA1T7XQFU+KAv/PeDAAT91u7w+62AiPOBM4T3gTGE/zcxMPs3MzD7NzMw+vUQyP2Sdjj4mks084HsdPk3p/z7DWLE+GqdzPXBImD5WoSQ/zcxMPs3MzD7NzMw+kRZLP9aFND45//g86RcaPn8UBD8Oy6o+v2jCPacbqj4VpRI/zcxMPs3MzD7NzMw+j5rSPvSLzD76skE+wKUHPmuMAT9KFLk+zEEMPYWcQT7C1EY/zcxMPs3MzD7NzMw+ONvTPn6w0T6V6DQ+pDwBPl5zAj/zero+jJ3BPGvBTT65gkY/zcxMPs3MzD7NzMw+5gFJPwP/PD4ny/c8ZkYdPtGWAj8sL6w+O3+3PS2Wpz4CRRU/zcxMPs3MzD7NzMw+S8BZP4vL6D08ZBI9UP0aPux/BT9/gac+j7nzPfI9sj7VaQg/zcxMPs3MzD7NzMw+feroPpR7xD7fMyU+G3cJPr28Aj/5yrU+N19dPQ4pgj6GFTE/zcxMPs3MzD7NzMw+7FG4PjDR3z7IuU8+mgWoPe8H7j6q9uc+1AOTPGxFUD6GVkc/O6gDPqiDuj4d1AE/OkteP0tweT0M7pA9JcvMPTk39j7+ldY+3iKGPRCElj6c+SM/O6gDPqiDuj4d1AE/1ZZbPxcphj1FIJ09b0nLPTYM+T5vIdQ+MuGkPQtmnT7UsBw/O6gDPqiDuj4d1AE/bVTPPta9zj5620M+nqGzPZ3r8D77K+I+xR0cPex4dT7p3zg/O6gDPqiDuj4d1AE/2Z6LPqGN2z6G05g+PX6iPSA66j5RJu0+7cqqO3Hbpz38rmk/O6gDPqiDuj4d1AE/LVAcP6onsT7hvzE9K9zLPcGm6j40YuI+NEwLPUesdj4roDk/O6gDPqiDuj4d1AE/Wh84P6HbZz7Tm149vTbIPeUd8z5r1No+71dlPSsljj7slyo/O6gDPqiDuj4d1AE/5/WbPvWW1j4kc40+yKatPQXy6j5JpOk+EvaYPDuQFT5B1FU/O6gDPqiDuj4d1AE/e9GdPgRK3T6B5IQ+QQKlPTr16z42yuo+iLlSPF2fHj5DDVU/O6gDPqiDuj4d1AE/ELE1PwMEcj773lw9s1HMPcJW8D7RlNw+4nZXPS5jiz771iw/O6gDPqiDuj4d1AE/djpJP2JiGD6PZ4U90OTJPfBb9j7cKtc+C4ySPT3Ulz5gxCE/O6gDPqiDuj4d1AE/KuOwPnxk0z60cHc+BHewPavB7T6UIOY+NvP4PIVdTz4FYUQ/O6gDPqiDuj4d1AE/xMMDP0tLyz61tLQ9rQ4jPmjAEj/Z94g+4WY/Pf5CrD4T6B0/AACAPmZm5j6amZk+9GVvP/+oKj2R7708bBxAPoy7Ej9k9XQ+3P8VPlDc1T7CI98+AACAPmZm5j6amZk+cfptP+S8OD0dOM88Djo+PskNFD/MjnE+Om8yPhJu2D5RWs4+AACAPmZm5j6amZk+PwwQP5iBtj6ll6U9CmEsPkHgEj/5DoQ+7lW+PSIhvj6xJAk/AACAPmZm5j6amZk+1Y3bPqBV2z4WORI+6QcfPu+hET8tOI0+rux+PCMrHz6EOVQ/AACAPmZm5j6amZk+Hko5P5BohT5IM4A80RJCPo/qDT95IYM+7NuqPWo3wD7NiAo/AACAPmZm5j6amZk+xFJRP2p1Jz4m/Jk84xM9PiTcET+Ne3s++cYDPpWMzz7vj+4+AACAPmZm5j6amZk+tyLuPnco0D6kaQM+MowoPlvfED8x+4k+PjVRPcz0gT5G8jE/AACAPmZm5j6amZk+vHnuPsdu1D73XfQ9F98gPuMkEj+vRos+6osQPbs/ij5k1zE/AACAPmZm5j6amZk+zVdPPzN1Lz69XJk84hlBPoFNED8csH0+8fv5PV96zT6lBvQ+AACAPmZm5j6amZk+inxfP7QI1z37S7Q8X7U9PnYQEz/ICHY+zwoiPlFP1T5Hq9k+AACAPmZm5j6amZk+M9EBP54exT7x+9w9clwqPh/SET+JLYc+KpqePT3bpz4cPxg/AACAPmZm5j6amZk+wvkYPyxRuz6J2hU9XL5lPkIaJD+e2Ak+MzOzPQAAAD8zM9M+MzOzPgAAAD+amRk+/ih1P1e0Cj0I7wo8ZPSDPjP6Hz/XXPA9H7psPuruBT85ins+MzOzPgAAAD+amRk++zh0P+V2Fj2+5Rc8+XeCPlMuIT+Grew9BXyIPvtiAz8JfGE+MzOzPgAAAD+amRk+/bkkP7WjpT6IQgc97tFwPqjZIj9wxwM+0l4kPrVPAj8uMak+MzOzPgAAAD+amRk+/ucFP0ZW1D7uzX49znphPhzgIz/ABA8+jYISPawzkT4BPi4/MzOzPgAAAD+amRk+IuxFP3AyYj4+ocM735eGPmw5HD+Q6gE+56kUPkW8BD+DMqw+MzOzPgAAAD+amRk+imBbP3xJCz5Ji+Y7rXqCPjzFHz9v6/c96qNVPnKGBT8nIYo+MzOzPgAAAD+amRk+m9UOPzwuxj5sNGE97GVtPifyIT950Qo+peLQPSv2zT4s0f0+MzOzPgAAAD+amRk+1lcOP3ZEyT74XlA9eW9jPsj6Iz9opQw+YTeRPah13D6APP8+MzOzPgAAAD+amRk+gahZPxMuEj4S/eU7i0eFPs0XHj9qI/o9maNMPi5/BT/Xr44+MzOzPgAAAD+amRk+sslnP0oAsT0tkQU8MHmCPgGMID80u/E9FOd8PiUcBD9XqHI+MzOzPgAAAD+amRk+OoMYP2zLtz7+cDk9VgZvPjNgIj/eeAc+xiwQPrkz8j7ltcU+MzOzPgAAAD+amRk+q6oKP2IYxj4lSZI9EQY2PrmvFz8LO2s+9dhlPSGKvz5g3RE/6qCOPtu27T47qIM+aW9xP/hcHz39WJM8SedUPneRFj/c0lA+urYsPkYB5D5do8U+6qCOPtu27T47qIM+yC5wP1qjLD094KA8wLlSPv/bFz9C1k0+R8RLPjjZ5D6lRLU+6qCOPtu27T47qIM+btgWPzP2sD7EY4U9lvY/PmxyFz+4P2I+MzngPaxjzz4Ijvg+6qCOPtu27T47qIM+97zqPv4h2T4thPA9V9gxPj3MFj+39nI+VOSfPAHgOD7dyEw/6qCOPtu27T47qIM+bqI9P5PYfD4020k8Yq1XPhAIEj9fMmA+GKbJPQMN0j53ifs+6qCOPtu27T47qIM+F9NUP9ilHT7K3HA8MtNRPv/fFT/QrFY+Y8sYPkbT3j4Ix9Q+6qCOPtu27T47qIM+YUP9PpP7zD4yBNc9ZCI8PsS6FT+L8mw+1+J+PTuakj61xCY/6qCOPtu27T47qIM+Kjv9PhXe0D4Dm8c9zcEzPlM0Fz/mbG8+ElgwPewqnD4J5SY/6qCOPtu27T47qIM+c+5SP8tFJT5/BnA8Ck1WPlhIFD+YkVg+okoRPgco3T6oMto+6qCOPtu27T47qIM+rGViP96yyT0Df4w83VFSPhj3Fj/F0VE+8Qg6PtLA4j62OsA+6qCOPtu27T47qIM+qyQJP33RwD6ylLM95/I9Ph+LFj+e4Gc+5Ce9PRtduT52rAs/6qCOPtu27T47qIM+7MTOPuzEzj5P7EQ+jDHGPc455z7OOec+QUyuPPdYSz5gt0c/mpkZPjMzsz4AAAA/IjpjP5T6UT1SY3o9MeDwPah97j5MStU+uQOePSEFkj74PCM/mpkZPjMzsz4AAAA/h9xgP5JGYj18+Ic9TyvvPdZM8T5W6NI+HcTBPfJUmD4EnRs/mpkZPjMzsz4AAAA/NJjmPtRcvT7xFTg+4bLTPenS6T5eQOE+YpM4PW0Bbz5vtjg/mpkZPjMzsz4AAAA/lwGfPr3pzT6sFJM++rq/PZaZ4z6sd+w+hVXKO57Doz3h8mk/mpkZPjMzsz4AAAA/0q0nPxqAnD4KIiE9GanvPZ8t4z4b6OA+7NEkPc5ccD6umzk/mpkZPjMzsz4AAAA/jXtBPw6mSD7zrkU9jIzrPYyM6z5RkNk+fEOHPeQUij4eDSo/mpkZPjMzsz4AAAA/J5SwPmgVyD5xVoc+LLPMPTQU5D4Bv+g+8g61PHPLET6s5FU/mpkZPjMzsz4AAAA/F6CyPsVDzj5HOH4+96vCPQNA5T7/FOo+P8F5PFHTGj4nZFU/mpkZPjMzsz4AAAA/UEQ/P4HPUT74fEQ9D0LwPZW96D7nMds+S0d+PdF3hz6jXyw/mpkZPjMzsz4AAAA/0NFQPyQ6Aj5v+mk9MYftPWyx7j7I7NU+h3SsPQ4kkz5o3yA/mpkZPjMzsz4AAAA//tDGPn+rwz4HB2s+P/7PPTzI5j41OOU+MzwTPS//ST5xTEQ/mpkZPjMzsz4AAAA/8MEHP4wuuj5ONtk92DsmPq38BD+66KI+LaYzPSS4jz6L6Sw/AACAPs3MzD4zM7M+4pRvP2fQFz3vwt08TcxEPnOcBT/0YJI+hioSPn89uT4+rf0+AACAPs3MzD4zM7M+8SpuP5hXJD288vE80xdDPlX4Bj9tg5A+nOYuPoOSvD4w+us+AACAPs3MzD4zM7M+sukTP6GUpj7tX8Y9mggwPgZTBT+nVZ0+Fp21PWhCoT4pqxg/AACAPs3MzD4zM7M+G+jgPpS3xz6iwC4+C9IhPs24Az9hpac+4G1jPEhy/D3/41w/AACAPs3MzD4zM7M+fk0+P2SWcz4cnZk8a9BFPkaUAD9A75s+ivWiPYr1oj6KJho/AACAPs3MzD4zM7M+44RUP+sfFz5RZLY8wWdBPuueBD9LDpY+2zr/PTOpsj4LxAY/AACAPs3MzD4zM7M+AfDzPpWJvT7UDB0+caErPowhAz8x7KM+VFlAPVxqVD7U3z4/AACAPs3MzD4zM7M+L+X0Po/pwT6DYhI+9tUjPrJMBD+he6U+fCAFPdpbYj4CFz8/AACAPs3MzD4zM7M+aLJSPz18Hj4d0bU8209FPvIQAz8uNpc+JpHxPUx/sD41jgk/AACAPs3MzD4zM7M+00lhP7WuwD3PCtQ8qVRCPq3oBT9RBJM+OygePhAQuT7T2/c+AACAPs3MzD4zM7M+IR4FPxWssz5PLwQ+JbYtPucqBD8ez6A+6D6VPVBnjD57JCc/AACAPs3MzD4zM7M+SZLkPjTWxz4FLyc+ZGHsPagb8T7/y9M+yYHbPKnlXz6IKkE/bts2PqiDuj6hDuo+RANoP6tyOz0WWUQ9jJAOPvnQ9j7B5sE+TJjBPctonD6RmBk/bts2PqiDuj6hDuo+YABmPwhaSj38n1U9Q30NPsWb+T6apb8+CdnrPQoboj5adxE/bts2PqiDuj6hDuo+pub8PnSStT7NDRs+vN37PYc38z4K0c0+YMhlPbIRgj6hmjA/bts2PqiDuj6hDuo+5h20PqHtyz7y6H8+4RPlPY2/7T57+9g+0wsCPEIMuD1I9mY/bts2PqiDuj6hDuo+/gwwP0yojz677QE9mUMOPnzN6z64EM0+Q3BNPZH3gj4zrTE/bts2PqiDuj6hDuo+OqxIP3zxNT53dh091JwLPmQf9D4zEsY+XZWmPf2slD7W1iA/bts2PqiDuj6hDuo+BYHGPp2mxD67sGk+sR30PYrN7T4KK9U+krHlPK20IT5IZVA/bts2PqiDuj6hDuo+l07IPi85yj508Fo+gWfoPVtH7z7EntY+lY2ePFXdKz4+FFA/bts2PqiDuj6hDuo+pZdGP711Pj63rhw9fmkOPuM58T5fkcc+S9ycPfkfkj56VCM/bts2PqiDuj6hDuo+BhxXPwGS6j2hGzk9sqMMPs0f9z5ajsI++s3SPfs/nT5DBhc/bts2PqiDuj6hDuo+iTndPklavj5c2Eg+cMT3PYVa8D5ftNE+d6o4Pel/XT5eFT0/bts2PqiDuj6hDuo+0XzYPtaz1D6yniU+UmvbPWyD+z6/oc0+d77OPPP7bD4PSz4/H4UrPqabxD7LoeU+nzNmPx0CUT34w0s94FwEPs7CAD/0S7w+0ra1PRf8pD4ayxY/H4UrPqabxD7LoeU+bg9kP217YT20jV09iE4DPhQpAj+UBro+F2TdPaUBqz6r0g4/H4UrPqabxD7LoeU+WKnwPpYswj4iVBo+sczpPTS4/T6g1Mc+rSJYPUd9iT4yvy0/H4UrPqabxD7LoeU+mcupPlsK2D4YVHw+f7XUPagW+D75u9I+8hn3OzuAxD3FgWU/H4UrPqabxD7LoeU+3OYpP3DNmz68JgM9qkkEPh1p9j4Ocsc+pylBPZ5iij4XvC4/H4UrPqabxD7LoeU+4ANEP4y4Rz7T3yA9xqcBPubG/j43ZcA+rXGcPTvpnD4t/R0/H4UrPqabxD7LoeU+yZ27PqLf0D4qBWc+9b3iPas4+D7YF88+X1HZPL7uKz7GOU4/H4UrPqabxD7LoeU+qDK9PkSn1j4oTFg+KcTXPR+m+T7XaNA+INiVPBeINj45r00/H4UrPqabxD7LoeU+MMpBP4TcUD7t6h89IlMEPu3i+z6C88E+H1aTPVY+mj4RdiA/H4UrPqabxD7LoeU+NqtTPy6yAT7vgz49KY8CPtnnAD+66Lw+aOrFPV7ppT4EThQ/H4UrPqabxD7LoeU+TK/RPhfCyj46HUc+cBHmPQPQ+j6hq8s+rBguPS6saj5qczo/H4UrPqabxD7LoeU+VwYKP9nxvz7mBbA99lUwPtULDz9bvYk+iz1PPdQdqD49/R4/w/WIPj813j7+1Jg+e8dwPzu2Gj0ypLE8Ik9PPm+4Dj8kz3U+MJghPvipzz7wid8+w/WIPj813j7+1Jg+5XdvP1mOJz2o5sE8SFZNPmwMED8JeHI+2do/Pl3A0T43Us4+w/WIPj813j7+1Jg+FC4WPz+Bqz5liqA9d0o6PicSDz93toQ+OpbNPdoauT7Mvwk/w/WIPj813j7+1Jg+t6nnPr+Z0D4VeQ8+cAIsPoX6DT+/CY4+t5CJPI3WGj7X/VQ/w/WIPj813j7+1Jg+b2Q+P1kedz6v/nQ8ckZRPpHvCT+kfYM+srS4PZBLuz6iQws/w/WIPj813j7+1Jg+eQpVP5meGT4XvJE8YQ9MPnXjDT/KYnw+yhkOPt26yT4+OO8+w/WIPj813j7+1Jg+s276Ps1PxT7/ggA+aig2Pg4gDT+vq4o+T95hPbLtfD6vpjI/w/WIPj813j7+1Jg+K9f6Pn9nyT5XBe89wPwtPnd3Dj+yEow+ilIcPS7Dhj5A2TI/w/WIPj813j7+1Jg+nTBTP0UVIT4vQpE8JU1QPkRODD/MeX4+stUGPsPKxz5kyvQ+w/WIPj813j7+1Jg+my1iP78nxD2wrak80sJMPv0SDz878XY+UmguPkLwzj6V29k+w/WIPj813j7+1Jg++gIIP9gmuj7UTNc9OB04PtELDj/B2Yc+IEirPZVkoz6x5Bg/w/WIPj813j7+1Jg+CF7sPjbGzT6Ftws+lagAPoesAj+nUro+kHgAPcF7gj6WujY/88ZIPhvsyz5ssM8+WzZqP7hrPD2cLiA9ORMaPhrOBD8vWqk+kxnbPVVDsD4jeww/88ZIPhvsyz5ssM8+G2BoP0WSSz0EbC49+8YYPjYwBj8XPKc+go0EPuJwtT4uJAQ/88ZIPhvsyz5ssM8+s28CP9h/uj6DQQE+lsEIPqZ/Az/qn7Q+BJWEPX91lT6gsiQ/88ZIPhvsyz5ssM8+VIa9Pvuq1T5inVk+cOP5PUofAT+QSL8+I1cdPMW63T1L02E/88ZIPhvsyz5ssM8+bFcxP3sYkD7KitM85W4aPpTi/j765bM+L0ttPb2hlj5v2iU/88ZIPhvsyz5ssM8+VlFKP7WnNj7DSwA94yIXPh6TAz9SSK0+bq69PTSSqD4YARQ/88ZIPhvsyz5ssM8+vfLPPp4hzT5L10U+dPAEPm/zAD/noLs+JjYIPe/4Pj5ivkc/88ZIPhvsyz5ssM8+xz3RPmpY0j6e0zg+uUb9PXPUAT9rBb0+PQG8PELsSj7mZEc/88ZIPhvsyz5ssM8+VThIP280Pz7yUf88p0EaPtMWAj+Hsa4+hPyyPR4Hpj7gnBY/88ZIPhvsyz5ssM8+8xhZP2S76z0G+hY9AgkYPqMBBT85+Kk+PQ/uPXbTsD5e1Ak/88ZIPhvsyz5ssM8+w0DmPmpHxT6k7yg+h70GPjEnAj/bUrg+k2JXPcKfgD72OTI/88ZIPhvsyz5ssM8+juO4PhiG4T6zLEs+YpSpPSlT8T6/R+Q+jciVPD8nVT7sB0Y/uB4FPqRwvT4AAAA/BqBeP9Hwej1rh409N4DOPUhk+T6q+9I+vSCIPSNxmT5XQyI/uB4FPqRwvT4AAAA/yfFbP1L8hj1kdZk9pPPMPTY5/D7hidA+fDKnPU1VoD4K7xo/uB4FPqRwvT4AAAA/4PDPPglK0D4tij8+jz21Pa4t9D7ugt4+QM0ePSHTej5kXjc/uB4FPqRwvT4AAAA/b2SMPhDE3T6B15U+BQykPW6J7T6Rc+k+prOuO9p5rD1dE2k/uB4FPqRwvT4AAAA/zjwcP9PesT6BPC09KbPNPSjX7T4OvN4+H7QNPaQRfD5VIDg/uB4FPqRwvT4AAAA/5y44P+D7aD4XIlk9O+7JPZlP9j7YNNc+KOtoPaQDkT587yg/uB4FPqRwvT4AAAA/C76cPiik2D7NnYo+3EevPQU57j4E9eU+dBucPIlUGT4CylQ/uB4FPqRwvT4AAAA/moiePklM3z4dK4I+mJCmPb5C7z4cGec+jwhXPCmZIj6T/VM/uB4FPqRwvT4AAAA/0r01P24tcz4hbVc9DBjOPQWG8z7489g+jeBaPWM8jj7FMys/uB4FPqRwvT4AAAA/b2tJPyg4GT40NII9HpXLPTeL+T6Cj9M+VrCUPb6+mj6WCiA/uB4FPqRwvT4AAAA/BaCxPhE81T7UR3I+1RWyPYEG8T4JdOI+jpD9PDAqVD7wCEM/uB4FPqRwvT4AAAA/AAAAPwtZyD7Tm949cPkWPp7YCT8N0qA+OY4jPVVVlT5yHCs/H4VrPj0K1z4zM7M+zMZtP+71Kz2hOu88OiIzPrbNCj9305A+7ZQFPqA2wT7q/vs+H4VrPj0K1z4zM7M+yDhsPy0IOj1SawI9AoMxPvYoDD+S7I4+2iUgPowQxT6H3Oo+H4VrPj0K1z4zM7M+MkgMP5NPtD4kgMw9MvwfPpNKCj/BbJs+qqalPaPepz7ZWxc/H4VrPj0K1z4zM7M+hjPSPs8I1T5XhzE+t/MSPomFCD8Te6U+1y5QPDreAz62x1s/H4VrPj0K1z4zM7M+9NI3P39Fhj59SaE8fT80PnK3BT9ccZo+IoGUPR99qT5MsRg/H4VrPj0K1z4zM7M+nshPP9KiKD6i1cE8cggwPtTDCT8gdJQ+mhHpPaEzuj78wwU/H4VrPj0K1z4zM7M+FenkPoD+yj7WMCA+H/8bPhUHCD9H8qE+UcwvPQ+SXT63nj0/H4VrPj0K1z4zM7M+gb7lPvKezz4ZRRU+6MkUPl4gCT9RWqM+fubyPEKvaz77fD0/H4VrPj0K1z4zM7M+h8xNP9asMD5qCME8bbIzPm07CD/vr5U+h4XcPUjjtz6rfQg/H4VrPj0K1z4zM7M+ANddPwqL2D3i8+I8C9gwPhAUCz/aa5E+cq0QPh02wT4pc/Y+H4VrPj0K1z4zM7M+KPn6PjBOwT5QcQc+teEdPvcYCT833Z4+fTuIPVtFkj7j1SU/H4VrPj0K1z4zM7M+8fDQPicC2T7RGSw+HDrPPXAZ+z4JGNE+1C7BPP4Uaj5KcT8/jGAiPhnBxD6hDuo+1qlkP/V2Wz2t61k9rHj6PYHIAD/U0L8+CduqPXz7oz7hphg/jGAiPhnBxD6hDuo+7GhiP2ehbD3fz2w9x3r4PbgvAj/egb0+b3/QPfc9qj4X0RA/jGAiPhnBxD6hDuo+Te3oPsmpxj7T0SA+LvDcPXFz/T6EUMs+vX5KPaMqiD7DQi8/jGAiPhnBxD6hDuo+UMyiPqT22j4NPYI+L9HIPT6X9z53NNY+FgjmO8xewT0WCGY/jGAiPhnBxD6hDuo+N5kmP9h+oT7SdQo9PDr6PVda9j4aF8s+s+c0PcQAiT4jMTA/jGAiPhnBxD6hDuo+60dBP7AtUD6Myio91kb1PTG//j4a78M+GeySPSXGmz5rvx8/jGAiPhnBxD6hDuo+dUy0Pswv1D5+B28+QizWPfXY9z77m9I+p9jKPEqlKT7oP08/jGAiPhnBxD6hDuo+BOa1Pngn2j4I5V8+qrzLPWQw+T5x4NM+Vc+LPBkIND5/n04/jGAiPhnBxD6hDuo+ef4+P72ZWT59sSk9AFn6PcLg+z7+iMU+uU+KPecPmT4WLiI/jGAiPhnBxD6hDuo+aWhRP96iBz797Uo9jAf3Pa7pAD/BasA+jDO6PdEApT4mORY/jGAiPhnBxD6hDuo+SRrKPnuVzj55oE4+SVzZPdd8+j4WLM8+Gt8iPYETaD4uzTs/jGAiPhnBxD6hDuo+lZsKP+hsxz68b409zJ82Ph1GGT+/R2Q+mJRpPW0KxD6AYQ8/KVyPPtej8D4AAIA+ooJxPyiNID1skY48hm5VPh0FGD8FfUo+1VwuPmrT5z4s/sA+KVyPPtej8D4AAIA+z0NwP0HuLT2SqZs8eThTPqlNGT/ikEc+D35NPmRv6D6V0bA+KVyPPtej8D4AAIA+ccsWP3Aqsj65+oA914pAPif9GD+MgFs+Oi3jPSmf0z6JlfM+KVyPPtej8D4AAIA+A+7qPrvc2j4I1eg9AnsyPuZqGD9n2Ws+hvmjPDPzPj5nI0s/KVyPPtej8D4AAIA+e2A9P1xOfj6N+0I8s1hYPuqHEz+kh1k+JVbMPfJe1j6Fi/Y+KVyPPtej8D4AAIA+a7FUP/+sHj5G1Wg8oGNSPvRZFz+PNFA+VGoaPivM4j6r/s8+KVyPPtej8D4AAIA+1mj9Pu+Qzj7qGNA9lsY8PixQFz+7+GU+3PKBPXKNlj7reiQ/KVyPPtej8D4AAIA+Hk39Pu5q0j7RH8E9dGA0PjfPGD+vYmg+IcozPTRboD7ElSQ/KVyPPtej8D4AAIA+H8pSP1ZXJj7eAmg8VuZWPlHCFT9kEFI+QOMSPtou4T6FX9U+KVyPPtej8D4AAIA+cl1iP04cyz2V4Ic8ldhSPolsGD9IdUs+q787Pgd65j4jprs+KVyPPtej8D4AAIA+BCsJPw47wj6su609pI8+PoIbGD9VAmE+FhfAPXOVvT5kMgk/KVyPPtej8D4AAIA+L6EdP47juD4vob08l295PquqKj99y7c9U5vaPbKSFT/GM54+XI/CPrgeBT/NzMw9SVF2P9R9BT0Ebas7BCKOPscPJT+3+Z49xAWGPkhEET9W4y4+XI/CPrgeBT/NzMw9DXt1Px7fED1sgLs7CHWMPvA2Jj9jdJw9AMWYPg/fDD/E+Ro+XI/CPrgeBT/NzMw9ATApP0j2oj5om6o8xmCCPjjoKD8sO6898SRBPv6sEj8YJ3Q+XI/CPrgeBT/NzMw9KrMLP14y1D5vOiM921B1PvfIKj+QFr89nftJPTfAvz4rgBM/XI/CPrgeBT/NzMw9DD9IP4s3Wz5qEXM7A3SRPpG4IT9ra6w9kzwvPpjfFT8MRXk+XI/CPrgeBT/NzMw9uj5dP/KOBj58xI47H8GMPmoYJT8zOKQ96HZ0PmZbEj+CG0I+XI/CPrgeBT/NzMw9+2YUP3g8xT6SrA89+t+APgZtKD/lF7k98+oDPncw+T4Q2sQ+XI/CPrgeBT/NzMw9968TPwoIyD44wAQ9LjV3Pg27Kj85vbs9bvG3PUu/BT8OhcY+XI/CPrgeBT/NzMw9pJJbP7pBDT6Zdo47GMyPPhZjIz/vtqU9YxZrPhPnEj9STUk+XI/CPrgeBT/NzMw9FV9pP/C0qj2AJqU7MpeMPki2JT/z8J89Y5eOPiGzDj+2BCg+XI/CPrgeBT/NzMw9dqYdP5P8tT4ZaOs8J5eBPqunKD8MZrQ9unwtPiWWCz9ZFZI+XI/CPrgeBT/NzMw9AcEQP3+6wj71G149UqBJPnk4Hj/IfT0+Mq6LPYE42z757QA/E/2dPkz09z5CHVQ+IC5zP88mFz3H3Fc8V/FpPt/LGz8t3yY+oM9GPpYl9z6acqU+E/2dPkz09z5CHVQ+GRNyPxnZIz1K1Ws8EWxnPrwLHT//ZCQ+FUBoPmSf9T6SQJY+E/2dPkz09z5CHVQ+x8ocP081rT4TqUk9tw9UPjeLHT9twzU+MNcEPmhm5z4ALtY+E/2dPkz09z5CHVQ+3934PvTF2D60cLk9XWdFPjWeHT/RH0Q+/07PPNC3YT6UF0E/E/2dPkz09z5CHVQ+ahBBPxlncj7PcxU8X8ptPrKcFz/awjM+LXjvPW/l6j6FPNk+E/2dPkz09z5CHVQ+K6BXP9JnFj48eDE8WupmPnBRGz/lzys+kWgxPu6g8z7JqrM+E/2dPkz09z5CHVQ+jZMFP4Gcyz6Q8aQ9yGVQPnIuHD9y4D4+0zGePZ9cqz52ixY/E/2dPkz09z5CHVQ+QVUFP1Iezz6t3Jg9hFZHPt/kHT8AFkE+eTpbPf/Rtj5Z4xY/E/2dPkz09z5CHVQ+dsxVP0y/HT6i7TA8xuBrPhyxGT/LWi0+FDopPkmQ8j6t0rg+E/2dPkz09z5CHVQ+IchkP/fuvz0igE48rzFnPqpEHD+puyc+9WZVPvTv9D6RXKA+E/2dPkz09z5CHVQ+Ib0PP4BNvj7z4Ig96CJSPvbTHD8/jTo+sOHjPVlJ0j47vvQ+E/2dPkz09z5CHVQ+FsTkPiyIyT59ZyM+D9XtPU9w9D5tGtA+hxTfPOBGZT6ktT8/7FE4PqRwvT5mZuY+TjFoPxAGPT0M5T89VU8PPpf/+T6/WL4+reTDPRt5nz7dxhc/7FE4PqRwvT5mZuY+NjJmPzcRTD1wy1A9TjUOPi/K/D4qG7w+nnLuPXIkpT5znw8/7FE4PqRwvT5mZuY+Yh39Pn4ctz5AjBc+11X9PUOA9j5HKso+nRlpPfvzhD5p9C4/7FE4PqRwvT5mZuY+TqC0PnsQzj5tnno+Io3mPSsa8T6MQtU+NMMEPCtTvT2OQmY/7FE4PqRwvT5mZuY+Kc4vPxGNkD6/af081xoPPkUB7z5Qcck+H2xQPebhhT5LCDA/7FE4PqRwvT5mZuY+7JRIP1w/Nz7Vsxk9AWAMPtFT9z4vfMI+qbGoPRu1lz49Dx8/7FE4PqRwvT5mZuY+TPzGPoyhxj5RxGQ+nKT1PXUd8T5jedE+yN/pPITnJT4hN08/7FE4PqRwvT5mZuY+UrXIPnIszD55PFY+Wd7pPVKf8j4Y6dI+7WuhPOROMD7o4E4/7FE4PqRwvT5mZuY+I31GP+nPPz4y7hg9sjQPPppr9D4N+sM+A+SePQ8llT74kCE/7FE4PqRwvT5mZuY+QiZXPyZn7D2VzTQ91GANPhFR+j6F/r4+90DVPTZKoD7GMhU/7FE4PqRwvT5mZuY+gJ3dPookwD7re0Q+lUT5PTOn8z6oB84+pZo7PWG9Yj79ljs/7FE4PqRwvT5mZuY+o4sOP9FFtz6ji649jC46PumiCz/poos+vAlaPU2Hoz6+myA/KVyPPj0K1z6amZk+R61xPweSDz0dM6s8k5haPngiCz+L3Xg+C74pPpGsyT5pdOE+KVyPPj0K1z6amZk+8m9wP/iJGz3M7bo8hpNYPtV3DD8kjXU+b09JPhJ7yz433c8+KVyPPj0K1z6amZk+4JEaP6Uyoz5qpp4985xEPpeaCz9YfIY+sB3YPcnmsz7lCAs/KVyPPj0K1z6amZk+T2XwPiQhyD4a8w4+J541PtqYCj85/48+HfuPPITUFT4GC1Y/KVyPPj0K1z6amZk+owpCP5HZaD4Svm88Hn9cPnZdBj+FBYU+l0fCPR0jtj5+pQw/KVyPPj0K1z6amZk+hqJXP6/BDz7RoY08KSxXPj9TCj/dhn8+51EVPn/7wz6OW/E+KVyPPj0K1z6amZk+X6IBP+DbvD6Lff89kDpAPnqwCT/EgYw+id5sPUg7dT5F4zM/KVyPPj0K1z6amZk+J+EBP53TwD5PqO09TLQ3PnwSCz/jAI4+5CYkPV3Vgj7jUjQ/KVyPPj0K1z6amZk+P+FVPxbTFj5jP408OI5bPgK6CD/fxIA+8rQNPkAhwj5GBPc+KVyPPj0K1z6amZk+qQNkP1LTtj2gPaQ8ZvFXPlaACz9BDXo+ihg3PpDayD4rmds+KVyPPj0K1z6amZk+EHQMP5q5sT4aedU9yk1CPnKYCj82qIk+/+SzPcSonj7+Lho/KVyPPj0K1z6amZk+74X3Podzwz4UDQo+0gsKPmhY/j6vobw+C0EJPczifD48Mzg/wJNVPhnBxD4HddA+tr1rP4sELD0dIBg9dB8lPkAYAT/GP6s+DNTpPT6fqj7fdQ0/wJNVPhnBxD4HddA+9wRqP1TzOT08vSU9eMcjPhd6Aj8VKKk+5VMNPkh3rz5j7wQ/wJNVPhnBxD4HddA+CwMIP+pjsD4CWP491a4SPjnc/z5dzLY+6ZCNPbe/kD4I7iU/wJNVPhnBxD4HddA+3qrHPnQszD5cUVg+9w4GPhFS+z5zpsE+FlwnPMTr1T0XpWI/wJNVPhnBxD4HddA+MWE2P0xphj4cRc08GF4lPkiO9z6swrU+6n99PSj1kT5tLSc/wJNVPhnBxD4HddA+qRlOPyLFKD7eofY8kvghPjDL/z6HOK8+J33KPdQ4oz7xExU/wJNVPhnBxD4HddA+HHjaPgB5wz7IHUQ+yJAOPqjc+j702r0+yh4RPbKLOD4ny0g/wJNVPhnBxD4HddA+duHbPlB9yD51Qjc+huAHPjSz/D6JXL8+M4TIPAhORD5cqEg/wJNVPhnBxD4HddA+eB9MP93OMD4WmvU8MT8lPjrN/D4tk7A+TBi/PWPHoD5FuRc/wJNVPhnBxD4HddA+k+hbP06V2D05TBA9G/YiPltPAT895qs+g+79PTUUqz4VuAo/wJNVPhnBxD4HddA+NCPxPkRluz4S7yY+HIIQPmM4/T6Phro+mchlPbLteD4KaDM/wJNVPhnBxD4HddA+nX/sPu9Uzz7nVgg+7VsBPnhOBD8atbY+ZIoCPdKDhT5xFTU/cT1KPhfZzj4xCMw+/1xqPyndPT3rUhw9CscaPoNYBj9266U+9pHdPfh/sz7FjQo/cT1KPhfZzj4xCMw+BYpoP5IkTT0jOyo9wHMZPta5Bz9z0qM+ue0FPv+buD6SNgI/cT1KPhfZzj4xCMw+noICP8Xpuz7+Q/w9sHUJPgYaBT8bEbE+1nGGPf+emD5G4iI/cT1KPhfZzj4xCMw+e/e9PuSq1z5Cu1Q+A1L7PcHFAj/9n7s+77ggPFkV5D1x+mA/cT1KPhfZzj4xCMw+6RoxP4/pkD75Cc48UD0bPogBAT9IXrA+jqZwPWjVmT7jCiQ/cT1KPhfZzj4xCMw+rjhKPxXZNz6VIfo8/tsXPoYhBT/1zqk+Pvu/PavPqz7DGBI/cT1KPhfZzj4xCMw+oFvQPu/5zj7iVEE+j60FPpGTAj8XArg+dbQKPdrUQz6CX0Y/cT1KPhfZzj4xCMw+l5LRPsMn1D5MizQ+1bH+PeF4Az/JYbk+fWy/PMAPUD6sAEY/cT1KPhfZzj4xCMw+vBxIPwhxQD464Pg86wIbPmqkAz+3Nas+ljW1PaREqT77thQ/cT1KPhfZzj4xCMw+vB5ZP8No7T26QhM9ZbsYPnyNBj9Wh6Y+663wPXQGtD4J5wc/cT1KPhfZzj4xCMw+/5HmPovvxj7s/CQ+e3YHPq3EAz9pu7Q+kMNaPcOOgz5mjDA/cT1KPhfZzj4xCMw+D1wQPx/UvD4Pz4k9nBxEPmKjFT/cVWU+rmd7PQ/Uvz5+XxA/7FGYPrBy6D7Jdn4+kaVyP2SmEj0VAYY8va9kPsYVFD8t+Uo+kJI6PiKF4T6WMcE+7FGYPrBy6D7Jdn4+FH5xP0XvHj3tXpI8F2JiPvFgFT8mGkg+7W1bPqql4T5go7A+7FGYPrBy6D7Jdn4+u18cP1H4pz7GQXo9CZ5OPlNBFT+rXFw+uc/zPRR7zj7+kPQ+7FGYPrBy6D7Jdn4+N032Pmyb0D51XeQ9k7I/Pm3UFD+4+2w+LfWvPDdJOj4J7ks/7FGYPrBy6D7Jdn4+seZBP+u4bD4VxTo8LqZnPtycDz9j5lk+Z4DbPUZb0T6gxPc+7FGYPrBy6D7Jdn4+Ye5XP0R0Ej5xI108wHRhPgF0Ez8+u1A+oWclPjPd3D78btA+7FGYPrBy6D7Jdn4+SW0EPyZHxD4jecs94ZZKPmyhEz9v42Y+cXOLPaHhkj7BICU/7FGYPrBy6D7Jdn4+UWYEP2P7xz7w37w9wrdBPiUzFT+qe2k+gk1BPT++nD4IjCU/7FGYPrBy6D7Jdn4+VyVWP36iGT5lglw83C1mPvDUET9mflI+RmgdPjRi2z6p6dU+7FGYPrBy6D7Jdn4+katkPx+Juj1jaYA8KPdhPtiCFD95/Us+NrNIPir93z47qbs+7FGYPrBy6D7Jdn4+z98OP5Tttz43S6k9qX9MPpFmFD8U5mE+GCbOPdL4uD7Uvgk/7FGYPrBy6D7Jdn4+TsH9PqE3yT5EHOQ9D1gUPls8CT9DW6M+2VcfPUtpkz7dVSw/RX9nPowp1j7SFrY+GWltP3X3LT317fY81S8wPl1TCj9cQZM+WcECPlagvz7+/v4+RX9nPowp1j7SFrY+ltNrP0ItPD1kmQY94JkuPl6vCz9UVJE+6eocPrSkwz7X5e0+RX9nPowp1j7SFrY+GSoLP3E9tT5zudE9zT8dPli5CT9p7Z0+SbihPaINpj4mwhg/RX9nPowp1j7SFrY+I9fPPm1t1T7gdjU+mlsQPpviBz/9DKg+OvtJPL+hAT6jb1w/RX9nPowp1j7SFrY+PxE3P7l8hz6NDKY80DcxPh01BT/d+Zw+CfOQPYKepz5eEho/RX9nPowp1j7SFrY+uSpPP+pbKj6Xycc8AxstPvpDCT+L6pY+7PLjPRGFuD4aPwc/RX9nPowp1j7SFrY+kYbiPjSJyz504CM+GkgZPo1tBz/ZgKQ+hAcrPTNpWj47tT4/RX9nPowp1j7SFrY+o2fjPoM50D60vRg+gS0SPnaACD9U6KU+AkbsPFZJaD56iz4/RX9nPowp1j7SFrY+4CpNP2B2Mj738MY8TLUwPuy8Bz+CK5g+OZ3XPWUstj4n9gk/RX9nPowp1j7SFrY+v1JdP13l2j2jEuo88+wtPpuXCj9R2pM+waoNPmmxvz43efk+RX9nPowp1j7SFrY+/J74PrQGwj6htAo+EigbPlCDCD9WZaE+8tKEPVh/kD72JSc/RX9nPowp1j7SFrY+/rSFPrSu9j5NnIM+O7ZUPbXs5D5CPgA/eEYuPPaOOz4pY04/nu+nPWq8tD7XoxA/RvpMP8C7rj0Scuk9vguDPQVh7z4M3O8+p3okPd01jD5nnS8/nu+nPWq8tD7XoxA/2DZJP0LIuj3+gPs9CSSCPf898j7/OO0+GvZLPXfqkz5jSyk/nu+nPWq8tD7XoxA/eUmZPhw96D7V8nw+wjRkPfaD6D5y9fo+nKi7PLEoYD6PGEI/nu+nPWq8tD7XoxA/eClBPoTA5j7Aqrg+KjtNPTC94D61zQI/MxpGO5vokz3SvGw/nu+nPWq8tD7XoxA/jfUAP7oP3j6tFIA9Lf6BPcJW4z6zKfw+HymnPH3gYD6YjkI/nu+nPWq8tD7XoxA/lfkeP+sUmD6s36c9a7t/Pfzn6z6XIPQ+ba8LPV6Kgz7afzU/nu+nPWq8tD7XoxA/oQtbPgH25D4vhK0+C+9bPQAO4j4POgE/ov0zPOOyBT5Rw1s/nu+nPWq8tD7XoxA/DotePj0O7T48rKM+caFQPSCk4j7ZowE/YJ/3O2OaDT4pqlo/nu+nPWq8tD7XoxA/UjkcP6AVnj7v3qU9hIKCPfg/6T5nH/Y+tu4CPbCxgD49eDc/nu+nPWq8tD7XoxA/kbgyP62hTT4b+M49thuBPcBd7z5SW/A+FkM0PcvgjT5pyy0/nu+nPWq8tD7XoxA/3Z59PndB5j4b75o+xtFfPeUW5T7i7v4+9VqUPCHBOz7gbEw/nu+nPWq8tD7XoxA/BhXhPi2Z1T6aoxI+EpDtPQqCAz/nl70+R3bqPJ7KgT7/xjc/NV46PgRWzj7hetQ+UVJoP7K7Sz0+Hy89BZgOPpX6BT/Tvqw++IzJPbK/sD6Ibg4/NV46PgRWzj7hetQ+m1dmP//2Wz1Yjz49YmINPsRdBz9Hk6o+OGr0PbVYtj5eRgY/NV46PgRWzj7hetQ+j3j5Plppwj4uPAg+X7b8PQRxBD9h8Lc+3tFyPQ4xlT5bOiY/NV46PgRWzj7hetQ+UOqyPsXf2z7Va2I+JZzmPaPkAT+xj8I+jA0PPJXA2z23S2I/NV46PgRWzj7hetQ+coMsPzLMmD6gzuI8fOUOPgKLAD8/d7c+QypZPT9Flj68Sic/NV46PgRWzj7hetQ+XX5GP8lXQz4Suwo9GtQLPsWxBD9psrA+YDmuPZXHqD4J1RU/NV46PgRWzj7hetQ+FfTEPsTI0z5Phk4+nYv1PbzQAT+g+74+7HH4PJHZPT4Mxkg/NV46PgRWzj7hetQ+8j/GPu8+2T4+AkE+tMfpPSGhAj/SS8A+jlCrPAKQST57QUg/NV46PgRWzj7hetQ+N0tEP8RWTD6J8Qk9Qr8OPrs5Az/oLLI+pU+kPYAkpj7LYxg/NV46PgRWzj7hetQ+bxJWP/hh/T0cFSQ9QK4MPmgoBj8QWK0+YC/bPU54sT7t3Qs/NV46PgRWzj7hetQ+pvbaPtyAzD79EDE+Ke34PeINAz/yqLs+NOxEPcAwgD7dmDM/NV46PgRWzj7hetQ++kGlPkhC6z59914+eKyPPfGe7j7xde0+KGB3PF9tTT4ox0g/RnPiPeAMvD4nqwU/A/1YPxy6jj3QXak9U7WvPd2o9z7Oadw+Ke9jPUPtlT5syiY/RnPiPeAMvD4nqwU/4u9VP6E8mT1NRLc9F2quPa2B+j7N49k+JXuMPfs4nT4e1B8/RnPiPeAMvD4nqwU/jDy7Phbj2j67wFM+JsSZPQfH8T7wx+c+5uIDPUUecz5A+jo/RnPiPeAMvD4nqwU/9oJ2PlA64z41hKE+bNyKPeep6j7+nvI+JQePO5TMpD1fSGo/RnPiPeAMvD4nqwU/bVUSP1Ruwj6KNkc9UM+uPVfl6z7VZug+cjPrPHcldD4HnTs/RnPiPeAMvD4nqwU/v2UvP4d4gT7i3309IrGrPSdr9D6RqOA+aHtCPa5QjT7zLy0/RnPiPeAMvD4nqwU/lGuKPqJI3z7KS5Y+komUPU+b6z5MQu8+Wo2APMpcEz5jJFc/RnPiPeAMvD4nqwU/zjKMPqV35j6NVY0+1wyNPbN27D4XRvA+0vUwPKwqHD5+MVY/RnPiPeAMvD4nqwU/aNAsPxXvhj7SgHs9Z0CvPQmu8T7dgeI+qJY2PbV6ij47WS8/RnPiPeAMvD4nqwU/78RBPzIHLD4hypk9EC6tPfy+9z6A9dw+TEp5PZFllz6TuCQ/RnPiPeAMvD4nqwU/RhqePtKC3T7oYoQ+Gv+WPT+C7j76ves+x+DRPPnzTD78M0Y/RnPiPeAMvD4nqwU/bh78PpH60j4GnMM9aHQWPk7jEj8w/44+lX4sPbhnqD47BCE/aJFtPp7v5z6uR6E+U9VtP7bqNz0/gNU8398xPitgEz+6T4A+EUYJPtNO1D4kDuc+aJFtPp7v5z6uR6E+A0psP8b5Rj0SzOg8NyEwPtyzFD9aD30+BuEjPhCg1z5tb9Y+aJFtPp7v5z6uR6E+FmUKPzs1vj5fArQ9MzwfPpMtEz/ABoo+oLusPSgsuz540gw/aJFtPp7v5z6uR6E+RBfQPkuB4T7izhw+VqQSPsGrET9UVpM+NyxjPGbdGT72+1U/aJFtPp7v5z6uR6E+zus0Pz5OjT5poo08XpYzPp90Dj+TS4k+mOiaPZMLvT4jHQ4/aJFtPp7v5z6uR6E+jfVNPxW8Mj63bas8IfouPr5sEj90qYM+m43wPXx+zT4eXvY+aJFtPp7v5z6uR6E+/IHiPifH1j65bQ0+mpIbPjYOET9GGpA+Gvw7PdxXfT5H6jQ/aJFtPp7v5z6uR6E+H+/iPr9J2z5GjgM+WmIUPh46Ej+YWpE+rLoBPV6Yhj4mmDQ/aJFtPp7v5z6uR6E+PuFLPwMnOz43oKo8KL0yPovkED9W2IQ+VfLjPS8/yz48xPs+aJFtPp7v5z6uR6E+o+FcPx6L5j0nn8k8FZwvPsesEz9o2IA+gn8UPisN1D4Us+E+aJFtPp7v5z6uR6E+gwX4Pu9DzD442u49M04dPkoPEj9TOo0+oGePPVOjpD5iwRs/aJFtPp7v5z6uR6E+d88UP6Y/wT5mCyk9m61YPuUjJD/RwhY+R3yjPbiw9z42cN8+5/upPpzEAD/D9Sg+F1R0P1iaEj39kCA8iMd5PjGUID+15wM+gA5dPqajBD9zMYg+5/upPpzEAD/D9Sg+QlJzPyj8Hj3+fi88l/d2PpPJIT8f4gE+2wGAPruvAj9cPXU+5/upPpzEAD/D9Sg+KLsgPydoqz5RDBk9G2RjPiAUIz9jSxA+erEXPnQV/z7PEbU+5/upPpzEAD/D9Sg+hV8BP6iR2T41vY49g4FUPvnLIz+bThw+uiICPTbIiD65eTM/5/upPpzEAD/D9Sg+fCBDP9GAbD7cp987S59+PuC3HD81gQ4+yQEJPtC7AT98B7g+5/upPpzEAD/D9Sg+2VdZP6dZEj4/bwQ8Ptx2PgxKID+R+wc++cxGPtfFAz/WDZU+5/upPpzEAD/D9Sg+iWAKP7qeyz6oAX09HPlfPrEJIj8i4Bc+cEu9Pe/xxT6aXQU/5/upPpzEAD/D9Sg+pfAJP5LZzj4aKWo9OmtWPkn0Iz+jwxk+G1eDPSd30z6J2QU/5/upPpzEAD/D9Sg+w41XP/aHGT79DwQ8MTZ8PtGjHj+KOgk+pSw+PliSAz/+xJk+5/upPpzEAD/D9Sg+gkhmP6V/uj1U4hk8S+t2Ph8dIT85oAQ+CZBsPkkOAz9qm4M+5/upPpzEAD/D9Sg+VzgUP5BvvT4Q/lA93JhhPkmIIj/+RRQ+bDwEPkyY6z5+SdI+5/upPpzEAD/D9Sg+JX0FP10wzT5gVZ89OkopPnjLFz/nh3c+zlJQPV/Luj4klRU/nmmFPhNA7z5PVos+SyhwP66QKj061aU8e7JGPvoyFz+cgVw+zT4fPvwy4j6dLc4+nmmFPhNA7z5PVos+Mc1uPyawOD2b+bQ8J6pEPud+GD8+Wlk+75U8Povk4z590L0+nmmFPhNA7z5PVos+5sQRPzQAuD4E2JE91LwyPle6Fz/OWW4+49jMPWrdyz4vdgA/nmmFPhNA7z5PVos+JA/gPtoA3z4E4AE+pkolPqbNFj/Bfn8+0OeOPEfKMT4wFk8/nmmFPhNA7z5PVos+uNg5P/NPhT6b0188FCtJPsSOEj/emWw+Owe4PTFDzj6A3QE/nmmFPhNA7z5PVos+bvZRP5BYJz63bYY8erlDPittFj/ZkWI+vHkMPkVt3D7dVd0+nmmFPhNA7z5PVos+qonyPuA30z7Y+eg9IwgvPgXjFT/La3k+aitmPShyjj41ZCo/nmmFPhNA7z5PVos+VpryPmpO1z4EXdg90h4nPr5BFz802ns+1wcfPWuJlz7NSio/nmmFPhNA7z5PVos+8fpPP9VXLz4244U8SPFHPi3cFD8GnmQ+628FPsmL2j5CvOI+nmmFPhNA7z5PVos+uzZgP6Lu1j0gbp08rT1EPiOQFz/IgV0+68YrPslI4T7C08g+nmmFPhNA7z5PVos+udkDP412xz4BWMM9iMkwPknCFj9WLXQ+wxSsPe5xtT5xxA8/nmmFPhNA7z5PVos+/2K9Po0O2T7mHFM+SWetPYjc5z6myew+yf+VPCuRSD63K0k/AisHPmq8tD4K1wM/pjpfP1psbD2l9I892XfTPf/27z4KK9s+dFyJPeF6kT4BFyY/AisHPmq8tD4K1wM/sZVcPy5nfj3eHpw96PfRPSrK8j7ct9g+t+uoPawzmD6zyB4/AisHPmq8tD4K1wM/p5fUPgoWyD6dpEY+/Wu5PQ656j7z6+Y+ZoQfPYC8bD6a2Do/AisHPmq8tD4K1wM/A4uPPhUM1T7oaJs+/6SnPXcV5D5JAfI+5k+tO+XEoD3EjGo/AisHPmq8tD4K1wM/r3wfP1Kaqj6EYjM9h0jSPT905D6f+eY+rVgOPQHrbT61nzs/AisHPmq8tD4K1wM/9Jo6P0XKXT6xJ189l6/OPS7i7D7scd8+VbRqPcRMiT5Zriw/AisHPmq8tD4K1wM/cDagPgQQ0D6MuY8+TSizPcvI5D4ibe4+GKebPECmDz43OVc/AisHPmq8tD4K1wM/kDaiPh6u1j5RG4c+tkOqPWzN5T6moe8+rYhWPBdsGD7YilY/AisHPmq8tD4K1wM/rD44P++iZz6BiV09oN3SPbsc6j7cK+E+R3RcPYybhj726i4/AisHPmq8tD4K1wM/shFLP8ckET7hKIU933rQPZEc8D64xNs+/ROWPb3Bkj6i3CM/AisHPmq8tD4K1wM/BZO1PkHPzD50O3s+mhq2PduT5z5+5eo+PPX9PLGoRz4qJkY/AisHPmq8tD4K1wM/UgACP5yPwT4Av+k9Xl4ZPrg0BT9g56g+rTAiPSPejD7kbS8/aJFtPgRWzj5I4bo+PQduP0jAIz3Dl/c8QTQ2PuJMBj8bTJg+GtAFPtccuD6OfQI/aJFtPgRWzj5I4bo+in1sPxoqMT1L/QY9+580PnCqBz8iW5Y+maogPqsQvD4ImvM+aJFtPgRWzj5I4bo+MT4OPy7rrT69YdY9Y5giPjOyBT9pT6M+APykPTILnz7n2hs/aJFtPgRWzj5I4bo+YUbVPteczT6QOTo+kjIVPtbZAz8Ls60+7IpLPJ1J9T2hKF4/aJFtPgRWzj5I4bo+LRQ6P+5KgT5yy6g86wk3PuUqAT9AJaI+TOeTPfmSoD6aOR0/aJFtPgRWzj5I4bo+0ktRP0SVIT6c28k8d/gyPnE8BT/jCpw+hhPpPWMhsT7eTAo/aJFtPgRWzj5I4bo+6CroPp7Ywz7z+Cc+HGcePntkAz99A6o+ckctPdK/Tz6UO0E/aJFtPgRWzj5I4bo+6TPpPhZ5yD4Dphw+/xkXPi54BD+kgqs+JZXvPBkiXT7ROkE/aJFtPgRWzj5I4bo+rWBPPxBaKT7qGck8WaA2PiO0Az+NR50+kmbcPefTrj46CQ0/aJFtPgRWzj5I4bo+csdeP/Xbzj3foes8oeAzPmiRBj/f7Jg+K/sQPqwtuD6/VP8+aJFtPgRWzj5I4bo+eoT+Ppx6uj7UAQ4+I2IgPhJ7BD/L2KY+RyaHPdgIij7LFio/aJFtPgRWzj5I4bo+PU3VPoMZ0T6CMjM+8FLTPQyw8T44e9k+/MfAPAp7XD7+2kI/1mwkPuAMvD61vPE+BRxlPyWMTz2Js149rcj/PSdD+D6tysc+3earPUe5mz6Bphw/1mwkPuAMvD61vPE+UeJiPzLQXz25CnI9XNr9PbwR+z6td8U+cAzSPSHhoT7hzRQ/1mwkPuAMvD61vPE+mVrtPtMSvz4pJSc+1WrhPUQS9D4Hk9M+4cBKPZGvgD4p/DI/1mwkPuAMvD61vPE+t/ClPseo0j6CZoc+YKrMPTcr7j4xqt4+9injOx09tD0Ismc/1mwkPuAMvD61vPE+THwpP/oRmz5pqw89nhn/PcQM7T7VLNM+rSM1PZJ6gT588DM/1mwkPuAMvD61vPE+HVlDP6KXRj6vDzA95Vv6PUht9T6/+8s+LJuTPXy2kz5csSM/1mwkPuAMvD61vPE+vbe3PmkSzD60a3g+jlDaPeZ07j739to+cXfJPEAIHz418lE/1mwkPuAMvD61vPE+AYe5PqgD0j6v6mg+mLLPPW/F7z7rTdw+uvGKPEPfKD6hcFE/1mwkPuAMvD61vPE+fCNBP6mwTz6WBS89zG//PdOR8j46ks0+JOOKPQESkT6bGiY/1mwkPuAMvD61vPE+VMRSPyXaAD4vUlA9MUX8PXCD+D5Ea8g++GW7PZu9nD5zNBo/1mwkPuAMvD61vPE+U/DNPtGvxj64v1Y+26jdPdAZ8T75e9c+nY8iPRehWj7ALj8/1mwkPuAMvD61vPE+HprIPuSM3j78sTE+CrjCPQkH/D71StM+pDW0PG8/aT53DkA/hxYZPt0kxj7fT+0+hexiP2ykaD1Bk2g957nrPdF2AT/kI8I+yiegPfcwpD6L4hk/hxYZPt0kxj7fT+0+2otgP2Kuej0DlHw9ItjpPeDeAj84zL8++LXDPemxqj5NMBI/hxYZPt0kxj7fT+0+51XgPgdhzD4ikiY+JbXPPTmE/j5+js0+30k9PYn2hz4eMDA/hxYZPt0kxj7fT+0+jEqbPusa3z6KmoU+MaW8PXBw+D5EZtg+tyPWO01IwD2vSmY/hxYZPt0kxj7fT+0+ga8iP/lzqD4haBE9nXXrPcWd9z7ThM0+sgspPbm/iD5pDzE/hxYZPt0kxj7fT+0+oAw+P+2mWj5NmjQ9fsnmPd4EAD/lQ8Y+n5eJPaLTmz474yA/hxYZPt0kxj7fT+0+mGSsPp622D6UyXU+BEnJPQfQ+D643dQ+uSi9PK37KD7P108/hxYZPt0kxj7fT+0+1vmtPlrg3j6gS2Y+XGm/PdIS+j7YEtY+hFCCPGo+Mz7hHU8/hxYZPt0kxj7fT+0+SrA7P21pZD6yVTM9QpfrPX0w/T6y6cc+MHyBPRwQmT5sSCM/hxYZPt0kxj7fT+0+o8ROP2QODz49fFc9wXXoPVSUAT/pucI+kKKuPZ9NpT7ehBc/hxYZPt0kxj7fT+0+TdLBPvqf0z5yG1U+jU/MPep/+z4zbNE+2RoYPXiCZz60nTw/hxYZPt0kxj7fT+0+6KEEP5sexz5Rdr491YUjPpA0Dz/1048+4KY7PR5WpD6DGiI/7nx/Pne+3z4Sg6A+1WdvPzIRJj0D48Y8uOpAPs1gDz8JyYA+I58UPuYvzj6IgOc+7nx/Pne+3z4Sg6A+5vttP8rDMz2z+9g81xQ/Pk22ED/0EX4+EhcxPhUD0T5icdY+7nx/Pne+3z4Sg6A+POMQP9Sfsj7SZq49pfMsPr9kDz+vvIo+QHu7PYU7tj7Vcg0/7nx/Pne+3z4Sg6A+5J3cPkR11j6w2Rk+TmcfPnUKDj9vN5Q+vVZ2PO6pFT4pvFY/7nx/Pne+3z4Sg6A+C3Y6P4eigj4rFoc8C6JCPqB9Cj+7s4k+0EWoPdM0uD7c3A4/7nx/Pne+3z4Sg6A+GhBSP8iFIz50zqE8zss9PiZ4Dj/MKYQ+OFcCPnDBxz70Evc+7nx/Pne+3z4Sg6A+h0/vPpWMyz7IRwo+vvooPpRUDT952ZA+TO1LPYiGdj6JnzU/7nx/Pne+3z4Sg6A+Cc/vPmTdzz4lpwA+N0khPrCSDj8ENpI+2/UMPcYvgz6/mDU/7nx/Pne+3z4Sg6A+yx5QP9teKz7PL6E8gMhBPizpDD9oSYU+Chz3PYikxT52lPw+7nx/Pne+3z4Sg6A+ReNfP7md0T1xIL08YIA+Pj2zDz9WWYE+F6EgPrbAzT6/7uE+7nx/Pne+3z4Sg6A+/IECPzjUwD5Cn+g93tsqPnhODj8g9Y0+SZ6bPc5CoD7Qahw/7nx/Pne+3z4Sg6A+cEvePqGw1j7fBxY+vlroPTznAj/YGsA+0pDjPJQ0gD4vyTg/W1g2PlJ1zT6AXtc+08JnP4bXTj1H+zQ9F5sLPrV+BT8KNa8+emvEPfRMrz4XzA8/W1g2PlJ1zT6AXtc+RL1lP4BGXz1F5UQ9520KPoTiBj8FBK0+A2ruPTkFtT4jsAc/W1g2PlJ1zT6AXtc+06H2Ppmawz4ohws+mUD3PRjgAz+rb7o+tBZsPR+gkz6Fbic/W1g2PlJ1zT6AXtc+oCywPkNX3D45+GY+c4DhPQ9EAT/GF8U+EmQKPEVb2D0Hy2I/W1g2PlJ1zT6AXtc+vm8rP5WImj79fuk8utkLPhEIAD8BA7o+WBtTPYGqlD4KeSg/W1g2PlJ1zT6AXtc+1JVFP7zkRT7KDw89id8IPtUwBD+RLrM+o6mpPa9Fpz70Jxc/W1g2PlJ1zT6AXtc+ih/CPkNw1D5m4FI+qCrwPY44AT85hME+fdzwPKtQOz7xpEk/W1g2PlJ1zT6AXtc+uHTDPnf62T6hIUU+OKDkPSgDAj+i0cI+fRCmPKvYRj5RGUk/W1g2PlJ1zT6AXtc+211DP/D5Tj6TOg4907oLPia6Aj9KrrQ+qfefPaGdpD46shk/W1g2PlJ1zT6AXtc+G0xVPw14AD4XXik9tbkJPouqBT8Qzq8+1qzVPccSsD4CQQ0/W1g2PlJ1zT6AXtc+RhfYPkRlzT7sBjU+P4LzPRN5Aj9KLb4+8j8/PeVnfT4IsjQ/W1g2PlJ1zT6AXtc+"}}};
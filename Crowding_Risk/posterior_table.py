@@ -0,0 +1,172 @@
+"""
+Precompiled Posterior Table for the Browser Dashboard
+Every evidence pattern, partial ones included, exported once from the
+Python network so the dashboard answers queries by array lookup
+
+For each query variable the table holds P(query | evidence) for every
+combination of the other variables, where each one is either one of its
+values or unobserved. Rows are laid out in mixed radix: variable v has
+len(domain) + 1 codes (the last meaning unobserved), so the row of an
+evidence set is sum(code[v] * stride[v]) and its posterior is the next
+len(query domain) numbers. Probabilities are little-endian float32,
+base64-encoded inside a JSON manifest that is written as posterior_table.js
+(a plain <script> include also works from file:// on kiosk displays).
+
+The manifest carries a fingerprint of the CPTs it was built from;
+ensure_posterior_table() rewrites the file only when the fingerprint no
+longer matches, so rebuilding after a CPT edit is automatic and cheap.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+
+
+TABLE_FORMAT = 'crowding-posterior-table/1'
+QUERY_VARIABLES = ('C', 'P')
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'posterior_table.js')
+SCRIPT_HEADER = "// Generated by posterior_table.py from crowding_risk_bn.py - do not edit\n"
+SCRIPT_PREFIX = "window.POSTERIOR_TABLE = "
+
+
+def cpt_fingerprint(bn):
+    """Hash of the network structure and CPT values"""
+    digest = hashlib.sha1()
+    tensors = bn.get_tensors()
+    for var, parents in bn.parents.items():
+        digest.update(json.dumps([var, parents, bn.domains[var]]).encode('utf-8'))
+        digest.update(np.ascontiguousarray(tensors[var], dtype='<f8').tobytes())
+    return digest.hexdigest()
+
+
+def build_posterior_table(bn, query_vars=QUERY_VARIABLES):
+    """Posterior table manifest (a JSON-ready dict) for the given query variables"""
+    names = list(bn.domains)
+    tables = {}
+    for query_var in query_vars:
+        axes = [var for var in names if var != query_var]
+        table = bn.get_batch_table(query_var)
+        table = np.moveaxis(table, names.index(query_var), -1)
+        total = table.sum(axis=-1, keepdims=True)
+        posteriors = np.divide(table, total, out=np.zeros_like(table), where=total > 0)
+
+        radix = [len(bn.domains[var]) + 1 for var in axes]
+        strides = [int(np.prod(radix[i + 1:], dtype=np.int64)) for i in range(len(radix))]
+        data = np.ascontiguousarray(posteriors, dtype='<f4').tobytes()
+        tables[query_var] = {
+            'axes': axes,
+            'strides': strides,
+            'rows': int(np.prod(radix, dtype=np.int64)),
+            'data': base64.b64encode(data).decode('ascii')
+        }
+    return {
+        'format': TABLE_FORMAT,
+        'fingerprint': cpt_fingerprint(bn),
+        'domains': bn.domains,
+        'tables': tables
+    }
+
+
+def render_script(table):
+    """JavaScript source assigning the manifest to window.POSTERIOR_TABLE"""
+    return SCRIPT_HEADER + SCRIPT_PREFIX + json.dumps(table, separators=(',', ':')) + ";\n"
+
+
+def read_table(path=DEFAULT_PATH):
+    """Manifest stored in a generated script, or None if missing or unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        start = text.index(SCRIPT_PREFIX) + len(SCRIPT_PREFIX)
+        return json.loads(text[start:].rstrip().rstrip(';'))
+    except (OSError, ValueError):
+        return None
+
+
+def ensure_posterior_table(bn, path=DEFAULT_PATH):
+    """Write the table unless the file already matches the CPTs; True if written"""
+    existing = read_table(path)
+    if (existing is not None and existing.get('format') == TABLE_FORMAT
+            and existing.get('fingerprint') == cpt_fingerprint(bn)):
+        return False
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(render_script(build_posterior_table(bn)))
+    return True
+
+
+def decode_tables(table):
+    """{query_var: float32 ndarray} from a manifest"""
+    return {query_var: np.frombuffer(base64.b64decode(spec['data']), dtype='<f4')
+            for query_var, spec in table['tables'].items()}
+
+
+def lookup(table, arrays, query_var, evidence):
+    """Posterior from the table, the same index arithmetic the dashboard uses"""
+    spec = table['tables'][query_var]
+    domains = table['domains']
+    row = 0
+    for var, stride in zip(spec['axes'], spec['strides']):
+        value = evidence.get(var)
+        code = len(domains[var]) if value is None else domains[var].index(value)
+        row += code * stride
+    size = len(domains[query_var])
+    return dict(zip(domains[query_var], arrays[query_var][row * size:(row + 1) * size].tolist()))
+
+
+def main():
+    """Export the table, check every pattern against the network and time lookups"""
+    from itertools import product
+    from crowding_risk_bn import BayesianNetwork
+
+    print("Posterior Table Export")
+    print("=" * 80)
+
+    bn = BayesianNetwork()
+    start_time = time.perf_counter()
+    written = ensure_posterior_table(bn)
+    elapsed = time.perf_counter() - start_time
+    size = os.path.getsize(DEFAULT_PATH)
+    print(f"{'Wrote' if written else 'Up to date:'} {DEFAULT_PATH} "
+          f"({size / 1024:.1f} KB, {elapsed * 1000:.1f} ms)")
+
+    table = read_table()
+    arrays = decode_tables(table)
+    worst, checked = 0.0, 0
+    for query_var, spec in table['tables'].items():
+        options = [bn.domains[var] + [None] for var in spec['axes']]
+        for values in product(*options):
+            evidence = {var: value for var, value in zip(spec['axes'], values) if value is not None}
+            expected = bn.inference(query_var, evidence)
+            result = lookup(table, arrays, query_var, evidence)
+            worst = max(worst, max(abs(result[v] - expected[v]) for v in expected))
+            checked += 1
+    print(f"{checked} evidence patterns checked against inference(), "
+          f"max difference {worst:.2e} (float32)")
+
+    print("\nRegeneration on CPT change")
+    print("-" * 80)
+    print(f"  Unchanged CPTs rewrite the file: {ensure_posterior_table(bn)}")
+    bn.cpts['M'] = {'Today': 0.9, 'Future': 0.1}
+    bn.mark_cpts_changed()
+    print(f"  After editing P(M), fingerprint changed: "
+          f"{cpt_fingerprint(bn) != table['fingerprint']}")
+
+    print("\nTiming (microseconds per query)")
+    print("-" * 80)
+    bn = BayesianNetwork()
+    evidence = {'W': 'Rainy', 'T': 'Evening', 'D': 'Weekday', 'S': 'Reduced', 'M': 'Today'}
+    repeats = 2000
+    for label, query in [("table lookup", lambda: lookup(table, arrays, 'C', evidence)),
+                         ("inference()", lambda: bn.inference('C', evidence, use_cache=False))]:
+        start_time = time.perf_counter()
+        for _ in range(repeats):
+            query()
+        print(f"  {label:<14} {(time.perf_counter() - start_time) / repeats * 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
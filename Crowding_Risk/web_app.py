@@ -1,21 +1,414 @@
 """
 Crowding Risk Prediction - Web Application
-A Flask web server that serves the standalone HTML dashboard
+A Flask web server for the crowding risk dashboard
+
+The dashboard in templates/index.html is backed by a JSON API on one
+preloaded BayesianNetwork whose joint and marginal tables are compiled at
+start-up. Prediction responses (including their rendered plots) are kept in
+a bounded response cache keyed by the evidence and the CPT version, so
+polling displays reuse earlier work. The scenario library and network
+structure never change while the server runs; they are serialized once and
+sent with an ETag and Cache-Control so clients can revalidate cheaply.
 """
 
-from flask import Flask
-import os
+from flask import Flask, render_template, request, jsonify, Response
+from collections import OrderedDict
+import base64
+import hashlib
+import io
+import json
+import threading
+from matplotlib.figure import Figure
+from crowding_risk_bn import BayesianNetwork
+from posterior_table import build_posterior_table, ensure_posterior_table, render_script
 
 app = Flask(__name__)
 
+# Most responses kept, and their total size (least recently used evicted)
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_BYTES = 32 * 1024 * 1024
+# Larger responses (big batches) are served without being cached
+MAX_CACHED_RESPONSE_BYTES = 1024 * 1024
+# Rows accepted by one /api/predict/batch request
+MAX_BATCH_ROWS = 100_000
+# Browser / proxy lifetime of the static payloads (revalidated by ETag after)
+STATIC_MAX_AGE = 3600
+
+MODE_COLORS = {'Today': '#e74c3c', 'Future': '#27ae60'}
+
+# Form field suffix -> variable (e.g. today_weather -> W)
+FORM_FIELDS = {'weather': 'W', 'time': 'T', 'day': 'D', 'service': 'S'}
+
+SCENARIOS = [
+    {
+        'id': 'morning_rush',
+        'name': 'Morning Rush Hour - Clear Weather',
+        'description': 'Peak morning commute with optimal conditions',
+        'settings': {'W': 'Clear', 'T': 'Morning', 'D': 'Weekday', 'S': 'Normal'}
+    },
+    {
+        'id': 'evening_rain',
+        'name': 'Evening Peak - Rainy Weather',
+        'description': 'Evening rush with adverse weather conditions',
+        'settings': {'W': 'Rainy', 'T': 'Evening', 'D': 'Weekday', 'S': 'Normal'}
+    },
+    {
+        'id': 'weekend_leisure',
+        'name': 'Weekend Leisure Travel',
+        'description': 'Typical weekend afternoon travel patterns',
+        'settings': {'W': 'Clear', 'T': 'Afternoon', 'D': 'Weekend', 'S': 'Normal'}
+    },
+    {
+        'id': 'peak_disruption',
+        'name': 'Service Disruption - Peak Hour',
+        'description': 'Major service disruption during morning peak',
+        'settings': {'W': 'Clear', 'T': 'Morning', 'D': 'Weekday', 'S': 'Disrupted'}
+    },
+    {
+        'id': 'thunderstorm_reduced',
+        'name': 'Thunderstorm + Reduced Service',
+        'description': 'Severe weather with service impacts',
+        'settings': {'W': 'Thunderstorms', 'T': 'Evening', 'D': 'Weekday', 'S': 'Reduced'}
+    },
+    {
+        'id': 'optimal',
+        'name': 'Optimal Conditions',
+        'description': 'Best case scenario with all favorable conditions',
+        'settings': {'W': 'Clear', 'T': 'Afternoon', 'D': 'Weekend', 'S': 'Normal'}
+    }
+]
+
+VARIABLE_INFO = {
+    'W': ('Weather', 'Based on Singapore meteorological data'),
+    'T': ('Time of Day', 'Analysis time periods'),
+    'D': ('Day Type', 'Affects commuter vs leisure travel patterns'),
+    'M': ('Network Mode', 'Today: current network, Future: with TELe/CRL'),
+    'S': ('Service Status', 'Future mode has better service reliability'),
+    'P': ('Demand Proxy', 'Passenger demand levels'),
+    'C': ('Crowding Risk', 'Target variable: the main prediction output')
+}
+
+INSIGHTS = [
+    'Mode (M) affects both Service Status and Crowding Risk directly',
+    'Future mode provides better infrastructure capacity and reliability',
+    'Weather, Time, and Day Type influence demand patterns',
+    'Service disruptions significantly amplify crowding risk',
+    'TELe/CRL extensions provide alternative routes reducing bottlenecks'
+]
+
+# Global network, response cache and serialized static payloads
+bn = None
+init_lock = threading.Lock()
+cache_lock = threading.Lock()  # guards response_cache and cache_stats across request threads
+response_cache = OrderedDict()
+cache_stats = {'hits': 0, 'misses': 0, 'bytes': 0, 'uncached': 0}
+static_payloads = {}  # name -> (JSON body, ETag)
+posterior_script = {}  # cpt_version, script, ETag of the dashboard's posterior table
+
+
+def initialize_network():
+    """Build the network, compile its tables and serialize the static payloads"""
+    global bn
+    network = BayesianNetwork()
+    network.get_joint()
+    try:
+        ensure_posterior_table(network)
+    except OSError as e:
+        # Read-only deploys: /posterior_table.js is still served from memory
+        app.logger.warning("Could not write posterior_table.js (%s); serving it from memory", e)
+    with cache_lock:
+        response_cache.clear()
+        cache_stats['bytes'] = 0
+
+    variables = {
+        var: {
+            'name': VARIABLE_INFO[var][0],
+            'description': VARIABLE_INFO[var][1],
+            'values': network.domains[var],
+            'parents': network.parents[var]
+        }
+        for var in network.domains
+    }
+    payloads = {
+        'scenarios': {'scenarios': SCENARIOS},
+        'network-info': {'structure': {'variables': variables}, 'insights': INSIGHTS}
+    }
+    for name, payload in payloads.items():
+        # Key order is kept so the page lists variables in network order (W ... C)
+        body = json.dumps(payload)
+        static_payloads[name] = (body, hashlib.sha1(body.encode('utf-8')).hexdigest())
+    bn = network
+
+
+@app.before_request
+def ensure_network():
+    """Load the network on the first request when not started through __main__ (flask run, WSGI)"""
+    if bn is None:
+        with init_lock:
+            if bn is None:
+                initialize_network()
+
+
+def _static_response(name):
+    """Serialized payload with ETag / Cache-Control; 304 if the client's copy is current"""
+    body, etag = static_payloads[name]
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = f'public, max-age={STATIC_MAX_AGE}'
+    return response.make_conditional(request)
+
+
+def _cached(key, compute):
+    """
+    Serialized response for key, computed on a miss (LRU keyed on the CPT
+    version, bounded by entry count and total bytes)
+    """
+    key = (key, bn.cpt_version)
+    with cache_lock:
+        body = response_cache.get(key)
+        if body is not None:
+            cache_stats['hits'] += 1
+            response_cache.move_to_end(key)
+        else:
+            cache_stats['misses'] += 1
+    if body is not None:
+        status = 'HIT'
+    else:
+        # Computed outside the lock so slow requests do not block cache hits
+        body = json.dumps(compute())
+        with cache_lock:
+            if len(body) > MAX_CACHED_RESPONSE_BYTES:
+                cache_stats['uncached'] += 1
+                status = 'BYPASS'
+            else:
+                previous = response_cache.pop(key, None)
+                if previous is not None:
+                    cache_stats['bytes'] -= len(previous)
+                response_cache[key] = body
+                cache_stats['bytes'] += len(body)
+                while (len(response_cache) > RESPONSE_CACHE_SIZE
+                       or cache_stats['bytes'] > RESPONSE_CACHE_BYTES):
+                    _, evicted = response_cache.popitem(last=False)
+                    cache_stats['bytes'] -= len(evicted)
+                status = 'MISS'
+    response = Response(body, mimetype='application/json')
+    response.headers['X-Cache'] = status
+    return response
+
+
+def _parse_evidence(data, prefix, mode):
+    """Evidence dict from the dashboard's <prefix>_<field> form values"""
+    evidence = {}
+    for field, var in FORM_FIELDS.items():
+        value = data.get(f'{prefix}_{field}', bn.domains[var][0])
+        if value not in bn.domains[var]:
+            raise ValueError(f"Invalid {prefix}_{field}: {value}")
+        evidence[var] = value
+    evidence['M'] = mode
+    return evidence
+
+
+def _risk_score(crowding):
+    """Expected risk score (Low=1, Medium=2, High=3)"""
+    return sum(crowding[value] * (i + 1) for i, value in enumerate(bn.domains['C']))
+
+
+def _png(fig):
+    """Figure rendered as a base64 PNG string"""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
+    return base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def _mode_plot(crowding, demand, evidence, color):
+    """Crowding and demand distributions of one mode"""
+    fig = Figure(figsize=(7, 4), facecolor='white')
+    ax1, ax2 = fig.subplots(1, 2)
+    for ax, dist, title, bar_color in [(ax1, crowding, 'Crowding Risk', color),
+                                       (ax2, demand, 'Demand', '#3498db')]:
+        bars = ax.bar(list(dist), list(dist.values()), color=bar_color, alpha=0.7)
+        ax.set_title(f"{evidence['M']} Mode - {title}", fontsize=11, fontweight='bold')
+        ax.set_ylabel('Probability')
+        ax.set_ylim(0, 1)
+        for bar, prob in zip(bars, dist.values()):
+            ax.text(bar.get_x() + bar.get_width() / 2., bar.get_height() + 0.01,
+                    f'{prob:.3f}', ha='center', va='bottom', fontsize=9)
+    fig.tight_layout()
+    return _png(fig)
+
+
+def _comparison_plot(today, future):
+    """Side-by-side crowding distributions and risk scores of both modes"""
+    fig = Figure(figsize=(10, 4), facecolor='white')
+    ax1, ax2 = fig.subplots(1, 2)
+    values = bn.domains['C']
+    width = 0.35
+    for offset, (mode, result) in zip([-width / 2, width / 2],
+                                      [('Today', today), ('Future', future)]):
+        ax1.bar([i + offset for i in range(len(values))],
+                [result['crowding'][v] for v in values], width,
+                label=mode, color=MODE_COLORS[mode], alpha=0.7)
+    ax1.set_xticks(range(len(values)))
+    ax1.set_xticklabels(values)
+    ax1.set_ylim(0, 1)
+    ax1.set_ylabel('Probability')
+    ax1.set_title('Crowding Risk: Today vs Future', fontsize=11, fontweight='bold')
+    ax1.legend()
+
+    scores = [today['risk_score'], future['risk_score']]
+    bars = ax2.bar(['Today', 'Future'], scores, color=list(MODE_COLORS.values()), alpha=0.7)
+    ax2.set_ylim(1, 3)
+    ax2.set_ylabel('Risk Score')
+    ax2.set_title('Expected Risk Score', fontsize=11, fontweight='bold')
+    for bar, score in zip(bars, scores):
+        ax2.text(bar.get_x() + bar.get_width() / 2., bar.get_height() + 0.02,
+                 f'{score:.3f}', ha='center', va='bottom', fontweight='bold')
+    fig.tight_layout()
+    return _png(fig)
+
+
+def _predict_mode(evidence):
+    """Posteriors, risk score and plot for one mode's evidence"""
+    crowding = bn.inference('C', evidence)
+    demand = bn.inference('P', evidence)
+    return {
+        'evidence': evidence,
+        'crowding': crowding,
+        'demand': demand,
+        'risk_score': _risk_score(crowding),
+        'plot': _mode_plot(crowding, demand, evidence, MODE_COLORS[evidence['M']])
+    }
+
+
 @app.route('/')
 def index():
     """Main page"""
+    return render_template('index.html')
+
+
+@app.route('/dashboard')
+def dashboard():
+    """Standalone HTML dashboard (lookups in the precompiled posterior table)"""
     with open('crowding_risk_dashboard.html', 'r', encoding='utf-8') as f:
         return f.read()
 
+
+@app.route('/posterior_table.js')
+def posterior_table_script():
+    """Posterior lookup table for the standalone dashboard, rebuilt when the CPTs change"""
+    if posterior_script.get('version') != bn.cpt_version:
+        table = build_posterior_table(bn)
+        posterior_script.update(version=bn.cpt_version, script=render_script(table),
+                                etag=table['fingerprint'])
+    response = Response(posterior_script['script'], mimetype='application/javascript')
+    response.set_etag(posterior_script['etag'])
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+
+@app.route('/api/predict', methods=['POST'])
+def predict():
+    """Today vs Future prediction for the dashboard form"""
+    data = request.get_json(silent=True) or {}
+    if not isinstance(data, dict):
+        return jsonify({'success': False, 'error': 'Request body must be a JSON object'}), 400
+    try:
+        today_evidence = _parse_evidence(data, 'today', 'Today')
+        future_evidence = _parse_evidence(data, 'future', 'Future')
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+    def compute():
+        today = _predict_mode(today_evidence)
+        future = _predict_mode(future_evidence)
+        reduction = today['risk_score'] - future['risk_score']
+        return {
+            'success': True,
+            'today': today,
+            'future': future,
+            'comparison_plot': _comparison_plot(today, future),
+            'improvement': {
+                'risk_reduction': reduction,
+                'percent_improvement': reduction / today['risk_score'] * 100
+            }
+        }
+
+    key = ('predict', tuple(today_evidence.items()), tuple(future_evidence.items()))
+    return _cached(key, compute)
+
+
+@app.route('/api/predict/batch', methods=['POST'])
+def predict_batch():
+    """
+    Posteriors for many evidence rows in one vectorized call
+
+    Body: {"query": "C", "rows": [{"W": "Rainy", "M": "Today", ...}, ...]};
+    variables left out of a row (or null) are unobserved.
+    """
+    data = request.get_json(silent=True) or {}
+    if not isinstance(data, dict):
+        return jsonify({'success': False, 'error': 'Request body must be a JSON object'}), 400
+    query_var = data.get('query', 'C')
+    rows = data.get('rows')
+    if not isinstance(query_var, str) or query_var not in bn.domains:
+        return jsonify({'success': False, 'error': f'Invalid query variable: {query_var}'}), 400
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        return jsonify({'success': False, 'error': 'rows must be a list of objects'}), 400
+    if len(rows) > MAX_BATCH_ROWS:
+        return jsonify({'success': False, 'error': f'At most {MAX_BATCH_ROWS} rows'}), 400
+    if not all(value is None or isinstance(value, str) for row in rows for value in row.values()):
+        return jsonify({'success': False, 'error': 'Row values must be strings or null'}), 400
+
+    def compute():
+        variables = sorted({var for row in rows for var in row})
+        columns = {var: [row.get(var) for row in rows] for var in variables}
+        posteriors, risk_scores = bn.inference_batch(query_var, columns)
+        return {
+            'success': True,
+            'query': query_var,
+            'values': bn.domains[query_var],
+            'posteriors': posteriors.tolist(),
+            'risk_scores': risk_scores.tolist()
+        }
+
+    # Keyed by a digest so large bodies are not kept as cache keys
+    digest = hashlib.sha1(json.dumps(rows, sort_keys=True).encode('utf-8')).hexdigest()
+    try:
+        return _cached(('batch', query_var, digest), compute)
+    except (ValueError, TypeError) as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+
+@app.route('/api/scenarios')
+def get_scenarios():
+    """Predefined scenario library"""
+    return _static_response('scenarios')
+
+
+@app.route('/api/network-info')
+def get_network_info():
+    """Network structure and key insights"""
+    return _static_response('network-info')
+
+
+@app.route('/api/cache-stats')
+def get_cache_stats():
+    """Hit rates of the response cache and of the network's inference cache"""
+    with cache_lock:
+        stats = {**cache_stats, 'size': len(response_cache)}
+    lookups = stats['hits'] + stats['misses']
+    return jsonify({
+        'responses': {**stats, 'maxsize': RESPONSE_CACHE_SIZE, 'maxbytes': RESPONSE_CACHE_BYTES,
+                      'hit_rate': stats['hits'] / lookups if lookups else 0.0},
+        'inference': bn.cache_info()
+    })
+
+
 if __name__ == '__main__':
     print("Starting Crowding Risk Dashboard Web Server...")
+    print("Loading Bayesian Network...")
+    initialize_network()
+    print("Network loaded (joint and marginal tables compiled)")
     print("Open your browser and go to: http://localhost:5002")
-    print("The dashboard uses embedded Bayesian Network calculations.")
-    app.run(debug=True, host='0.0.0.0', port=5002)
\ No newline at end of file
+    print("The standalone dashboard is at: http://localhost:5002/dashboard")
+    app.run(debug=True, host='0.0.0.0', port=5002)
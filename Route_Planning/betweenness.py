@@ -0,0 +1,235 @@
+"""
+Betweenness Centrality Analysis for MRT Networks
+Brandes' algorithm weighted by travel time, including transfer penalties,
+with the source stations split across a process pool
+
+Scores count ordered origin-destination station pairs: the betweenness of a
+station is the expected number of OD pairs (origin and destination excluded)
+whose shortest journeys pass through it, splitting ties evenly between
+equally short routes. Edge scores are per (station, station, line) segment.
+"""
+
+import heapq
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from state_graph import LineStateGraph, LINE, SINK
+
+
+# Stations along the Changi Airport / T5 corridor, reported separately
+CHANGI_CORRIDOR = [
+    "Tanah Merah", "Expo", "Changi Airport", "Changi Terminal 5",
+    "Upper Changi", "Simei", "Tampines", "Pasir Ris", "Bedok",
+]
+
+_worker_graph = None  # state graph shared by each pool worker
+
+
+class BetweennessIndex:
+    """Integer ids for the stations and ride segments of a state graph"""
+
+    def __init__(self, graph: LineStateGraph):
+        self.stations = sorted(graph.source_node)
+        self.station_id = {station: i for i, station in enumerate(self.stations)}
+
+        # Ride arcs (between two line nodes of different stations) -> segment id,
+        # with both directions of a segment sharing one id
+        self.segments = []
+        self.segment_id = {}
+        self.arc_segment = {}
+        for u in range(len(graph)):
+            if graph.node_kind[u] != LINE:
+                continue
+            for w, _ in graph.forward[u]:
+                if graph.node_kind[w] != LINE or graph.node_station[w] == graph.node_station[u]:
+                    continue
+                a, b = sorted((graph.node_station[u], graph.node_station[w]))
+                key = (a, b, graph.node_line[u])
+                if key not in self.segment_id:
+                    self.segment_id[key] = len(self.segments)
+                    self.segments.append(key)
+                self.arc_segment[(u, w)] = self.segment_id[key]
+
+
+def _single_source_dependencies(graph: LineStateGraph, index: BetweennessIndex,
+                                source_station: str,
+                                station_scores: np.ndarray, segment_scores: np.ndarray):
+    """Brandes accumulation for one source station, added into the score vectors"""
+    source = graph.source_node[source_station]
+
+    # Dijkstra recording shortest-path counts and predecessors. Sinks are
+    # reached over zero-weight arcs, so at equal distance they are popped
+    # last; otherwise a later line node could still add paths to a settled sink
+    dist = {source: 0}
+    sigma = {source: 1}
+    preds = {source: []}
+    order = []
+    settled = set()
+    frontier = [(0, False, source)]
+    while frontier:
+        d, _, u = heapq.heappop(frontier)
+        if u in settled:
+            continue
+        settled.add(u)
+        order.append(u)
+        for w, weight in graph.forward[u]:
+            nd = d + weight
+            if w not in dist or nd < dist[w]:
+                dist[w] = nd
+                sigma[w] = sigma[u]
+                preds[w] = [u]
+                heapq.heappush(frontier, (nd, graph.node_kind[w] == SINK, w))
+            elif nd == dist[w]:
+                sigma[w] += sigma[u]
+                preds[w].append(u)
+
+    # Back-propagate dependencies; every other station's sink is a target
+    delta = dict.fromkeys(order, 0.0)
+    for w in reversed(order):
+        is_target = graph.node_kind[w] == SINK and graph.node_station[w] != source_station
+        coefficient = (1.0 + delta[w] if is_target else delta[w]) / sigma[w]
+        for u in preds[w]:
+            flow = sigma[u] * coefficient
+            delta[u] += flow
+            segment = index.arc_segment.get((u, w))
+            if segment is not None:
+                segment_scores[segment] += flow
+
+    # A journey passes a station by riding into one of its line nodes; count
+    # that inflow, leaving out journeys that end at the station itself
+    for w in order:
+        if graph.node_kind[w] != LINE:
+            continue
+        station = graph.node_station[w]
+        if station == source_station:
+            continue
+        ride_in = sum(sigma[u] for u in preds[w] if graph.node_station[u] != station)
+        if not ride_in:
+            continue
+        ends_here = 0.0
+        sink = graph.sink_node[station]
+        if sink in dist and dist[sink] == dist[w] and w in preds[sink]:
+            ends_here = sigma[w] / sigma[sink]
+        station_scores[index.station_id[station]] += ride_in / sigma[w] * (delta[w] - ends_here)
+
+
+def _init_worker(graph: LineStateGraph):
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _score_sources(sources: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Pool task: partial score vectors for a chunk of source stations"""
+    graph = _worker_graph
+    index = BetweennessIndex(graph)
+    station_scores = np.zeros(len(index.stations))
+    segment_scores = np.zeros(len(index.segments))
+    for source in sources:
+        _single_source_dependencies(graph, index, source, station_scores, segment_scores)
+    return station_scores, segment_scores
+
+
+def betweenness_centrality(network, workers: Optional[int] = None,
+                           sources: Optional[List[str]] = None) -> Dict:
+    """
+    Station and segment betweenness for a network
+
+    workers: process count (None = CPU count, 1 = run in this process)
+    sources: restrict the origins (default: every station)
+    """
+    start_time = time.time()
+    graph = LineStateGraph(network)
+    index = BetweennessIndex(graph)
+    sources = sorted(sources if sources is not None else index.stations)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        _init_worker(graph)
+        station_scores, segment_scores = _score_sources(sources)
+    else:
+        # Interleave sources so every chunk gets a mix of cheap and costly origins
+        chunks = [sources[i::workers * 4] for i in range(workers * 4)]
+        station_scores = np.zeros(len(index.stations))
+        segment_scores = np.zeros(len(index.segments))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(graph,)) as pool:
+            for partial_stations, partial_segments in pool.map(_score_sources,
+                                                               [c for c in chunks if c]):
+                station_scores += partial_stations
+                segment_scores += partial_segments
+
+    station_order = np.argsort(-station_scores, kind="stable")
+    segment_order = np.argsort(-segment_scores, kind="stable")
+
+    return {
+        "mode": network.mode,
+        "stations": [(index.stations[i], float(station_scores[i])) for i in station_order],
+        "edges": [(index.segments[i], float(segment_scores[i])) for i in segment_order],
+        "sources": len(sources),
+        "workers": workers,
+        "runtime": time.time() - start_time
+    }
+
+
+def print_ranking(result: Dict, top: int = 10):
+    """Print the top stations and segments of one result"""
+    print(f"\n{result['mode'].upper()} network - top {top} stations")
+    print("-" * 80)
+    for rank, (station, score) in enumerate(result["stations"][:top], 1):
+        print(f"  {rank:>2}. {station:<25} {score:>10.1f}")
+
+    print(f"\n{result['mode'].upper()} network - top {top} segments")
+    print("-" * 80)
+    for rank, ((a, b, line), score) in enumerate(result["edges"][:top], 1):
+        print(f"  {rank:>2}. {a + ' - ' + b:<40} {line:<5} {score:>10.1f}")
+
+
+def main():
+    """Rank stations and segments for both modes and report runtime scaling"""
+    from task1_route_planning import MRTNetwork
+    from synthetic_network import SyntheticGridNetwork
+
+    print("Betweenness Centrality Analysis (Brandes, travel time + transfer penalty)")
+    print("=" * 80)
+
+    results = {}
+    for mode in ["today", "future"]:
+        results[mode] = betweenness_centrality(MRTNetwork(mode=mode))
+        print_ranking(results[mode])
+
+    print("\nCHANGI CORRIDOR: TODAY vs FUTURE")
+    print("-" * 80)
+    print(f"{'Station':<22} {'Today':>10} {'Rank':>6} {'Future':>10} {'Rank':>6}")
+    for station in CHANGI_CORRIDOR:
+        row = f"{station:<22}"
+        for mode in ["today", "future"]:
+            ranked = [s for s, _ in results[mode]["stations"]]
+            if station in ranked:
+                score = dict(results[mode]["stations"])[station]
+                row += f" {score:>10.1f} {ranked.index(station) + 1:>6}"
+            else:
+                row += f" {'-':>10} {'-':>6}"
+        print(row)
+
+    print("\nRUNTIME SCALING")
+    print("-" * 80)
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, cpu_count})
+    cases = [(f"{mode} network", MRTNetwork(mode=mode)) for mode in ["today", "future"]]
+    cases.append(("synthetic 30x30 grid", SyntheticGridNetwork(rows=30, cols=30)))
+    for label, network in cases:
+        timings = []
+        for workers in worker_counts:
+            timings.append(betweenness_centrality(network, workers=workers)["runtime"])
+        speedups = ", ".join(f"{w} worker(s): {t:.2f}s ({timings[0] / t:.1f}x)"
+                             for w, t in zip(worker_counts, timings))
+        print(f"  {label:<22} {speedups}")
+    print(f"  (machine has {cpu_count} CPU(s))")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+"""
+Connectivity Index for MRT Networks
+Tarjan's bridges, articulation points and biconnected components, used to
+answer "will this closure disconnect X from Y" without running a search
+
+One iterative DFS per connected component records discovery/finish times
+and low-links. A station closure separates X from Y exactly when the closed
+station is an articulation point and X and Y hang in different DFS subtrees
+below it (or one of them is in the rest of the component); a segment
+closure separates them when the segment is a bridge and exactly one of them
+sits below it. Both checks are interval tests on the DFS numbering.
+
+The index follows the network's disruption overlay: when stations or
+segments close or reopen, only the components containing the touched
+stations are re-run.
+"""
+
+import time
+from bisect import bisect_right
+from typing import Dict, List, Set, Tuple
+
+
+Segment = Tuple[str, str, str]  # (station, station, line), stations sorted
+
+
+def segment_key(station1: str, station2: str, line: str) -> Segment:
+    """Canonical key for the segment between two stations on a line"""
+    a, b = sorted((station1, station2))
+    return (a, b, line)
+
+
+class ConnectivityIndex:
+    """Bridges, articulation points and components of one network mode"""
+
+    def __init__(self, network):
+        self.network = network
+        self.version = None       # network version the index reflects
+        self.clock = 0            # DFS discovery counter, never reset
+
+        self.component = {}       # station -> component id
+        self.components = {}      # component id -> set of stations
+        self.disc = {}            # station -> discovery time
+        self.finish = {}          # station -> first discovery time after its subtree
+        self.separators = {}      # articulation point -> [(disc, finish)] of cut-off subtrees
+        self.bridges = {}         # bridge segment -> station on the child side
+        self.blocks = {}          # component id -> [biconnected component station sets]
+        self.next_component = 0
+
+        self.last_recomputed = 0  # stations re-run by the most recent update
+        self.last_update_time = 0.0
+        self.rebuild()
+
+    # ------------------------------------------------------------------
+    # Construction and incremental updates
+    # ------------------------------------------------------------------
+
+    def rebuild(self):
+        """Recompute everything from scratch"""
+        start_time = time.time()
+        self.component.clear()
+        self.components.clear()
+        self.disc.clear()
+        self.finish.clear()
+        self.separators.clear()
+        self.bridges.clear()
+        self.blocks.clear()
+
+        stations = sorted(self.network.stations)
+        self._run_tarjan(stations)
+        self.version = getattr(self.network, "version", 0)
+        self.last_recomputed = len(stations)
+        self.last_update_time = time.time() - start_time
+
+    def sync(self):
+        """Catch up with disruption overlay changes since the last query"""
+        version = getattr(self.network, "version", 0)
+        if version == self.version:
+            return
+
+        start_time = time.time()
+        touched = set()
+        for change_version, stations in getattr(self.network, "disruption_log", []):
+            if change_version > self.version:
+                touched |= stations
+
+        # Closing only splits the touched stations' components and reopening
+        # only merges them, so no other component can change
+        affected = set()
+        for station in touched:
+            if station in self.component and station not in affected:
+                affected |= self.components[self.component[station]]
+        if not affected:
+            self.rebuild()
+            return
+
+        self._forget(affected)
+        self._run_tarjan(sorted(affected))
+        self.version = version
+        self.last_recomputed = len(affected)
+        self.last_update_time = time.time() - start_time
+
+    def _forget(self, stations: Set[str]):
+        """Drop all derived data for a set of whole components"""
+        for component_id in {self.component[s] for s in stations}:
+            del self.components[component_id]
+            self.blocks.pop(component_id, None)
+        for station in stations:
+            del self.component[station]
+            del self.disc[station]
+            del self.finish[station]
+            self.separators.pop(station, None)
+        self.bridges = {segment: child for segment, child in self.bridges.items()
+                        if segment[0] not in stations}
+
+    def _adjacency(self, station: str) -> List[Tuple[str, Segment]]:
+        """Distinct (neighbor, segment) pairs; duplicate data rows collapse"""
+        seen = {}
+        for neighbor, _, line in self.network.get_neighbors(station):
+            if neighbor != station:
+                seen[segment_key(station, neighbor, line)] = neighbor
+        return [(neighbor, segment) for segment, neighbor in sorted(seen.items())]
+
+    def _run_tarjan(self, stations: List[str]):
+        """Iterative Tarjan DFS over the components containing these stations"""
+        for root in stations:
+            if root in self.component:
+                continue
+
+            component_id = self.next_component
+            self.next_component += 1
+            members = set()
+            blocks = []
+            low = {}
+            edge_stack = []
+
+            self.disc[root] = low[root] = self.clock
+            self.clock += 1
+            members.add(root)
+            self.component[root] = component_id
+            root_children = []
+            cut_children = {}  # station -> children whose subtree it cuts off
+
+            # Frames: (station, segment used to enter it, neighbor iterator)
+            stack = [(root, None, iter(self._adjacency(root)))]
+            while stack:
+                station, entry_segment, neighbors = stack[-1]
+                advanced = False
+                for neighbor, segment in neighbors:
+                    if segment == entry_segment:
+                        continue
+                    if neighbor not in self.disc:
+                        self.disc[neighbor] = low[neighbor] = self.clock
+                        self.clock += 1
+                        members.add(neighbor)
+                        self.component[neighbor] = component_id
+                        edge_stack.append((station, neighbor, segment))
+                        stack.append((neighbor, segment, iter(self._adjacency(neighbor))))
+                        advanced = True
+                        break
+                    if self.disc[neighbor] < self.disc[station]:
+                        # Back edge to an ancestor
+                        edge_stack.append((station, neighbor, segment))
+                        low[station] = min(low[station], self.disc[neighbor])
+                if advanced:
+                    continue
+
+                stack.pop()
+                self.finish[station] = self.clock
+                if not stack:
+                    continue
+
+                parent = stack[-1][0]
+                low[parent] = min(low[parent], low[station])
+                if parent == root:
+                    root_children.append(station)
+                if low[station] > self.disc[parent]:
+                    self.bridges[entry_segment] = station
+                if low[station] >= self.disc[parent]:
+                    cut_children.setdefault(parent, []).append(station)
+                    block = set()
+                    while True:
+                        u, v, segment = edge_stack.pop()
+                        block.update((u, v))
+                        if segment == entry_segment and v == station:
+                            break
+                    blocks.append(block)
+
+            for station, children in cut_children.items():
+                # The root is an articulation point only with two DFS children
+                if station == root and len(root_children) < 2:
+                    continue
+                self.separators[station] = sorted((self.disc[c], self.finish[c]) for c in children)
+
+            self.components[component_id] = members
+            self.blocks[component_id] = blocks
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _subtree_below(self, cut: str, station: str) -> int:
+        """Index of the cut-off subtree of `cut` holding station, or -1 for the rest"""
+        intervals = self.separators[cut]
+        position = bisect_right(intervals, (self.disc[station], float('inf'))) - 1
+        if position >= 0:
+            start, end = intervals[position]
+            if start <= self.disc[station] < end:
+                return position
+        return -1
+
+    def connected(self, station1: str, station2: str) -> bool:
+        """Whether a path currently exists between two stations"""
+        self.sync()
+        if station1 not in self.component or station2 not in self.component:
+            return False
+        return self.component[station1] == self.component[station2]
+
+    def station_closure_disconnects(self, closed: str, origin: str, destination: str) -> bool:
+        """Whether origin and destination are disconnected once `closed` closes"""
+        if not self.connected(origin, destination):
+            return True
+        if closed in (origin, destination):
+            return True
+        if closed not in self.separators or self.component[closed] != self.component[origin]:
+            return False
+        return self._subtree_below(closed, origin) != self._subtree_below(closed, destination)
+
+    def segment_closure_disconnects(self, segment: Segment, origin: str, destination: str) -> bool:
+        """Whether origin and destination are disconnected once a segment closes"""
+        if not self.connected(origin, destination):
+            return True
+        child = self.bridges.get(segment_key(*segment))
+        if child is None or self.component[child] != self.component[origin]:
+            return False
+        start, end = self.disc[child], self.finish[child]
+        return (start <= self.disc[origin] < end) != (start <= self.disc[destination] < end)
+
+    def articulation_points(self) -> List[str]:
+        """Stations whose closure splits their component"""
+        self.sync()
+        return sorted(self.separators)
+
+    def bridge_segments(self) -> List[Segment]:
+        """Segments whose closure splits their component"""
+        self.sync()
+        return sorted(self.bridges)
+
+    def biconnected_components(self) -> List[List[str]]:
+        """Station lists of every biconnected component (largest first)"""
+        self.sync()
+        blocks = [sorted(block) for blocks in self.blocks.values() for block in blocks]
+        return sorted(blocks, key=lambda block: (-len(block), block))
+
+    def cut_off_by_station(self, closed: str) -> List[List[str]]:
+        """Groups of stations separated from each other if `closed` closes"""
+        self.sync()
+        if closed not in self.separators:
+            return []
+        groups = {}
+        for station in self.components[self.component[closed]]:
+            if station != closed:
+                groups.setdefault(self._subtree_below(closed, station), []).append(station)
+        return sorted((sorted(group) for group in groups.values()), key=len)
+
+    def summary(self) -> Dict:
+        """Counts for reporting"""
+        self.sync()
+        return {
+            "stations": len(self.component),
+            "components": len(self.components),
+            "articulation_points": len(self.separators),
+            "bridges": len(self.bridges),
+            "biconnected_components": sum(len(blocks) for blocks in self.blocks.values()),
+            "last_recomputed": self.last_recomputed,
+            "last_update_time": self.last_update_time
+        }
+
+
+def main():
+    """Report cut stations and segments, then exercise closures incrementally"""
+    from task1_route_planning import MRTNetwork, SearchAlgorithms
+
+    print("Connectivity Index (Tarjan bridges / articulation points)")
+    print("=" * 80)
+
+    for mode in ["today", "future"]:
+        network = MRTNetwork(mode=mode)
+        index = ConnectivityIndex(network)
+        summary = index.summary()
+
+        print(f"\n{mode.upper()} network")
+        print("-" * 80)
+        print(f"  Stations: {summary['stations']}, components: {summary['components']}, "
+              f"biconnected components: {summary['biconnected_components']}")
+        print(f"  Built in {summary['last_update_time'] * 1000:.2f} ms")
+        print(f"  Articulation points ({summary['articulation_points']}): "
+              f"{', '.join(index.articulation_points())}")
+        print(f"  Bridges ({summary['bridges']}):")
+        for a, b, line in index.bridge_segments():
+            print(f"    {a} - {b} ({line})")
+
+        # Which single closures cut the airport off from the city centre?
+        origin, destination = "City Hall", "Changi Airport"
+        cut_stations = [c for c in index.articulation_points()
+                        if index.station_closure_disconnects(c, origin, destination)]
+        cut_segments = [s for s in index.bridge_segments()
+                        if index.segment_closure_disconnects(s, origin, destination)]
+        print(f"\n  Closures disconnecting {origin} -> {destination}:")
+        print(f"    Stations: {', '.join(cut_stations) or 'none'}")
+        print(f"    Segments: {', '.join(f'{a} - {b} ({line})' for a, b, line in cut_segments) or 'none'}")
+
+        # Apply the closure and compare the pruned search with a full BFS
+        if cut_stations:
+            closed = cut_stations[0]
+            network.close_station(closed)
+            connected = index.connected(origin, destination)
+            summary = index.summary()
+            print(f"\n  After closing {closed}: {origin} -> {destination} "
+                  f"{'connected' if connected else 'unreachable'} "
+                  f"({summary['last_recomputed']} stations re-run in "
+                  f"{summary['last_update_time'] * 1000:.2f} ms)")
+
+            searcher = SearchAlgorithms(network)
+            searcher.connectivity = index
+            _, stats = searcher.bfs(origin, destination)
+            print(f"  BFS with index:  {stats['nodes_expanded']} nodes expanded, "
+                  f"{stats['runtime'] * 1000:.3f} ms ({stats['error']})")
+            searcher.connectivity_pruning = False
+            _, stats = searcher.bfs(origin, destination)
+            print(f"  BFS without:     {stats['nodes_expanded']} nodes expanded, "
+                  f"{stats['runtime'] * 1000:.3f} ms ({stats['error']})")
+
+            network.reopen_station(closed)
+            print(f"  Reopened {closed}: connected again = {index.connected(origin, destination)}")
+
+
+if __name__ == "__main__":
+    main()
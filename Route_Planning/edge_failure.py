@@ -0,0 +1,225 @@
+"""
+Single-Segment Failure Impact Analysis for MRT Networks
+Ranks track segments by how many origin-destination journeys get slower
+(or impossible) when that segment closes
+
+A naive analysis re-runs every OD search for every closure (E x N^2). Here
+one baseline shortest-path tree is built per origin; closing a segment can
+only change journeys from origins whose tree rides that segment, and within
+such a tree only the subtree below the closed segment. Only those subtrees
+are re-settled, with closures spread across a process pool.
+"""
+
+import heapq
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from state_graph import LineStateGraph, INF
+
+
+Segment = Tuple[str, str, str]  # (station, station, line), stations sorted
+
+_worker_state = None  # (graph, baseline trees) shared by pool workers
+
+
+def segment_arcs(graph: LineStateGraph) -> Dict[Segment, List[Tuple[int, int]]]:
+    """Map every segment to its ride arcs in both directions"""
+    arcs = {}
+    for u in range(len(graph)):
+        for v, _ in graph.forward[u]:
+            if graph.is_ride_arc(u, v):
+                a, b = sorted((graph.node_station[u], graph.node_station[v]))
+                arcs.setdefault((a, b, graph.node_line[u]), []).append((u, v))
+    return arcs
+
+
+def _journey_arcs(graph: LineStateGraph, parent: List[int]) -> List[Tuple[int, int]]:
+    """Tree arcs that lie on the chosen journey to some station's sink"""
+    on_journey = set()
+    for sink in graph.sink_node.values():
+        node = sink
+        while parent[node] >= 0 and node not in on_journey:
+            on_journey.add(node)
+            node = parent[node]
+    return [(parent[v], v) for v in on_journey]
+
+
+def _repair_tree(graph: LineStateGraph, dist: List[float], parent: List[int],
+                 closed: set, cut_heads: List[int]) -> Dict[int, float]:
+    """
+    Incrementally repair a shortest-path tree after closing some arcs
+
+    Closing arcs can only lengthen journeys, and only for nodes in the
+    subtrees hanging below the closed tree arcs. Those nodes are re-seeded
+    from their neighbors outside the subtrees and settled with a Dijkstra
+    confined to the subtrees. Returns the new distances of subtree nodes.
+    """
+    children = {}
+    for v, u in enumerate(parent):
+        if u >= 0:
+            children.setdefault(u, []).append(v)
+
+    affected = set()
+    stack = list(cut_heads)
+    while stack:
+        node = stack.pop()
+        if node not in affected:
+            affected.add(node)
+            stack.extend(children.get(node, ()))
+
+    new_dist = dict.fromkeys(affected, INF)
+    for v in affected:
+        for u, weight in graph.backward[v]:
+            if u not in affected and (u, v) not in closed and dist[u] + weight < new_dist[v]:
+                new_dist[v] = dist[u] + weight
+
+    frontier = [(d, v) for v, d in new_dist.items() if d < INF]
+    heapq.heapify(frontier)
+    while frontier:
+        d, u = heapq.heappop(frontier)
+        if d > new_dist[u]:
+            continue
+        for v, weight in graph.forward[u]:
+            if v in affected and (u, v) not in closed and d + weight < new_dist[v]:
+                new_dist[v] = d + weight
+                heapq.heappush(frontier, (new_dist[v], v))
+
+    return new_dist
+
+
+def _init_worker(graph: LineStateGraph, trees: Dict[str, Tuple[List[float], List[int]]]):
+    global _worker_state
+    _worker_state = (graph, trees)
+
+
+def _evaluate_closure(task: Tuple[Segment, List[Tuple[int, int]], List[str]]) -> Dict:
+    """Pool task: repair the affected origins' trees with one segment closed"""
+    segment, arcs, origins = task
+    graph, trees = _worker_state
+    closed = set(arcs)
+    sink_station = {sink: station for station, sink in graph.sink_node.items()}
+
+    affected_pairs = disconnected_pairs = 0
+    total_delay = max_delay = 0
+    nodes_repaired = 0
+    for origin in origins:
+        dist, parent = trees[origin]
+        cut_heads = [v for u, v in arcs if parent[v] == u]
+        new_dist = _repair_tree(graph, dist, parent, closed, cut_heads)
+        nodes_repaired += len(new_dist)
+
+        for node, after_cost in new_dist.items():
+            station = sink_station.get(node)
+            if station is None or station == origin or after_cost <= dist[node]:
+                continue
+            if after_cost == INF:
+                disconnected_pairs += 1
+            else:
+                affected_pairs += 1
+                delay = after_cost - dist[node]
+                total_delay += delay
+                max_delay = max(max_delay, delay)
+
+    return {
+        "segment": segment,
+        "affected_pairs": affected_pairs,
+        "disconnected_pairs": disconnected_pairs,
+        "total_delay": total_delay,
+        "average_delay": total_delay / affected_pairs if affected_pairs else 0.0,
+        "max_delay": max_delay,
+        "origins_recomputed": len(origins),
+        "nodes_repaired": nodes_repaired
+    }
+
+
+def analyze_segment_failures(network, workers: Optional[int] = None) -> Dict:
+    """
+    Vulnerability report for closing each segment of a network on its own
+
+    Returns the ranked segment list plus timing and work counters; wall time
+    is reported for the baseline and the closure phase separately.
+    """
+    start_time = time.time()
+    graph = LineStateGraph(network)
+    stations = sorted(graph.source_node)
+    arcs_of = segment_arcs(graph)
+    segment_of_arc = {arc: segment for segment, arcs in arcs_of.items() for arc in arcs}
+
+    # Baseline: one tree per origin, plus which segments its journeys ride
+    trees = {}
+    origins_using = {segment: [] for segment in arcs_of}
+    for origin in stations:
+        dist, parent = graph.shortest_path_tree(graph.source_node[origin])
+        trees[origin] = (dist, parent)
+        used = {segment_of_arc[arc] for arc in _journey_arcs(graph, parent)
+                if arc in segment_of_arc}
+        for segment in used:
+            origins_using[segment].append(origin)
+    baseline_time = time.time() - start_time
+
+    closure_start = time.time()
+    tasks = [(segment, arcs_of[segment], origins_using[segment]) for segment in sorted(arcs_of)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_worker(graph, trees)
+        results = [_evaluate_closure(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(graph, trees)) as pool:
+            results = list(pool.map(_evaluate_closure, tasks, chunksize=4))
+    closure_time = time.time() - closure_start
+
+    results.sort(key=lambda r: (-(r["affected_pairs"] + r["disconnected_pairs"]),
+                                -r["disconnected_pairs"], -r["total_delay"], r["segment"]))
+
+    return {
+        "mode": network.mode,
+        "segments": results,
+        "wall_time": time.time() - start_time,
+        "baseline_time": baseline_time,
+        "closure_time": closure_time,
+        "trees_recomputed": sum(r["origins_recomputed"] for r in results),
+        "nodes_repaired": sum(r["nodes_repaired"] for r in results),
+        "naive_trees": len(tasks) * len(stations),
+        "naive_nodes": len(tasks) * len(stations) * len(graph),
+        "workers": workers
+    }
+
+
+def print_report(report: Dict, top: int = 15):
+    """Print the ranked vulnerability report"""
+    print(f"\n{report['mode'].upper()} network - {len(report['segments'])} segments")
+    print("-" * 80)
+    print(f"Analysis wall time: {report['wall_time']:.3f}s "
+          f"(baseline {report['baseline_time']:.3f}s, closures {report['closure_time']:.3f}s, "
+          f"{report['workers']} worker(s))")
+    print(f"Trees repaired: {report['trees_recomputed']} of {report['naive_trees']} "
+          f"({report['trees_recomputed'] / max(report['naive_trees'], 1) * 100:.1f}%), "
+          f"state nodes re-settled: {report['nodes_repaired']} of {report['naive_nodes']} "
+          f"({report['nodes_repaired'] / max(report['naive_nodes'], 1) * 100:.1f}%)")
+    print()
+    print(f"{'Rank':<5} {'Segment':<42} {'Line':<5} {'Worse':>7} {'Cut':>6} "
+          f"{'Avg +min':>9} {'Max +min':>9}")
+    for rank, result in enumerate(report["segments"][:top], 1):
+        a, b, line = result["segment"]
+        print(f"{rank:<5} {a + ' - ' + b:<42} {line:<5} {result['affected_pairs']:>7} "
+              f"{result['disconnected_pairs']:>6} {result['average_delay']:>9.1f} "
+              f"{result['max_delay']:>9}")
+
+
+def main():
+    """Run the vulnerability analysis for both network modes"""
+    from task1_route_planning import MRTNetwork
+
+    print("Single-Segment Failure Impact Analysis")
+    print("=" * 80)
+
+    for mode in ["today", "future"]:
+        report = analyze_segment_failures(MRTNetwork(mode=mode))
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
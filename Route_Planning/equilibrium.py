@@ -0,0 +1,300 @@
+"""
+Crowding-Feedback Equilibrium Assignment for MRT Route Planner
+User-equilibrium loading of peak-hour OD demand, where riding times grow
+with the load on each segment (Frank-Wolfe or MSA)
+
+All-or-nothing assignment sends everyone down the free-flow fastest path,
+which overloads segments such as Tanah Merah - Expo. Here each iteration
+(1) prices every ride arc of the line-state graph with a BPR-style crowding
+function of its current load, (2) builds shortest-path trees from every
+origin at once with a vectorized Bellman-Ford over an (origins x nodes)
+distance matrix, (3) loads the demand onto those trees, and (4) moves the
+flows towards that all-or-nothing solution by a Frank-Wolfe line search on
+the Beckmann objective (or the MSA step 1/k). Transfers keep their fixed
+penalty. The relative gap measures distance from equilibrium.
+"""
+
+import os
+import tempfile
+import time
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from state_graph import LineStateGraph, LINE, SOURCE
+from trip_assignment import EdgeIndex, TRIP_COLUMNS, DEFAULT_CHUNK_SIZE, minutes_of_day
+
+
+# Indicative passengers per hour per direction (train capacity x trains per hour)
+LINE_CAPACITY = {
+    "EWL": 48000, "NSL": 48000, "NEL": 36000, "CCL": 24000, "DTL": 30000,
+    "TEL": 30000, "CRL": 36000, "BPLRT": 4000, "SPLRT": 4000,
+}
+DEFAULT_CAPACITY = 24000
+
+# The EWL airport branch runs a shuttle at a much lower frequency
+SEGMENT_CAPACITY = {
+    ("Tanah Merah", "Expo", "EWL"): 12000,
+    ("Expo", "Changi Airport", "EWL"): 12000,
+}
+
+# Crowding function: t = t0 * (1 + ALPHA * (load / capacity) ** BETA)
+CROWDING_ALPHA = 0.15
+CROWDING_BETA = 4
+
+DEFAULT_MAX_ITERATIONS = 40
+DEFAULT_GAP_TOLERANCE = 1e-4
+LINE_SEARCH_STEPS = 30
+
+
+def od_matrix_from_trips(path: str, stations, start_minute: float, end_minute: float,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> np.ndarray:
+    """Trips per (origin, destination) station pair within a clock window"""
+    station_id = {station: i for i, station in enumerate(stations)}
+    demand = np.zeros((len(stations), len(stations)))
+    for chunk in pd.read_csv(path, usecols=TRIP_COLUMNS, chunksize=chunk_size,
+                             dtype={"origin": str, "destination": str}):
+        minutes = minutes_of_day(chunk["timestamp"])
+        chunk = chunk[(minutes >= start_minute) & (minutes < end_minute)]
+        origins = chunk["origin"].map(station_id)
+        destinations = chunk["destination"].map(station_id)
+        known = origins.notna() & destinations.notna()
+        np.add.at(demand, (origins[known].to_numpy(dtype=np.int64),
+                           destinations[known].to_numpy(dtype=np.int64)), 1)
+    return demand
+
+
+class EquilibriumAssignment:
+    """
+    Arc arrays of one network's line-state graph and the assignment steps
+
+    capacities: passengers per hour per direction by (from, to, line) edge,
+    defaulting to SEGMENT_CAPACITY, then LINE_CAPACITY
+    """
+
+    def __init__(self, network, capacities: Optional[Dict] = None,
+                 alpha: float = CROWDING_ALPHA, beta: float = CROWDING_BETA):
+        self.network = network
+        self.graph = graph = LineStateGraph(network)
+        self.index = EdgeIndex(network)
+        self.alpha = alpha
+        self.beta = beta
+        capacities = {**SEGMENT_CAPACITY, **(capacities or {})}
+
+        tails, heads, free, capacity, edges = [], [], [], [], []
+        for u in range(len(graph)):
+            for v, weight in graph.forward[u]:
+                tails.append(u)
+                heads.append(v)
+                free.append(weight)
+                if graph.is_ride_arc(u, v):
+                    key = (graph.node_station[u], graph.node_station[v], graph.node_line[u])
+                    capacity.append(capacities.get(key, LINE_CAPACITY.get(key[2], DEFAULT_CAPACITY)))
+                    edges.append(self.index.edge_id[key])
+                else:
+                    capacity.append(np.inf)  # transfers and entry/exit arcs never crowd
+                    edges.append(-1)
+
+        # Arcs sorted by head so per-node minima are one reduceat
+        order = np.argsort(heads, kind="stable")
+        self.tail = np.array(tails, dtype=np.int64)[order]
+        self.head = np.array(heads, dtype=np.int64)[order]
+        self.free = np.array(free, dtype=np.float64)[order]
+        self.capacity = np.array(capacity, dtype=np.float64)[order]
+        self.edge = np.array(edges, dtype=np.int64)[order]
+        self.ride = self.edge >= 0
+        self.head_nodes, self.head_starts = np.unique(self.head, return_index=True)
+
+        # Stations that can originate/receive trips, as rows/columns of the demand
+        self.stations = sorted(graph.source_node)
+        self.sources = np.array([graph.source_node[s] for s in self.stations], dtype=np.int64)
+        self.sinks = np.array([graph.sink_node[s] for s in self.stations], dtype=np.int64)
+        # Sinks before line nodes before sources at equal distance (children first)
+        self.kind_rank = np.array([0 if kind == SOURCE else 1 if kind == LINE else 2
+                                   for kind in graph.node_kind], dtype=np.int64)
+
+    def arc_costs(self, flows: np.ndarray) -> np.ndarray:
+        """Crowded travel time of every arc at the given arc flows"""
+        ratio = np.where(self.ride, flows / self.capacity, 0.0)
+        return self.free * (1.0 + self.alpha * ratio ** self.beta)
+
+    def objective(self, flows: np.ndarray) -> float:
+        """Beckmann objective: the sum of each arc's cost integrated up to its flow"""
+        ratio = np.where(self.ride, flows / self.capacity, 0.0)
+        integral = flows + self.alpha * np.where(self.ride, flows * ratio ** self.beta, 0.0) / (self.beta + 1)
+        return float(self.free @ integral)
+
+    def shortest_trees(self, costs: np.ndarray):
+        """
+        Shortest-path trees from every origin at once
+
+        Returns (dist, parent_arc), both (origins x nodes); parent_arc is the
+        arc index entering each node in its origin's tree (len(arcs) if none).
+        """
+        origins = len(self.sources)
+        dist = np.full((origins, len(self.graph)), np.inf)
+        dist[np.arange(origins), self.sources] = 0.0
+        for _ in range(len(self.graph)):
+            candidates = dist[:, self.tail] + costs
+            best = np.minimum.reduceat(candidates, self.head_starts, axis=1)
+            improved = np.minimum(dist[:, self.head_nodes], best)
+            if np.array_equal(improved, dist[:, self.head_nodes]):
+                break
+            dist[:, self.head_nodes] = improved
+
+        arcs = len(self.tail)
+        candidates = dist[:, self.tail] + costs
+        tight = (candidates == dist[:, self.head]) & np.isfinite(candidates)
+        arc_ids = np.where(tight, np.arange(arcs), arcs)
+        parent_arc = np.full(dist.shape, arcs, dtype=np.int64)
+        parent_arc[:, self.head_nodes] = np.minimum.reduceat(arc_ids, self.head_starts, axis=1)
+        parent_arc[np.arange(origins), self.sources] = arcs
+        return dist, parent_arc
+
+    def all_or_nothing(self, costs: np.ndarray, demand: np.ndarray) -> np.ndarray:
+        """Arc flows when every OD pair takes its shortest path under costs"""
+        dist, parent_arc = self.shortest_trees(costs)
+        origins = np.arange(len(self.sources))
+        arcs = len(self.tail)
+
+        # Demand enters at each destination's sink and is pushed up the tree,
+        # children before parents, so each node ends up holding its subtree total
+        carried = np.zeros(dist.shape)
+        carried[:, self.sinks] = demand
+        order = np.lexsort((np.broadcast_to(self.kind_rank, dist.shape), dist), axis=1)
+        for column in range(order.shape[1] - 1, -1, -1):
+            nodes = order[:, column]
+            parents = parent_arc[origins, nodes]
+            has_parent = parents < arcs
+            rows = origins[has_parent]
+            carried[rows, self.tail[parents[has_parent]]] += carried[rows, nodes[has_parent]]
+
+        on_tree = parent_arc < arcs
+        return np.bincount(parent_arc[on_tree], weights=carried[on_tree], minlength=arcs)
+
+    def _line_search(self, flows: np.ndarray, direction: np.ndarray) -> float:
+        """Step in [0, 1] minimising the Beckmann objective (bisection on its slope)"""
+        low, high = 0.0, 1.0
+        if self.arc_costs(flows + direction) @ direction <= 0:
+            return 1.0
+        for _ in range(LINE_SEARCH_STEPS):
+            middle = (low + high) / 2
+            if self.arc_costs(flows + middle * direction) @ direction > 0:
+                high = middle
+            else:
+                low = middle
+        return (low + high) / 2
+
+    def solve(self, demand: np.ndarray, method: str = "fw",
+              max_iterations: int = DEFAULT_MAX_ITERATIONS,
+              gap_tolerance: float = DEFAULT_GAP_TOLERANCE) -> Dict:
+        """
+        User-equilibrium arc flows for a (stations x stations) demand matrix
+
+        method: "fw" (Frank-Wolfe line search) or "msa" (step 1/k)
+        Stops when the relative gap drops below gap_tolerance.
+        """
+        if method not in ("fw", "msa"):
+            raise ValueError(f"Unknown method: {method}")
+        start_time = time.time()
+        flows = self.all_or_nothing(self.free, demand)
+        free_flow = flows.copy()
+        history = []
+        for iteration in range(1, max_iterations + 1):
+            iteration_start = time.time()
+            costs = self.arc_costs(flows)
+            target = self.all_or_nothing(costs, demand)
+            total = float(costs @ flows)
+            gap = (total - float(costs @ target)) / total if total else 0.0
+            if gap < gap_tolerance:
+                history.append({"iteration": iteration, "gap": gap, "step": 0.0,
+                                "travel_time": total, "objective": self.objective(flows),
+                                "runtime": time.time() - iteration_start})
+                break
+            direction = target - flows
+            step = self._line_search(flows, direction) if method == "fw" else 1.0 / (iteration + 1)
+            flows = flows + step * direction
+            history.append({"iteration": iteration, "gap": gap, "step": step,
+                            "travel_time": total, "objective": self.objective(flows),
+                            "runtime": time.time() - iteration_start})
+
+        return {
+            "mode": self.network.mode,
+            "method": method,
+            "flows": flows,
+            "free_flow": free_flow,
+            "history": history,
+            "gap": history[-1]["gap"],
+            "iterations": len(history),
+            "trips": float(demand.sum()),
+            "runtime": time.time() - start_time
+        }
+
+    def edge_table(self, flows: np.ndarray) -> pd.DataFrame:
+        """Load, capacity, volume/capacity and crowded time per directed segment"""
+        ride = self.ride
+        costs = self.arc_costs(flows)
+        table = pd.DataFrame([self.index.edges[e] for e in self.edge[ride]],
+                             columns=["from_station", "to_station", "line"])
+        table["load"] = flows[ride]
+        table["capacity"] = self.capacity[ride]
+        table["vc_ratio"] = flows[ride] / self.capacity[ride]
+        table["free_time"] = self.free[ride]
+        table["crowded_time"] = costs[ride]
+        return table.sort_values("vc_ratio", ascending=False, kind="stable").reset_index(drop=True)
+
+
+def main():
+    """Peak-hour equilibrium for both modes from the synthetic trip log"""
+    from task1_route_planning import MRTNetwork
+    from trip_assignment import generate_trip_log
+
+    print("Crowding-Feedback Equilibrium Assignment (Frank-Wolfe / MSA)")
+    print("=" * 80)
+
+    path = os.path.join(tempfile.gettempdir(), "mrt_synthetic_trips.csv")
+    if not os.path.exists(path):
+        generate_trip_log(path, MRTNetwork(mode="future").available_stations)
+    window = (7 * 60 + 30, 8 * 60 + 30)
+    demand_scale = 6  # the synthetic log holds about a sixth of a weekday's trips
+    watched = [("Tanah Merah", "Expo"), ("Expo", "Changi Airport")]
+
+    for mode in ["today", "future"]:
+        network = MRTNetwork(mode=mode)
+        start_time = time.time()
+        model = EquilibriumAssignment(network)
+        demand = od_matrix_from_trips(path, model.stations, *window) * demand_scale
+        setup_time = time.time() - start_time
+
+        print(f"\n{mode.upper()} network - {demand.sum():,.0f} trips 07:30-08:30, "
+              f"{len(model.tail)} arcs, setup {setup_time:.2f} s")
+        print("-" * 80)
+        for method in ["fw", "msa"]:
+            result = model.solve(demand, method=method)
+            per_iteration = np.mean([h["runtime"] for h in result["history"]]) * 1000
+            gaps = " ".join(f"{h['gap']:.1e}" for h in result["history"][:6])
+            print(f"  {method.upper():<4} {result['iterations']:>3} iterations, final gap "
+                  f"{result['gap']:.2e}, {per_iteration:.0f} ms/iteration, "
+                  f"{result['runtime']:.2f} s (gaps: {gaps} ...)")
+
+        result = model.solve(demand, method="fw")
+        aon = model.edge_table(result["free_flow"]).set_index(["from_station", "to_station"]).sort_index()
+        table = model.edge_table(result["flows"])
+        print(f"\n  {'Segment':<34} {'Line':<5} {'AON v/c':>8} {'UE v/c':>7} {'UE load':>8} "
+              f"{'Minutes':>8}")
+        shown = table.head(6)
+        keyed = table.set_index(["from_station", "to_station"]).sort_index()
+        for a, b in watched:
+            if (a, b) in keyed.index and not ((shown["from_station"] == a) & (shown["to_station"] == b)).any():
+                shown = pd.concat([shown, keyed.loc[[(a, b)]].reset_index()])
+        for row in shown.itertuples():
+            before = aon.loc[(row.from_station, row.to_station), "vc_ratio"]
+            before = float(np.max(before))
+            print(f"  {row.from_station + ' -> ' + row.to_station:<34} {row.line:<5} "
+                  f"{before:>8.2f} {row.vc_ratio:>7.2f} {row.load:>8,.0f} "
+                  f"{row.free_time:>3.0f}->{row.crowded_time:<4.1f}")
+
+
+if __name__ == "__main__":
+    main()
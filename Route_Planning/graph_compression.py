@@ -0,0 +1,277 @@
+"""
+Degree-2 Chain Contraction for MRT Route Planner
+Collapses simple single-line runs of stations into express edges between
+interchanges and termini, so searches only explore the interchange skeleton
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from mrt_network_data import TRANSFER_PENALTY_MINUTES
+
+
+class CompressedNetwork:
+    """
+    Compressed view of an MRTNetwork
+
+    A station is kept in the skeleton unless it has exactly two connections
+    on the same line. Every maximal run of non-kept stations between two
+    skeleton stations becomes one express edge with the summed travel time.
+    Each chain keeps its station list and cumulative offsets, so origins and
+    destinations inside a chain can be attached at query time and express
+    edges can be expanded back into full station lists.
+    """
+
+    def __init__(self, network):
+        self.network = network
+        self.mode = network.mode
+        self.graph = {}    # skeleton adjacency: {station: [(neighbor, time, line)]}
+        self.chains = []   # [{'line', 'stations', 'offsets'}]
+        self.chain_of = {}  # interior station -> (chain id, index in chain)
+        self.express = {}  # (u, v) -> [station list u..v], cheapest first
+        self._build()
+
+        self.stations = set(self.graph.keys())
+        self.coordinates = network.coordinates
+
+    def _is_chain_interior(self, station: str) -> bool:
+        """True for stations with exactly two connections on one line"""
+        neighbors = self.network.get_neighbors(station)
+        return (len(neighbors) == 2
+                and neighbors[0][2] == neighbors[1][2]
+                and neighbors[0][0] != neighbors[1][0])
+
+    def _build(self):
+        """Walk out from every skeleton station along each incident edge"""
+        network = self.network
+        skeleton = {s for s in network.graph if not self._is_chain_interior(s)}
+
+        # A loop made only of interior stations still needs one anchor
+        for station in sorted(network.graph):
+            if station in skeleton or station in self.chain_of:
+                continue
+            if not self._reaches_skeleton(station, skeleton):
+                skeleton.add(station)
+
+        seen_chains = set()
+        for station in sorted(skeleton):
+            self.graph.setdefault(station, [])
+            for first_hop, travel_time, line in network.get_neighbors(station):
+                stations = [station, first_hop]
+                offsets = [0, travel_time]
+                previous, current = station, first_hop
+
+                while current not in skeleton:
+                    (a, ta, _), (b, tb, _) = network.get_neighbors(current)
+                    next_station, hop_time = (b, tb) if a == previous else (a, ta)
+                    previous, current = current, next_station
+                    stations.append(current)
+                    offsets.append(offsets[-1] + hop_time)
+
+                # Each chain is found once from each end; keep one copy
+                key = (line, tuple(stations)) if stations[0] <= stations[-1] \
+                    else (line, tuple(reversed(stations)))
+                if key in seen_chains:
+                    continue
+                seen_chains.add(key)
+                self._add_chain(line, stations, offsets)
+
+        # Cheapest parallel edge first, matching how get_cost picks edges
+        for station in self.graph:
+            self.graph[station].sort(key=lambda edge: (edge[1], edge[2], edge[0]))
+        for segments in self.express.values():
+            segments.sort(key=lambda segment: segment[0])
+
+    def _reaches_skeleton(self, station: str, skeleton: set) -> bool:
+        """Check whether the chain through an interior station ends at a skeleton station"""
+        previous, current = None, station
+        while True:
+            neighbors = self.network.get_neighbors(current)
+            next_station = neighbors[0][0] if neighbors[0][0] != previous else neighbors[1][0]
+            if next_station in skeleton:
+                return True
+            if next_station == station:
+                return False
+            previous, current = current, next_station
+
+    def _add_chain(self, line: str, stations: List[str], offsets: List[int]):
+        """Record a chain and its express edge"""
+        chain_id = len(self.chains)
+        self.chains.append({'line': line, 'stations': stations, 'offsets': offsets})
+        for index in range(1, len(stations) - 1):
+            self.chain_of[stations[index]] = (chain_id, index)
+
+        u, v, total = stations[0], stations[-1], offsets[-1]
+        if u == v:
+            return  # loop back to the same skeleton station; never on a shortest path
+
+        self.graph.setdefault(u, []).append((v, total, line))
+        self.graph.setdefault(v, []).append((u, total, line))
+        self.express.setdefault((u, v), []).append((total, stations))
+        self.express.setdefault((v, u), []).append((total, list(reversed(stations))))
+
+    def attach(self, start: str, goal: str) -> "AttachedView":
+        """Build a per-query view with start and goal attached to the skeleton"""
+        return AttachedView(self, [start, goal])
+
+    def expand_path(self, path: Optional[List[str]],
+                    segments: Optional[Dict] = None) -> Optional[List[str]]:
+        """Expand a skeleton path back into the full station list"""
+        if not path:
+            return path
+
+        full_path = [path[0]]
+        for u, v in zip(path, path[1:]):
+            if segments and (u, v) in segments:
+                stations = segments[(u, v)]
+            elif (u, v) in self.express:
+                stations = self.express[(u, v)][0][1]
+            else:
+                stations = [u, v]
+            full_path.extend(stations[1:])
+        return full_path
+
+    def compression_stats(self) -> Dict:
+        """Size of the skeleton compared with the full network"""
+        full_edges = sum(len(edges) for edges in self.network.graph.values()) // 2
+        skeleton_edges = sum(len(edges) for edges in self.graph.values()) // 2
+        return {
+            "stations": len(self.network.graph),
+            "skeleton_stations": len(self.graph),
+            "edges": full_edges,
+            "skeleton_edges": skeleton_edges,
+            "chains": len(self.chains),
+            "interior_stations": len(self.chain_of)
+        }
+
+
+class AttachedView:
+    """
+    Skeleton graph plus query endpoints that lie inside chains
+
+    Exposes the same interface the search engines use on MRTNetwork
+    (graph, stations, get_neighbors, get_cost, heuristic), so any engine
+    in SearchAlgorithms can run on it unchanged.
+    """
+
+    def __init__(self, compressed: CompressedNetwork, endpoints: List[str]):
+        self.compressed = compressed
+        self.network = compressed.network
+        self.mode = compressed.mode
+        self.coordinates = compressed.coordinates
+        self.graph = dict(compressed.graph)
+        self.segments = {}  # (u, v) -> station list for attachment edges
+
+        attached = {}
+        for station in endpoints:
+            if station in compressed.chain_of and station not in attached:
+                attached[station] = compressed.chain_of[station]
+
+        for station, (chain_id, index) in attached.items():
+            chain = compressed.chains[chain_id]
+            stations, offsets = chain['stations'], chain['offsets']
+            to_start = (stations[0], offsets[index], list(reversed(stations[:index + 1])))
+            to_end = (stations[-1], offsets[-1] - offsets[index], stations[index:])
+            if stations[0] == stations[-1]:
+                # Loop chain: both ends are the same station, keep the shorter way
+                links = [min(to_start, to_end, key=lambda link: link[1])]
+            else:
+                links = [to_start, to_end]
+            for end, travel_time, segment in links:
+                self._link(station, end, travel_time, chain['line'], segment)
+
+        # Both endpoints inside the same chain: connect them directly too
+        if len(attached) == 2:
+            (a, (chain_a, i)), (b, (chain_b, j)) = attached.items()
+            if chain_a == chain_b:
+                chain = compressed.chains[chain_a]
+                stations, offsets = chain['stations'], chain['offsets']
+                segment = stations[i:j + 1] if i < j else list(reversed(stations[j:i + 1]))
+                self._link(a, b, abs(offsets[j] - offsets[i]), chain['line'], segment)
+
+        self.stations = set(self.graph.keys())
+
+    def _link(self, u: str, v: str, travel_time: int, line: str, stations: List[str]):
+        """Add an attachment edge u-v covering the given station run"""
+        # Copy-on-write so the shared skeleton lists are never mutated;
+        # keep the cheapest parallel edge first, as in the skeleton
+        for a, b in ((u, v), (v, u)):
+            edges = list(self.graph.get(a, [])) + [(b, travel_time, line)]
+            edges.sort(key=lambda edge: (edge[1], edge[2], edge[0]))
+            self.graph[a] = edges
+        self.segments[(u, v)] = stations
+        self.segments[(v, u)] = list(reversed(stations))
+
+    def get_neighbors(self, station: str) -> List[Tuple[str, int, str]]:
+        """Get neighbors of a station in the attached skeleton"""
+        return self.graph.get(station, [])
+
+    def get_cost(self, current: str, neighbor: str, current_line: str = None,
+                 crowding_penalty: float = 0) -> float:
+        """Same cost model as MRTNetwork.get_cost, over skeleton edges"""
+        for next_station, travel_time, line in self.get_neighbors(current):
+            if next_station == neighbor:
+                cost = travel_time
+                if current_line and line != current_line:
+                    cost += TRANSFER_PENALTY_MINUTES
+                return cost + crowding_penalty
+
+        return float('inf')
+
+    def heuristic(self, station1: str, station2: str) -> float:
+        """Straight-line heuristic from the full network"""
+        return self.network.heuristic(station1, station2)
+
+    def is_station_available(self, station: str) -> bool:
+        """Check if a station is available in the underlying network"""
+        return self.network.is_station_available(station)
+
+    def expand_path(self, path: Optional[List[str]]) -> Optional[List[str]]:
+        """Expand a path found on this view into full station lists"""
+        return self.compressed.expand_path(path, self.segments)
+
+
+def main():
+    """Compare searches on the full network and on the compressed skeleton"""
+    import time
+    from task1_route_planning import MRTNetwork, SearchAlgorithms, COMPRESSIBLE_ENGINES
+    from mrt_network_data import TEST_PAIRS_TODAY, TEST_PAIRS_FUTURE
+
+    print("Degree-2 Chain Contraction")
+    print("=" * 80)
+
+    for mode in ["today", "future"]:
+        network = MRTNetwork(mode=mode)
+        searcher = SearchAlgorithms(network)
+        stats = searcher.get_compressed_network().compression_stats()
+
+        print(f"\n{mode.upper()} network")
+        print("-" * 80)
+        print(f"  Stations: {stats['stations']} -> skeleton {stats['skeleton_stations']}")
+        print(f"  Edges:    {stats['edges']} -> skeleton {stats['skeleton_edges']} "
+              f"({stats['chains']} chains, {stats['interior_stations']} interior stations)")
+
+        test_pairs = TEST_PAIRS_TODAY if mode == "today" else TEST_PAIRS_FUTURE
+        test_pairs = [(o, d) for o, d in test_pairs
+                      if o in network.stations and d in network.stations]
+
+        for algorithm in COMPRESSIBLE_ENGINES:
+            full_nodes = compressed_nodes = 0
+            full_time = compressed_time = 0.0
+            for origin, destination in test_pairs:
+                start_time = time.time()
+                _, full_stats = getattr(searcher, algorithm)(origin, destination)
+                full_time += time.time() - start_time
+
+                start_time = time.time()
+                _, compressed_stats = searcher.run_compressed(algorithm, origin, destination)
+                compressed_time += time.time() - start_time
+
+                full_nodes += full_stats.get("nodes_expanded", 0)
+                compressed_nodes += compressed_stats.get("nodes_expanded", 0)
+
+            print(f"  {algorithm.upper():<6} nodes expanded {full_nodes:>5} -> {compressed_nodes:>4}, "
+                  f"runtime {full_time * 1000:.3f} ms -> {compressed_time * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+All-Pairs Hop-Count Matrix for MRT Networks
+Level-synchronous multi-source BFS with bit-parallel frontiers
+
+Every station is a BFS source. Each station holds a bitset of the sources
+that have reached it, packed 64 sources per uint64 word, and one BFS level
+for all sources at once is a gather of neighbor bitsets followed by an OR
+reduction per station. Levels run until no frontier bit changes.
+"""
+
+import time
+from collections import deque
+from typing import List, Tuple
+
+import numpy as np
+
+
+UNREACHABLE = -1
+WORD_BITS = 64
+
+
+def build_csr(network) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Sparse (CSR) adjacency of the network over sorted station indices"""
+    stations = sorted(network.stations)
+    index = {station: i for i, station in enumerate(stations)}
+
+    indptr = [0]
+    indices = []
+    for station in stations:
+        neighbors = sorted({index[n] for n, _, _ in network.get_neighbors(station)})
+        indices.extend(neighbors)
+        indptr.append(len(indices))
+
+    return stations, np.array(indptr, dtype=np.int64), np.array(indices, dtype=np.int64)
+
+
+def all_pairs_hop_counts(network) -> Tuple[List[str], np.ndarray]:
+    """
+    Hop counts between every pair of stations
+
+    Returns (stations, matrix) where matrix[i, j] is the number of hops from
+    stations[i] to stations[j], or UNREACHABLE (-1) if there is no path.
+    """
+    stations, indptr, indices = build_csr(network)
+    n = len(stations)
+    words = (n + WORD_BITS - 1) // WORD_BITS
+
+    hops = np.full((n, n), UNREACHABLE, dtype=np.int32)
+    if n == 0:
+        return stations, hops
+
+    # seen[v] = bitset of sources that have reached station v; source i starts at i
+    seen = np.zeros((n, words), dtype=np.uint64)
+    ids = np.arange(n)
+    seen[ids, ids // WORD_BITS] = np.left_shift(np.uint64(1), (ids % WORD_BITS).astype(np.uint64))
+    hops[ids, ids] = 0
+    frontier = seen.copy()
+
+    degree = np.diff(indptr)
+    has_neighbors = degree > 0
+    segment_starts = indptr[:-1][has_neighbors]
+
+    level = 0
+    while True:
+        level += 1
+
+        # OR together the frontier bitsets of each station's neighbors
+        reached = np.zeros_like(frontier)
+        if len(indices):
+            reached[has_neighbors] = np.bitwise_or.reduceat(frontier[indices], segment_starts, axis=0)
+        new_bits = reached & ~seen
+        active = np.flatnonzero(new_bits.any(axis=1))
+        if len(active) == 0:
+            break
+
+        seen[active] |= new_bits[active]
+        frontier = new_bits
+
+        # Decode only the non-zero words: bit b of word w in row v means
+        # source 64*w + b first reaches station v at this level
+        rows, word_ids = np.nonzero(new_bits)
+        bits = np.unpackbits(new_bits[rows, word_ids].view(np.uint8).reshape(-1, 8),
+                             axis=1, bitorder='little')
+        word_rows, bit_ids = np.nonzero(bits)
+        hops[word_ids[word_rows] * WORD_BITS + bit_ids, rows[word_rows]] = level
+
+    return stations, hops
+
+
+def per_source_bfs_hop_counts(network) -> Tuple[List[str], np.ndarray]:
+    """Reference implementation: one plain BFS per source station"""
+    stations = sorted(network.stations)
+    index = {station: i for i, station in enumerate(stations)}
+    hops = np.full((len(stations), len(stations)), UNREACHABLE, dtype=np.int32)
+
+    for source in stations:
+        row = hops[index[source]]
+        row[index[source]] = 0
+        queue = deque([source])
+        while queue:
+            current = queue.popleft()
+            for neighbor, _, _ in network.get_neighbors(current):
+                if row[index[neighbor]] == UNREACHABLE:
+                    row[index[neighbor]] = row[index[current]] + 1
+                    queue.append(neighbor)
+
+    return stations, hops
+
+
+def connectivity_summary(hops: np.ndarray) -> dict:
+    """Summary statistics of a hop-count matrix"""
+    n = hops.shape[0]
+    off_diagonal = ~np.eye(n, dtype=bool)
+    reachable = (hops != UNREACHABLE) & off_diagonal
+    values = hops[reachable]
+    return {
+        "stations": n,
+        "reachable_pairs": int(reachable.sum()),
+        "unreachable_pairs": int((~reachable & off_diagonal).sum()),
+        "diameter": int(values.max()) if values.size else 0,
+        "average_hops": float(values.mean()) if values.size else 0.0
+    }
+
+
+def main():
+    """Compute hop matrices for both modes and compare with per-source BFS"""
+    from task1_route_planning import MRTNetwork
+    from synthetic_network import SyntheticGridNetwork
+
+    print("All-Pairs Hop-Count Matrix (bit-parallel multi-source BFS)")
+    print("=" * 80)
+
+    networks = [(mode.upper(), MRTNetwork(mode=mode)) for mode in ["today", "future"]]
+    networks.append(("SYNTHETIC 40x40", SyntheticGridNetwork(rows=40, cols=40)))
+
+    for label, network in networks:
+        start_time = time.time()
+        _, hops = all_pairs_hop_counts(network)
+        parallel_time = time.time() - start_time
+
+        start_time = time.time()
+        _, reference = per_source_bfs_hop_counts(network)
+        reference_time = time.time() - start_time
+
+        summary = connectivity_summary(hops)
+        print(f"\n{label} network")
+        print("-" * 80)
+        print(f"  Stations: {summary['stations']}, diameter {summary['diameter']} hops, "
+              f"average {summary['average_hops']:.2f} hops")
+        print(f"  Unreachable pairs: {summary['unreachable_pairs']}")
+        print(f"  Bit-parallel BFS:  {parallel_time * 1000:.1f} ms")
+        print(f"  {summary['stations']} separate BFS: {reference_time * 1000:.1f} ms "
+              f"({reference_time / parallel_time:.1f}x slower)")
+        print(f"  Matrices match: {np.array_equal(hops, reference)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""
+Hub Labeling Distance Oracle for MRT Route Planner
+Pruned landmark labeling (2-hop cover) over the line-expanded network graph
+
+Every node stores a label of (hub, distance) pairs sorted by hub rank.
+The exact travel time from s to t is the minimum of d(s, h) + d(h, t) over
+hubs h common to the out-label of s and the in-label of t, found with a
+single merge-join of two small sorted arrays.
+"""
+
+import heapq
+import json
+import time
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from state_graph import LineStateGraph, LINE
+
+
+INF = float('inf')
+LABEL_TYPECODE = 'l'
+
+
+class HubLabeling:
+    """Exact distance oracle built with pruned landmark labeling"""
+
+    def __init__(self, network, build: bool = True):
+        self.network = network
+        self.state_graph = LineStateGraph(network)
+        self.build_time = 0.0
+        self.entries_scanned = 0  # label entries read by merge-joins so far
+
+        # Flat label storage: entries of node v live in [offsets[v], offsets[v+1])
+        # and are sorted by hub rank
+        self.out_offsets = array(LABEL_TYPECODE)
+        self.out_hubs = array(LABEL_TYPECODE)
+        self.out_dists = array(LABEL_TYPECODE)
+        self.in_offsets = array(LABEL_TYPECODE)
+        self.in_hubs = array(LABEL_TYPECODE)
+        self.in_dists = array(LABEL_TYPECODE)
+
+        if build:
+            self.build()
+
+    def _hub_order(self) -> List[int]:
+        """Order nodes by importance: well-connected line nodes first"""
+        graph = self.state_graph
+        return sorted(
+            range(len(graph)),
+            key=lambda v: (graph.node_kind[v] != LINE,
+                           -(len(graph.forward[v]) + len(graph.backward[v])),
+                           graph.node_key(v))
+        )
+
+    def build(self):
+        """Run the pruned Dijkstra passes and flatten labels into arrays"""
+        start_time = time.time()
+        graph = self.state_graph
+        n = len(graph)
+
+        # Working labels as per-node lists; hubs are appended in rank order,
+        # so every list stays sorted by rank without extra work
+        out_labels = [[] for _ in range(n)]
+        in_labels = [[] for _ in range(n)]
+        hub_dist = [INF] * n  # scratch: distances of the current hub's label
+
+        for rank, hub in enumerate(self._hub_order()):
+            # Forward pass: hub -> v distances go into in-labels
+            self._pruned_dijkstra(hub, rank, graph.forward,
+                                  out_labels[hub], in_labels, hub_dist)
+            # Backward pass: v -> hub distances go into out-labels
+            self._pruned_dijkstra(hub, rank, graph.backward,
+                                  in_labels[hub], out_labels, hub_dist)
+
+        self.out_offsets, self.out_hubs, self.out_dists = self._flatten(out_labels)
+        self.in_offsets, self.in_hubs, self.in_dists = self._flatten(in_labels)
+        self.build_time = time.time() - start_time
+
+    @staticmethod
+    def _pruned_dijkstra(hub: int, rank: int, adjacency: List, hub_label: List,
+                         target_labels: List, hub_dist: List):
+        """
+        Dijkstra from hub that stops expanding any node already covered by
+        previously added hubs at an equal or shorter distance
+        """
+        for other_rank, d in hub_label:
+            hub_dist[other_rank] = d
+
+        dist = {hub: 0}
+        frontier = [(0, hub)]
+        while frontier:
+            d, v = heapq.heappop(frontier)
+            if d > dist[v]:
+                continue
+
+            # Prune if existing labels already certify a distance <= d
+            covered = False
+            for other_rank, other_d in target_labels[v]:
+                if hub_dist[other_rank] + other_d <= d:
+                    covered = True
+                    break
+            if covered:
+                continue
+
+            target_labels[v].append((rank, d))
+
+            for neighbor, weight in adjacency[v]:
+                nd = d + weight
+                if nd < dist.get(neighbor, INF):
+                    dist[neighbor] = nd
+                    heapq.heappush(frontier, (nd, neighbor))
+
+        for other_rank, _ in hub_label:
+            hub_dist[other_rank] = INF
+
+    @staticmethod
+    def _flatten(labels: List[List[Tuple[int, int]]]) -> Tuple[array, array, array]:
+        """Pack per-node label lists into offset/hub/distance arrays"""
+        offsets = array(LABEL_TYPECODE, [0])
+        hubs = array(LABEL_TYPECODE)
+        dists = array(LABEL_TYPECODE)
+        for label in labels:
+            for hub_rank, d in label:
+                hubs.append(hub_rank)
+                dists.append(d)
+            offsets.append(len(hubs))
+        return offsets, hubs, dists
+
+    def _merge_join(self, out_node: int, in_node: int) -> float:
+        """Distance out_node -> in_node from a merge-join of their labels"""
+        out_hubs, out_dists = self.out_hubs, self.out_dists
+        in_hubs, in_dists = self.in_hubs, self.in_dists
+
+        i, i_end = self.out_offsets[out_node], self.out_offsets[out_node + 1]
+        j, j_end = self.in_offsets[in_node], self.in_offsets[in_node + 1]
+
+        best = INF
+        while i < i_end and j < j_end:
+            hub_i = out_hubs[i]
+            hub_j = in_hubs[j]
+            if hub_i == hub_j:
+                d = out_dists[i] + in_dists[j]
+                if d < best:
+                    best = d
+                i += 1
+                j += 1
+            elif hub_i < hub_j:
+                i += 1
+            else:
+                j += 1
+        self.entries_scanned += (i - self.out_offsets[out_node]) + (j - self.in_offsets[in_node])
+        return best
+
+    def query(self, start: str, goal: str) -> float:
+        """Exact travel time from start to goal (inf if unreachable)"""
+        graph = self.state_graph
+        if start not in graph.source_node or goal not in graph.sink_node:
+            return INF
+        if start == goal:
+            return 0
+        return self._merge_join(graph.source_node[start], graph.sink_node[goal])
+
+    def query_batch(self, pairs: List[Tuple[str, str]]) -> List[float]:
+        """Exact travel times for many (start, goal) pairs"""
+        return [self.query(start, goal) for start, goal in pairs]
+
+    def path(self, start: str, goal: str) -> Optional[List[str]]:
+        """
+        Recover a shortest station path by walking arcs that keep the
+        remaining label distance tight
+        """
+        graph = self.state_graph
+        remaining = self.query(start, goal)
+        if remaining == INF:
+            return None
+        if start == goal:
+            return [start]
+
+        sink = graph.sink_node[goal]
+        node = graph.source_node[start]
+        node_path = [node]
+        while node != sink:
+            for neighbor, weight in graph.forward[node]:
+                rest = 0 if neighbor == sink else self._merge_join(neighbor, sink)
+                if weight + rest == remaining:
+                    node = neighbor
+                    remaining = rest
+                    node_path.append(node)
+                    break
+            else:
+                return None  # labels inconsistent with the graph
+
+        return graph.stations_on_path(node_path)
+
+    def label_stats(self) -> Dict:
+        """Label size statistics"""
+        n = len(self.state_graph)
+        out_sizes = [self.out_offsets[v + 1] - self.out_offsets[v] for v in range(n)]
+        in_sizes = [self.in_offsets[v + 1] - self.in_offsets[v] for v in range(n)]
+        total_entries = len(self.out_hubs) + len(self.in_hubs)
+        item_size = self.out_hubs.itemsize
+
+        return {
+            "nodes": n,
+            "stations": len(self.state_graph.source_node),
+            "total_entries": total_entries,
+            "avg_out_label": sum(out_sizes) / n if n else 0,
+            "avg_in_label": sum(in_sizes) / n if n else 0,
+            "max_out_label": max(out_sizes, default=0),
+            "max_in_label": max(in_sizes, default=0),
+            "memory_bytes": (total_entries * 2 + (n + 1) * 2) * item_size,
+            "build_time": self.build_time
+        }
+
+    def save(self, filename: str):
+        """Persist labels to a JSON file"""
+        graph = self.state_graph
+        data = {
+            "mode": self.network.mode,
+            "transfer_penalty": graph.transfer_penalty,
+            "nodes": [list(graph.node_key(v)) for v in range(len(graph))],
+            "out_offsets": self.out_offsets.tolist(),
+            "out_hubs": self.out_hubs.tolist(),
+            "out_dists": self.out_dists.tolist(),
+            "in_offsets": self.in_offsets.tolist(),
+            "in_hubs": self.in_hubs.tolist(),
+            "in_dists": self.in_dists.tolist(),
+            "build_time": self.build_time
+        }
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, filename: str, network) -> "HubLabeling":
+        """Load labels saved for the same network; raises ValueError on mismatch"""
+        with open(filename, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        labeling = cls(network, build=False)
+        graph = labeling.state_graph
+        nodes = [list(graph.node_key(v)) for v in range(len(graph))]
+        if (data["mode"] != network.mode or data["nodes"] != nodes
+                or data["transfer_penalty"] != graph.transfer_penalty):
+            raise ValueError(f"Hub labels in {filename} do not match the {network.mode} network")
+
+        for name in ("out_offsets", "out_hubs", "out_dists",
+                     "in_offsets", "in_hubs", "in_dists"):
+            setattr(labeling, name, array(LABEL_TYPECODE, data[name]))
+        labeling.build_time = data["build_time"]
+        return labeling
+
+
+def main():
+    """Build labels for both modes and compare query speed with A*"""
+    from task1_route_planning import MRTNetwork, SearchAlgorithms
+
+    print("Hub Labeling Distance Oracle")
+    print("=" * 80)
+
+    for mode in ["today", "future"]:
+        network = MRTNetwork(mode=mode)
+        labeling = HubLabeling(network)
+        stats = labeling.label_stats()
+
+        print(f"\n{mode.upper()} network")
+        print("-" * 80)
+        print(f"  State nodes: {stats['nodes']} ({stats['stations']} stations)")
+        print(f"  Label entries: {stats['total_entries']} "
+              f"(avg out {stats['avg_out_label']:.1f}, avg in {stats['avg_in_label']:.1f}, "
+              f"max {max(stats['max_out_label'], stats['max_in_label'])})")
+        print(f"  Memory: {stats['memory_bytes'] / 1024:.1f} KB")
+        print(f"  Build time: {stats['build_time'] * 1000:.1f} ms")
+
+        stations = sorted(network.stations)
+        pairs = [(s, t) for s in stations for t in stations if s != t]
+
+        start_time = time.time()
+        labeling.query_batch(pairs)
+        label_time = time.time() - start_time
+
+        searcher = SearchAlgorithms(network)
+        sample = pairs[::50]
+        start_time = time.time()
+        for s, t in sample:
+            searcher.astar(s, t)
+        astar_time = time.time() - start_time
+
+        print(f"  Hub label query: {label_time / len(pairs) * 1e6:.2f} us/query "
+              f"({len(pairs)} pairs)")
+        print(f"  A* search:       {astar_time / len(sample) * 1e6:.2f} us/query "
+              f"({len(sample)} pairs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""
+Minimum-Transfer Routing for MRT Route Planner
+Fewest line changes first, then the quickest journey with that many changes
+
+Lines are the nodes of a small line graph (from LINE_NAMES) joined at
+interchanges (from INTERCHANGE_STATIONS, checked against and completed
+from the mode's connections). A fewest-transfer query is a BFS over about
+a dozen line nodes; the station-level journey is filled in from cached
+per-line station orders (a position index for straight lines, a cached
+within-line tree for loops and branches). A line cut in two by a closure
+becomes two line nodes, so the graph stays correct under disruptions.
+"""
+
+import heapq
+import time
+from collections import deque
+from typing import Dict, List, Tuple
+
+from mrt_network_data import LINE_NAMES, INTERCHANGE_STATIONS, TRANSFER_PENALTY_MINUTES
+
+
+INF = float('inf')
+
+LineNode = Tuple[str, int]  # (line, part); part > 0 only when a closure splits the line
+
+
+class LineGraph:
+    """Line-level graph of one network mode"""
+
+    def __init__(self, network):
+        self.network = network
+        self.version = getattr(network, "version", 0)
+
+        self.rides = {}           # line -> {station: {neighbor: travel time}}
+        self.nodes = []           # LineNode list
+        self.node_stations = {}   # LineNode -> set of stations
+        self.station_nodes = {}   # station -> [LineNode]
+        self.edges = {}           # LineNode -> {LineNode: [interchange stations]}
+        self.orders = {}          # LineNode -> ordered station list (straight lines only)
+        self.positions = {}       # LineNode -> {station: (index, minutes from first station)}
+        self.trees = {}           # (LineNode, station) -> within-line (dist, parent)
+        self.unlisted_interchanges = []  # interchanges found only in the connections
+        self._build()
+
+    def _build(self):
+        """Split each line into connected parts and join parts at interchanges"""
+        for station in sorted(self.network.graph):
+            for neighbor, travel_time, line in self.network.get_neighbors(station):
+                times = self.rides.setdefault(line, {}).setdefault(station, {})
+                times[neighbor] = min(travel_time, times.get(neighbor, INF))
+
+        lines = [line for line in LINE_NAMES if line in self.rides]
+        lines += sorted(line for line in self.rides if line not in LINE_NAMES)
+        for line in lines:
+            unassigned = set(self.rides[line])
+            part = 0
+            while unassigned:
+                first = min(unassigned)
+                stations = self._line_component(line, first)
+                unassigned -= stations
+                node = (line, part)
+                part += 1
+                self.nodes.append(node)
+                self.node_stations[node] = stations
+                self.edges[node] = {}
+                for station in stations:
+                    self.station_nodes.setdefault(station, []).append(node)
+                self._index_order(node)
+
+        for station, nodes in self.station_nodes.items():
+            listed = set(INTERCHANGE_STATIONS.get(station, []))
+            served = {line for line, _ in nodes}
+            if len(served) > 1 and not served <= listed:
+                self.unlisted_interchanges.append(station)
+            for a in nodes:
+                for b in nodes:
+                    if a != b:
+                        self.edges[a].setdefault(b, []).append(station)
+        self.unlisted_interchanges.sort()
+
+    def _line_component(self, line: str, first: str) -> set:
+        """Stations reachable from first without leaving the line"""
+        seen = {first}
+        queue = deque([first])
+        while queue:
+            station = queue.popleft()
+            for neighbor in self.rides[line][station]:
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    queue.append(neighbor)
+        return seen
+
+    def _index_order(self, node: LineNode):
+        """Cache the station order of a line part that is a simple path"""
+        line, _ = node
+        stations = self.node_stations[node]
+        rides = self.rides[line]
+        ends = sorted(s for s in stations if len(rides[s]) == 1)
+        if len(stations) > 1 and (len(ends) != 2 or any(len(rides[s]) > 2 for s in stations)):
+            return  # loop or branch: answered from within-line trees
+
+        order = [ends[0] if ends else min(stations)]
+        while len(order) < len(stations):
+            order.append(next(n for n in rides[order[-1]] if len(order) < 2 or n != order[-2]))
+        minutes = 0
+        positions = {}
+        for index, station in enumerate(order):
+            if index:
+                minutes += rides[station][order[index - 1]]
+            positions[station] = (index, minutes)
+        self.orders[node] = order
+        self.positions[node] = positions
+
+    def _line_tree(self, node: LineNode, start: str):
+        """Within-line Dijkstra from start, cached per (line part, start)"""
+        key = (node, start)
+        if key not in self.trees:
+            rides = self.rides[node[0]]
+            dist = {start: 0}
+            parent = {}
+            frontier = [(0, start)]
+            while frontier:
+                d, station = heapq.heappop(frontier)
+                if d > dist[station]:
+                    continue
+                for neighbor, travel_time in rides[station].items():
+                    if d + travel_time < dist.get(neighbor, INF):
+                        dist[neighbor] = d + travel_time
+                        parent[neighbor] = station
+                        heapq.heappush(frontier, (d + travel_time, neighbor))
+            self.trees[key] = (dist, parent)
+        return self.trees[key]
+
+    def ride_time(self, node: LineNode, a: str, b: str) -> float:
+        """Minutes riding one line part from a to b"""
+        if node in self.positions:
+            positions = self.positions[node]
+            return abs(positions[a][1] - positions[b][1])
+        return self._line_tree(node, a)[0].get(b, INF)
+
+    def ride_path(self, node: LineNode, a: str, b: str) -> List[str]:
+        """Stations passed riding one line part from a to b (inclusive)"""
+        if node in self.positions:
+            i, j = self.positions[node][a][0], self.positions[node][b][0]
+            order = self.orders[node]
+            return order[i:j + 1] if i <= j else order[j:i + 1][::-1]
+        _, parent = self._line_tree(node, a)
+        path = [b]
+        while path[-1] != a:
+            path.append(parent[path[-1]])
+        return path[::-1]
+
+    def _fewest_line_sequences(self, origin: str, destination: str) -> List[List[LineNode]]:
+        """All shortest line-node sequences from origin's lines to destination's lines"""
+        depth = {node: 0 for node in self.station_nodes.get(origin, [])}
+        parents = {node: [] for node in depth}
+        queue = deque(depth)
+        targets = set(self.station_nodes.get(destination, []))
+        found = None
+        while queue:
+            node = queue.popleft()
+            if found is not None and depth[node] >= found:
+                break
+            for neighbor in self.edges[node]:
+                if neighbor not in depth:
+                    depth[neighbor] = depth[node] + 1
+                    parents[neighbor] = [node]
+                    queue.append(neighbor)
+                elif depth[neighbor] == depth[node] + 1:
+                    parents[neighbor].append(node)
+            if node in targets and found is None:
+                found = depth[node]
+        if found is None:
+            return []
+
+        sequences = []
+
+        def unwind(node, suffix):
+            if not parents[node]:
+                sequences.append([node] + suffix)
+                return
+            for parent in parents[node]:
+                unwind(parent, [node] + suffix)
+
+        for target in sorted(targets):
+            if depth.get(target) == found:
+                unwind(target, [])
+        return sequences
+
+    def query(self, origin: str, destination: str) -> Dict:
+        """
+        Fewest-transfer journey, quickest among equals
+
+        Returns path, line sequence, transfer stations, transfer count and
+        the travel time (riding minutes plus transfer penalties).
+        """
+        if origin == destination:
+            return {"path": [origin], "lines": [], "transfer_stations": [], "transfers": 0,
+                    "ride_time": 0, "cost": 0, "sequences_checked": 0}
+
+        sequences = self._fewest_line_sequences(origin, destination)
+        best = None
+        for sequence in sequences:
+            # DP over the interchange chosen between each pair of consecutive lines
+            states = {origin: (0, [origin])}
+            for current, following in zip(sequence, sequence[1:]):
+                next_states = {}
+                for station, (minutes, stops) in states.items():
+                    for interchange in self.edges[current][following]:
+                        candidate = minutes + self.ride_time(current, station, interchange)
+                        if candidate < next_states.get(interchange, (INF,))[0]:
+                            next_states[interchange] = (candidate, stops + [interchange])
+                states = next_states
+            for station, (minutes, stops) in states.items():
+                total = minutes + self.ride_time(sequence[-1], station, destination)
+                if total < INF and (best is None or total < best[0]):
+                    best = (total, sequence, stops + [destination])
+
+        if best is None:
+            return {"path": None, "lines": [], "transfer_stations": [], "transfers": None,
+                    "ride_time": INF, "cost": INF, "sequences_checked": len(sequences)}
+
+        ride_time, sequence, stops = best
+        path = [origin]
+        for node, a, b in zip(sequence, stops, stops[1:]):
+            path.extend(self.ride_path(node, a, b)[1:])
+        transfers = len(sequence) - 1
+        return {
+            "path": path,
+            "lines": [line for line, _ in sequence],
+            "transfer_stations": stops[1:-1],
+            "transfers": transfers,
+            "ride_time": ride_time,
+            "cost": ride_time + transfers * TRANSFER_PENALTY_MINUTES,
+            "sequences_checked": len(sequences)
+        }
+
+
+def main():
+    """Fewest-transfer airport journeys compared with an inflated-penalty search"""
+    from task1_route_planning import MRTNetwork
+    from state_graph import LineStateGraph
+
+    print("Minimum-Transfer Routing (line graph BFS)")
+    print("=" * 80)
+
+    inflated_penalty = 10000  # lexicographic: transfers first, then minutes
+    queries = [
+        ("Jurong East", "Changi Airport"),
+        ("Woodlands", "Changi Airport"),
+        ("Punggol", "Changi Terminal 5"),
+        ("HarbourFront", "Changi Airport"),
+        ("Bukit Panjang", "City Hall"),
+    ]
+
+    for mode in ["today", "future"]:
+        network = MRTNetwork(mode=mode)
+        start_time = time.time()
+        line_graph = LineGraph(network)
+        build_time = time.time() - start_time
+
+        print(f"\n{mode.upper()} network")
+        print("-" * 80)
+        print(f"  Line graph: {len(line_graph.nodes)} lines, "
+              f"{sum(len(e) for e in line_graph.edges.values()) // 2} line pairs joined, "
+              f"built in {build_time * 1000:.2f} ms")
+        if line_graph.unlisted_interchanges:
+            print(f"  Interchanges missing from INTERCHANGE_STATIONS: "
+                  f"{', '.join(line_graph.unlisted_interchanges)}")
+
+        for origin, destination in queries:
+            if not (network.is_station_available(origin) and network.is_station_available(destination)):
+                continue
+            result = line_graph.query(origin, destination)
+            print(f"  {origin} -> {destination}: {result['transfers']} transfer(s) "
+                  f"via {', '.join(result['transfer_stations']) or '-'} "
+                  f"[{' > '.join(result['lines'])}], {result['ride_time']} min riding")
+
+        # Verify against, and time, a Dijkstra with an inflated transfer penalty
+        stations = network.available_stations
+        inflated = LineStateGraph(network, transfer_penalty=inflated_penalty)
+        mismatches = 0
+        line_graph_time = inflated_time = 0.0
+        for origin in stations:
+            start_time = time.time()
+            dist, _ = inflated.shortest_path_tree(inflated.source_node[origin])
+            inflated_time += time.time() - start_time
+            for destination in stations:
+                start_time = time.time()
+                result = line_graph.query(origin, destination)
+                line_graph_time += time.time() - start_time
+                expected = dist[inflated.sink_node[destination]]
+                if (result["transfers"], result["ride_time"]) != divmod(expected, inflated_penalty):
+                    mismatches += 1
+        pairs = len(stations) ** 2
+        print(f"  All {pairs} pairs: line graph {line_graph_time / pairs * 1e6:.1f} us/query, "
+              f"inflated-penalty Dijkstra {inflated_time / len(stations) * 1e6:.1f} us/origin tree, "
+              f"mismatches {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
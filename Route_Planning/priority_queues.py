@@ -0,0 +1,276 @@
+"""
+Priority Queues for MRT Route Planner Searches
+Pluggable frontier implementations for GBFS and A*
+
+- binary:  heapq with an integer tie-break counter (lazy deletion)
+- indexed: binary heap with a position map and true decrease-key
+- bucket:  Dial-style bucket queue keyed by whole minutes (A* only; GBFS
+           keys are fractional heuristic values)
+
+A* keys are g + h with a fractional straight-line heuristic, so exact pop
+order needs a scan within each bucket; the bucket queue is therefore no
+faster than the binary heap here (see the benchmark in main) and is kept as
+a comparison point, not as a speedup.
+"""
+
+import heapq
+import math
+import time
+from itertools import count
+from typing import Any, Dict, Tuple
+
+
+class BinaryHeapQueue:
+    """
+    heapq frontier with an insertion counter as tie-break
+
+    Entries are (priority, counter, item), so equal priorities never fall
+    through to comparing station names. Improved priorities are pushed as
+    new entries; the old ones are left behind as stale entries.
+    """
+
+    name = "binary"
+
+    def __init__(self):
+        self.heap = []
+        self.counter = count()
+        self.pushes = 0
+
+    def push(self, item: Any, priority: float):
+        """Add item with priority"""
+        heapq.heappush(self.heap, (priority, next(self.counter), item))
+        self.pushes += 1
+
+    def pop(self) -> Tuple[float, Any]:
+        """Remove and return (priority, item) with the lowest priority"""
+        priority, _, item = heapq.heappop(self.heap)
+        return priority, item
+
+    def __len__(self):
+        return len(self.heap)
+
+    def stats(self) -> Dict:
+        """Queue operation counts"""
+        return {"queue": self.name, "queue_pushes": self.pushes}
+
+
+class IndexedHeapQueue:
+    """
+    Binary heap with a position index supporting decrease-key
+
+    Each item is stored at most once; pushing an item that is already
+    queued lowers its priority in place (or is ignored if not lower).
+    """
+
+    name = "indexed"
+
+    def __init__(self):
+        self.heap = []      # [(priority, counter, item)]
+        self.position = {}  # item -> index in heap
+        self.counter = count()
+        self.pushes = 0
+        self.decrease_keys = 0
+
+    def push(self, item: Any, priority: float):
+        """Add item, or decrease its key if it is already queued"""
+        self.pushes += 1
+        if item in self.position:
+            index = self.position[item]
+            if priority >= self.heap[index][0]:
+                return
+            self.heap[index] = (priority, self.heap[index][1], item)
+            self.decrease_keys += 1
+            self._sift_up(index)
+            return
+
+        self.heap.append((priority, next(self.counter), item))
+        self.position[item] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+
+    def pop(self) -> Tuple[float, Any]:
+        """Remove and return (priority, item) with the lowest priority"""
+        priority, _, item = self.heap[0]
+        last = self.heap.pop()
+        del self.position[item]
+        if self.heap:
+            self.heap[0] = last
+            self.position[last[2]] = 0
+            self._sift_down(0)
+        return priority, item
+
+    def _sift_up(self, index: int):
+        heap, position = self.heap, self.position
+        entry = heap[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if heap[parent][:2] <= entry[:2]:
+                break
+            heap[index] = heap[parent]
+            position[heap[index][2]] = index
+            index = parent
+        heap[index] = entry
+        position[entry[2]] = index
+
+    def _sift_down(self, index: int):
+        heap, position = self.heap, self.position
+        size = len(heap)
+        entry = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1][:2] < heap[child][:2]:
+                child += 1
+            if entry[:2] <= heap[child][:2]:
+                break
+            heap[index] = heap[child]
+            position[heap[index][2]] = index
+            index = child
+        heap[index] = entry
+        position[entry[2]] = index
+
+    def __len__(self):
+        return len(self.heap)
+
+    def stats(self) -> Dict:
+        """Queue operation counts"""
+        return {"queue": self.name, "queue_pushes": self.pushes,
+                "decrease_keys": self.decrease_keys}
+
+
+class BucketQueue:
+    """
+    Dial-style bucket queue for integer travel times
+
+    Priorities are bucketed by whole minutes (floor). Travel times and the
+    transfer penalty are integers, so A* keys g + h land in the bucket of
+    g + floor(h). Within a bucket the item with the lowest exact priority is
+    popped first (earliest pushed on ties), so items leave in the same order
+    as from the binary heap and A* returns the same routes. That scan makes
+    pop linear in the bucket size rather than Dial's O(1), so on these
+    networks the queue runs about as fast as the binary heap. Items move
+    between buckets on decrease-key, so no stale entries build up, and the
+    scan pointer moves back if a lower key is pushed.
+    """
+
+    name = "bucket"
+
+    def __init__(self):
+        self.buckets = []     # key -> {item: priority} (insertion ordered)
+        self.item_key = {}    # item -> bucket key
+        self.current = 0      # no non-empty bucket below this key
+        self.size = 0
+        self.pushes = 0
+        self.decrease_keys = 0
+        self.buckets_scanned = 0
+
+    def push(self, item: Any, priority: float):
+        """Add item, or move it to a lower bucket if already queued"""
+        self.pushes += 1
+        key = int(math.floor(priority))
+        if key < 0:
+            raise ValueError("BucketQueue requires non-negative priorities")
+
+        if item in self.item_key:
+            old_key = self.item_key[item]
+            if priority >= self.buckets[old_key][item]:
+                return
+            del self.buckets[old_key][item]
+            self.decrease_keys += 1
+            self.size -= 1
+
+        while key >= len(self.buckets):
+            self.buckets.append({})
+        self.buckets[key][item] = priority
+        self.item_key[item] = key
+        self.size += 1
+        if key < self.current:
+            self.current = key
+
+    def pop(self) -> Tuple[float, Any]:
+        """Remove and return the lowest (priority, item) of the lowest non-empty bucket"""
+        if self.size == 0:
+            raise IndexError("pop from empty BucketQueue")
+
+        while not self.buckets[self.current]:
+            self.current += 1
+            self.buckets_scanned += 1
+
+        bucket = self.buckets[self.current]
+        item = min(bucket, key=bucket.get)  # first minimum in insertion order
+        priority = bucket.pop(item)
+        del self.item_key[item]
+        self.size -= 1
+        return priority, item
+
+    def __len__(self):
+        return self.size
+
+    def stats(self) -> Dict:
+        """Queue operation counts"""
+        return {"queue": self.name, "queue_pushes": self.pushes,
+                "decrease_keys": self.decrease_keys,
+                "buckets_scanned": self.buckets_scanned}
+
+
+QUEUE_TYPES = {
+    "binary": BinaryHeapQueue,
+    "indexed": IndexedHeapQueue,
+    "bucket": BucketQueue,
+}
+
+DEFAULT_QUEUE = "binary"
+
+# Queues that need whole-minute priorities; GBFS falls back to DEFAULT_QUEUE
+INTEGER_KEY_QUEUES = {"bucket"}
+
+
+def make_queue(queue_type: str = DEFAULT_QUEUE):
+    """Create an empty priority queue of the given type"""
+    if queue_type not in QUEUE_TYPES:
+        raise ValueError(f"Unknown queue type: {queue_type} "
+                         f"(choose from {', '.join(QUEUE_TYPES)})")
+    return QUEUE_TYPES[queue_type]()
+
+
+def main():
+    """Benchmark the queue types for A* and GBFS on synthetic grid networks"""
+    import random
+    from task1_route_planning import SearchAlgorithms
+    from synthetic_network import SyntheticGridNetwork
+
+    print("Priority Queue Benchmark (synthetic grid networks)")
+    print("=" * 80)
+
+    for size in [20, 40, 80]:
+        network = SyntheticGridNetwork(rows=size, cols=size, seed=size)
+        stations = sorted(network.stations)
+        rng = random.Random(42)
+        pairs = [tuple(rng.sample(stations, 2)) for _ in range(20)]
+
+        print(f"\n{size}x{size} grid ({len(stations)} stations)")
+        print("-" * 80)
+        print(f"{'Engine':<6} {'Queue':<9} {'Avg Runtime (ms)':<18} {'Avg Pushes':<12} "
+              f"{'Avg Pops':<10} {'Avg Cost':<10}")
+
+        for engine in ["astar", "gbfs"]:
+            for queue_type in QUEUE_TYPES:
+                if engine == "gbfs" and queue_type in INTEGER_KEY_QUEUES:
+                    continue
+                searcher = SearchAlgorithms(network, queue_type=queue_type)
+                runtime = pushes = pops = cost = 0
+                for origin, destination in pairs:
+                    start_time = time.time()
+                    path, stats = getattr(searcher, engine)(origin, destination)
+                    runtime += time.time() - start_time
+                    pushes += stats.get("queue_pushes", 0)
+                    pops += stats.get("queue_pops", 0)
+                    cost += stats.get("path_cost", 0)
+
+                n = len(pairs)
+                print(f"{engine.upper():<6} {queue_type:<9} {runtime / n * 1000:<18.3f} "
+                      f"{pushes / n:<12.1f} {pops / n:<10.1f} {cost / n:<10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""
+Reliability-Aware Routing for MRT Route Planner
+Routes by expected travel time (or a chosen percentile) under random
+service disruptions, using P(S|M) from the crowding-risk Bayesian network
+
+Each line's service status S (Normal / Reduced / Disrupted) is drawn from
+P(S|M) for the network mode, independently per line. A status stretches
+riding time and adds a wait when boarding the line. Every arc of the
+line-state graph gets a precomputed cost vector over the three statuses,
+which collapses to one scalar weight per arc (expected value, or the cost
+under one status), so the search itself is a plain A* on fixed weights.
+The chosen path's full travel-time distribution is then evaluated exactly,
+with a line's status shared by all of its legs.
+
+The route planner runs without the Crowding_Risk package: P(S|M) defaults
+to SERVICE_STATUS_PROBABILITIES, and a caller holding a live network passes
+service_status_probabilities(mode, bn) in instead.
+"""
+
+import heapq
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from state_graph import LineStateGraph, LINE, INF
+
+
+STATUSES = ["Normal", "Reduced", "Disrupted"]
+
+# Per status: (riding time multiplier, extra minutes waiting to board)
+STATUS_DELAYS = {
+    "Normal": (1.0, 0.0),
+    "Reduced": (1.25, 2.0),
+    "Disrupted": (2.0, 10.0),
+}
+
+ON_TIME_SLACK_MINUTES = 5  # default deadline: nominal travel time plus this
+BN_MODES = {"today": "Today", "future": "Future"}
+
+# P(S | M) of the crowding-risk network (Crowding_Risk/crowding_risk_bn.py)
+SERVICE_STATUS_PROBABILITIES = {
+    "Today": {"Normal": 0.70, "Reduced": 0.20, "Disrupted": 0.10},
+    "Future": {"Normal": 0.75, "Reduced": 0.18, "Disrupted": 0.07},
+}
+
+
+def service_status_probabilities(mode: str, bn=None) -> np.ndarray:
+    """P(S | M) ordered as STATUSES, from a crowding-risk BayesianNetwork if given"""
+    tables = bn.cpts["S"] if bn is not None else SERVICE_STATUS_PROBABILITIES
+    table = tables[BN_MODES.get(mode, "Today")]
+    return np.array([table[status] for status in STATUSES])
+
+
+class ReliabilityModel:
+    """Per-arc cost vectors over service statuses for one network mode"""
+
+    def __init__(self, network, status_probabilities: Optional[np.ndarray] = None):
+        self.network = network
+        self.graph = LineStateGraph(network)
+        self.probabilities = (status_probabilities if status_probabilities is not None
+                              else service_status_probabilities(network.mode))
+        self.multipliers = np.array([STATUS_DELAYS[s][0] for s in STATUSES])
+        self.waits = np.array([STATUS_DELAYS[s][1] for s in STATUSES])
+
+        # cost_vectors[u][i] = cost of forward[u][i] under each status
+        graph = self.graph
+        self.cost_vectors = []
+        for u in range(len(graph)):
+            vectors = []
+            for v, weight in graph.forward[u]:
+                if graph.is_ride_arc(u, v):
+                    vectors.append(weight * self.multipliers)
+                elif graph.node_kind[v] == LINE:
+                    # Boarding a line (journey start or transfer)
+                    vectors.append(weight + self.waits)
+                else:
+                    vectors.append(np.zeros(len(STATUSES)))
+            self.cost_vectors.append(np.array(vectors).reshape(-1, len(STATUSES)))
+        self.weights = {}  # objective key -> per-arc scalar weights
+
+    def arc_weights(self, weighting: str = "expected") -> List[List[float]]:
+        """Scalar arc weights: "expected" cost, or the cost under one status"""
+        if weighting not in self.weights:
+            if weighting == "expected":
+                self.weights[weighting] = [(vectors @ self.probabilities).tolist()
+                                           for vectors in self.cost_vectors]
+            else:
+                index = STATUSES.index(weighting)
+                self.weights[weighting] = [vectors[:, index].tolist()
+                                           for vectors in self.cost_vectors]
+        return self.weights[weighting]
+
+    def search(self, start: str, goal: str, weighting: str = "expected"
+               ) -> Tuple[Optional[List[int]], int]:
+        """A* over the state graph with fixed arc weights; returns (node path, expanded)"""
+        graph = self.graph
+        if start not in graph.source_node or goal not in graph.sink_node:
+            return None, 0
+        weights = self.arc_weights(weighting)
+        source, sink = graph.source_node[start], graph.sink_node[goal]
+
+        # Every status costs at least the nominal time, so the straight-line
+        # heuristic stays admissible
+        h = {}
+
+        def heuristic(node):
+            station = graph.node_station[node]
+            if station not in h:
+                h[station] = self.network.heuristic(station, goal)
+            return h[station]
+
+        g = {source: 0.0}
+        parent = {source: -1}
+        frontier = [(heuristic(source), source)]
+        closed = set()
+        while frontier:
+            _, u = heapq.heappop(frontier)
+            if u in closed:
+                continue
+            closed.add(u)
+            if u == sink:
+                node_path = [u]
+                while parent[node_path[-1]] >= 0:
+                    node_path.append(parent[node_path[-1]])
+                return node_path[::-1], len(closed)
+            for (v, _), weight in zip(graph.forward[u], weights[u]):
+                candidate = g[u] + weight
+                if candidate < g.get(v, INF):
+                    g[v] = candidate
+                    parent[v] = u
+                    heapq.heappush(frontier, (candidate + heuristic(v), v))
+        return None, len(closed)
+
+    def line_legs(self, node_path: List[int]) -> Dict[str, Tuple[float, int]]:
+        """Per line: (nominal riding minutes, times boarded) along a state path"""
+        graph = self.graph
+        legs = {}
+        for u, v in zip(node_path, node_path[1:]):
+            line = graph.node_line[v]
+            if graph.is_ride_arc(u, v):
+                ride = dict(graph.forward[u])[v]
+                minutes, boardings = legs.get(line, (0.0, 0))
+                legs[line] = (minutes + ride, boardings)
+            elif graph.node_kind[v] == LINE:
+                minutes, boardings = legs.get(line, (0.0, 0))
+                legs[line] = (minutes, boardings + 1)
+        return legs
+
+    def travel_time_distribution(self, node_path: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Exact (outcomes, probabilities) of a path's travel time over line statuses"""
+        graph = self.graph
+        transfers = sum(1 for u, v in zip(node_path, node_path[1:])
+                        if graph.node_kind[u] == LINE and graph.node_kind[v] == LINE
+                        and not graph.is_ride_arc(u, v))
+        fixed = transfers * graph.transfer_penalty
+
+        legs = list(self.line_legs(node_path).values())
+        outcomes = np.array([fixed], dtype=float)
+        probabilities = np.array([1.0])
+        for minutes, boardings in legs:
+            leg_costs = minutes * self.multipliers + boardings * self.waits
+            outcomes = (outcomes[:, None] + leg_costs[None, :]).ravel()
+            probabilities = (probabilities[:, None] * self.probabilities[None, :]).ravel()
+        return outcomes, probabilities
+
+    def evaluate(self, node_path: List[int], percentile: float = 0.9,
+                 deadline: Optional[float] = None) -> Dict:
+        """Mean, variance, percentile and on-time probability of a state path"""
+        outcomes, probabilities = self.travel_time_distribution(node_path)
+        order = np.argsort(outcomes, kind="stable")
+        outcomes, probabilities = outcomes[order], probabilities[order]
+
+        nominal = float(outcomes[0])  # every line Normal
+        mean = float(outcomes @ probabilities)
+        variance = float(((outcomes - mean) ** 2) @ probabilities)
+        cumulative = np.cumsum(probabilities)
+        quantile = float(outcomes[min(np.searchsorted(cumulative, percentile - 1e-12),
+                                      len(outcomes) - 1)])
+        if deadline is None:
+            deadline = nominal + ON_TIME_SLACK_MINUTES
+        on_time = float(probabilities[outcomes <= deadline + 1e-9].sum())
+
+        return {
+            "nominal_time": nominal,
+            "expected_time": mean,
+            "variance": variance,
+            "std_dev": variance ** 0.5,
+            "percentile": percentile,
+            "percentile_time": quantile,
+            "deadline": deadline,
+            "on_time_probability": on_time
+        }
+
+    def route(self, start: str, goal: str, objective: str = "expected",
+              percentile: float = 0.9, deadline: Optional[float] = None) -> Dict:
+        """
+        Most reliable route under an objective
+
+        objective: "expected" minimises mean travel time, which is additive
+        over arcs, so one A* on expected weights is exact. "percentile" is
+        not additive: candidates from the expected weights and from each
+        status's weights are evaluated exactly and the lowest percentile
+        time wins (ties broken by mean).
+        """
+        weightings = ["expected"] if objective == "expected" else ["expected"] + STATUSES
+        best = None
+        expanded = 0
+        for weighting in weightings:
+            node_path, nodes = self.search(start, goal, weighting)
+            expanded += nodes
+            if node_path is None:
+                continue
+            stats = self.evaluate(node_path, percentile, deadline)
+            rank = (stats["percentile_time"] if objective == "percentile" else 0,
+                    stats["expected_time"])
+            if best is None or rank < best[0]:
+                best = (rank, node_path, stats)
+
+        if best is None:
+            return {"path": None, "nodes_expanded": expanded}
+        _, node_path, stats = best
+        return {
+            "path": self.graph.stations_on_path(node_path),
+            "nodes_expanded": expanded,
+            "lines": list(self.line_legs(node_path)),
+            **stats
+        }
+
+
+def main():
+    """Compare fastest-nominal and most-reliable routes to the airport"""
+    from task1_route_planning import MRTNetwork, SearchAlgorithms
+
+    print("Reliability-Aware Routing (service status from P(S|M))")
+    print("=" * 80)
+
+    queries = [
+        ("Jurong East", "Changi Airport"),
+        ("Woodlands", "Changi Airport"),
+        ("Bishan", "Changi Terminal 5"),
+        ("HarbourFront", "Changi Airport"),
+        ("Punggol", "Changi Airport"),
+    ]
+
+    for mode in ["today", "future"]:
+        network = MRTNetwork(mode=mode)
+        searcher = SearchAlgorithms(network)
+        model = searcher.get_reliability_model()
+        probabilities = ", ".join(f"{s} {p:.2f}" for s, p in zip(STATUSES, model.probabilities))
+
+        print(f"\n{mode.upper()} network - P(S|M={BN_MODES[mode]}): {probabilities}")
+        print("-" * 80)
+        print(f"{'Route':<36} {'Objective':<10} {'Nominal':>8} {'Mean':>7} {'Std':>6} "
+              f"{'P90':>6} {'On-time':>8} {'ms':>7}")
+        for origin, destination in queries:
+            if not (network.is_station_available(origin) and network.is_station_available(destination)):
+                continue
+            label = f"{origin} -> {destination}"
+            for objective in ["expected", "percentile"]:
+                path, stats = searcher.reliable_route(origin, destination, objective=objective)
+                print(f"{label:<36} {objective:<10} {stats['nominal_time']:>8.1f} "
+                      f"{stats['expected_time']:>7.1f} {stats['std_dev']:>6.1f} "
+                      f"{stats['percentile_time']:>6.1f} {stats['on_time_probability']:>8.1%} "
+                      f"{stats['runtime'] * 1000:>7.2f}")
+                label = ""
+
+        # Search speed against deterministic A*
+        stations = network.available_stations
+        pairs = [(a, b) for a in stations[::7] for b in stations[::11] if a != b]
+        start_time = time.time()
+        for origin, destination in pairs:
+            searcher.astar(origin, destination)
+        astar_time = time.time() - start_time
+        start_time = time.time()
+        for origin, destination in pairs:
+            model.search(origin, destination)
+        reliable_time = time.time() - start_time
+        print(f"\n  {len(pairs)} queries: deterministic A* {astar_time / len(pairs) * 1000:.3f} ms, "
+              f"expected-cost A* {reliable_time / len(pairs) * 1000:.3f} ms per query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""
+Hot-Destination Shortest-Path Tree Cache for MRT Route Planner
+Most queries end at a handful of destinations, so one reverse Dijkstra
+tree per popular destination answers every origin by walking parent
+pointers instead of searching
+
+Trees are built on the line-state graph, so transfers are charged exactly
+like A*. They are kept per mode in an LRU cache: configured hot
+destinations are built up front, and any other destination is built once
+its query rate passes a threshold. The whole cache is dropped when the
+network version changes (e.g. a closure in the disruption overlay).
+"""
+
+import time
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional, Tuple
+
+from state_graph import LineStateGraph, INF
+
+
+HOT_DESTINATIONS = ["Changi Airport", "Changi Terminal 5", "City Hall"]
+DEFAULT_CAPACITY = 8           # reverse (destination) trees kept per mode
+DEFAULT_STATE_CAPACITY = 32    # state-node trees kept per mode (two per waypoint line)
+DEFAULT_RATE_THRESHOLD = 5     # queries to one destination ...
+DEFAULT_RATE_WINDOW = 60.0     # ... within this many seconds builds its tree
+
+
+class ReverseTree:
+    """Reverse shortest-path tree rooted at one destination's sink"""
+
+    def __init__(self, graph: LineStateGraph, destination: str):
+        self.graph = graph
+        self.destination = destination
+        start_time = time.time()
+        # In the reverse tree, parent[node] is the next node towards the destination
+        self.dist, self.next_node = graph.shortest_path_tree(graph.sink_node[destination],
+                                                             reverse=True)
+        self.build_time = time.time() - start_time
+        self.hits = 0
+
+    def cost(self, origin: str) -> float:
+        """Exact travel time from origin to the destination (inf if unreachable)"""
+        if origin not in self.graph.source_node:
+            return INF
+        return self.dist[self.graph.source_node[origin]]
+
+    def path(self, origin: str) -> Optional[List[str]]:
+        """Station path from origin to the destination by walking parent pointers"""
+        if self.cost(origin) == INF:
+            return None
+        node = self.graph.source_node[origin]
+        node_path = [node]
+        while self.next_node[node] >= 0:
+            node = self.next_node[node]
+            node_path.append(node)
+        return self.graph.stations_on_path(node_path)
+
+
+class StateTree:
+    """
+    Shortest-path tree rooted at one state node, e.g. a waypoint on one line
+
+    Forward trees give distances from the root; reverse trees give
+    distances to the root (parent then points towards the root).
+    """
+
+    def __init__(self, graph: LineStateGraph, root: int, reverse: bool = False):
+        self.graph = graph
+        self.root = root
+        self.reverse = reverse
+        start_time = time.time()
+        self.dist, self.parent = graph.shortest_path_tree(root, reverse=reverse)
+        self.build_time = time.time() - start_time
+        self.hits = 0
+
+    def node_path(self, node: int) -> Optional[List[int]]:
+        """State-node path between the root and node, in travel order"""
+        if self.dist[node] == INF:
+            return None
+        node_path = [node]
+        while node != self.root:
+            node = self.parent[node]
+            node_path.append(node)
+        if not self.reverse:
+            node_path.reverse()
+        return node_path
+
+
+class ShortestPathTreeCache:
+    """
+    LRU caches of per-destination reverse trees and per-state-node trees
+    for one network mode
+
+    capacity: trees kept before the least recently used one is evicted
+    rate_threshold / rate_window: a destination queried this many times
+    within the window gets its own tree
+    state_capacity: state-node trees kept for waypoint routing
+    """
+
+    def __init__(self, network, hot_destinations: Optional[List[str]] = None,
+                 capacity: int = DEFAULT_CAPACITY,
+                 rate_threshold: int = DEFAULT_RATE_THRESHOLD,
+                 rate_window: float = DEFAULT_RATE_WINDOW,
+                 state_capacity: int = DEFAULT_STATE_CAPACITY):
+        self.network = network
+        self.hot_destinations = list(HOT_DESTINATIONS if hot_destinations is None
+                                     else hot_destinations)
+        self.capacity = capacity
+        self.rate_threshold = rate_threshold
+        self.rate_window = rate_window
+        self.state_capacity = state_capacity
+
+        self.trees = OrderedDict()  # destination -> ReverseTree, least recent first
+        self.state_trees = OrderedDict()  # (root node key, reverse) -> StateTree
+        self.recent_queries = {}    # destination -> deque of query timestamps
+        self.graph = None
+        self.version = None
+        self.counters = {"hits": 0, "misses": 0, "builds": 0, "evictions": 0,
+                         "invalidations": 0, "state_hits": 0, "state_builds": 0}
+
+    def _sync(self):
+        """Drop every tree when the network has changed since they were built"""
+        version = getattr(self.network, "version", 0)
+        if version == self.version:
+            return
+        if self.version is not None:
+            self.counters["invalidations"] += 1
+        self.trees.clear()
+        self.state_trees.clear()
+        self.graph = LineStateGraph(self.network)
+        self.version = version
+
+    def warm(self):
+        """Build the trees of the configured hot destinations"""
+        self._sync()
+        for destination in self.hot_destinations:
+            if destination in self.graph.sink_node and destination not in self.trees:
+                self._build(destination)
+
+    def _build(self, destination: str) -> ReverseTree:
+        tree = ReverseTree(self.graph, destination)
+        self.trees[destination] = tree
+        self.counters["builds"] += 1
+        while len(self.trees) > self.capacity:
+            self.trees.popitem(last=False)
+            self.counters["evictions"] += 1
+        return tree
+
+    def _is_hot(self, destination: str, now: float) -> bool:
+        """Record a query and report whether the destination has earned a tree"""
+        if destination in self.hot_destinations:
+            return True
+        timestamps = self.recent_queries.setdefault(destination, deque())
+        timestamps.append(now)
+        while timestamps and timestamps[0] < now - self.rate_window:
+            timestamps.popleft()
+        return len(timestamps) >= self.rate_threshold
+
+    def lookup(self, destination: str, force: bool = False) -> Tuple[Optional[ReverseTree], str]:
+        """
+        Tree for a destination if cached or hot enough to build
+
+        force builds the tree regardless of query rate (batch jobs).
+        Returns (tree, status) where status is "hit", "built" or "miss".
+        """
+        self._sync()
+        if destination in self.trees:
+            self.trees.move_to_end(destination)
+            self.counters["hits"] += 1
+            tree = self.trees[destination]
+            tree.hits += 1
+            return tree, "hit"
+
+        if destination in self.graph.sink_node and (force or self._is_hot(destination, time.time())):
+            self.recent_queries.pop(destination, None)
+            return self._build(destination), "built"
+
+        self.counters["misses"] += 1
+        return None, "miss"
+
+    def route(self, origin: str, destination: str) -> Tuple[Optional[List[str]], float, int]:
+        """
+        Exact route for a destination without a tree: one forward Dijkstra
+        from the origin on the same line-state graph the trees use, so cached
+        and uncached answers agree. Returns (station path, cost, nodes reached)
+        """
+        graph = self.state_graph()
+        if origin not in graph.source_node or destination not in graph.sink_node:
+            return None, INF, 0
+        dist, parent = graph.shortest_path_tree(graph.source_node[origin])
+        reached = sum(1 for d in dist if d < INF)
+        sink = graph.sink_node[destination]
+        if dist[sink] == INF:
+            return None, INF, reached
+        node_path = [sink]
+        while parent[node_path[-1]] >= 0:
+            node_path.append(parent[node_path[-1]])
+        node_path.reverse()
+        return graph.stations_on_path(node_path), dist[sink], reached
+
+    def state_graph(self) -> LineStateGraph:
+        """Line-state graph matching the current network version"""
+        self._sync()
+        return self.graph
+
+    def state_tree(self, root: int, reverse: bool = False) -> StateTree:
+        """
+        Tree rooted at a state node of the current graph
+
+        Trees are keyed by node identity (kind, station, line) and direction,
+        so they stay valid for as long as the graph does; least recently used
+        trees are evicted beyond state_capacity.
+        """
+        self._sync()
+        key = (self.graph.node_key(root), reverse)
+        if key in self.state_trees:
+            self.state_trees.move_to_end(key)
+            self.counters["state_hits"] += 1
+            tree = self.state_trees[key]
+            tree.hits += 1
+            return tree
+
+        tree = StateTree(self.graph, root, reverse)
+        self.state_trees[key] = tree
+        self.counters["state_builds"] += 1
+        while len(self.state_trees) > self.state_capacity:
+            self.state_trees.popitem(last=False)
+            self.counters["evictions"] += 1
+        return tree
+
+    def stats(self) -> Dict:
+        """Cache counters plus the destinations currently held"""
+        return {**self.counters, "cached": list(self.trees), "capacity": self.capacity}
+
+
+def main():
+    """Compare cached-tree answers with A* for every origin to the hot destinations"""
+    from task1_route_planning import MRTNetwork, SearchAlgorithms
+
+    print("Hot-Destination Shortest-Path Tree Cache")
+    print("=" * 80)
+
+    for mode in ["today", "future"]:
+        network = MRTNetwork(mode=mode)
+        searcher = SearchAlgorithms(network)
+        cache = searcher.get_tree_cache()
+
+        start_time = time.time()
+        cache.warm()
+        warm_time = time.time() - start_time
+
+        print(f"\n{mode.upper()} network")
+        print("-" * 80)
+        print(f"  Warmed {len(cache.trees)} trees in {warm_time * 1000:.2f} ms: "
+              f"{', '.join(cache.trees)}")
+        print(f"  {'Destination':<20} {'Queries':>8} {'A* ms':>9} {'Tree ms':>9} "
+              f"{'Speedup':>8} {'Same cost':>10} {'Cheaper':>8}")
+
+        for destination in list(cache.trees):
+            origins = [s for s in network.available_stations if s != destination]
+            astar_time = tree_time = 0.0
+            same = cheaper = 0
+            for origin in origins:
+                start_time = time.time()
+                _, astar_stats = searcher.astar(origin, destination)
+                astar_time += time.time() - start_time
+
+                start_time = time.time()
+                _, tree_stats = searcher.cached_astar(origin, destination)
+                tree_time += time.time() - start_time
+
+                if tree_stats["path_cost"] == astar_stats["path_cost"]:
+                    same += 1
+                elif tree_stats["path_cost"] < astar_stats["path_cost"]:
+                    cheaper += 1
+
+            print(f"  {destination:<20} {len(origins):>8} {astar_time * 1000:>9.2f} "
+                  f"{tree_time * 1000:>9.2f} {astar_time / tree_time:>7.1f}x "
+                  f"{same:>10} {cheaper:>8}")
+
+        # A destination becomes hot once it is queried often enough
+        destination = "Jurong East"
+        statuses = [searcher.cached_astar("Bishan", destination)[1]["tree_cache"]
+                    for _ in range(cache.rate_threshold + 1)]
+        print(f"\n  {destination} x{len(statuses)}: {' '.join(statuses)}")
+
+        # A closure bumps the network version and invalidates every tree
+        network.close_station("Bugis")
+        _, stats = searcher.cached_astar("Bishan", "City Hall")
+        network.reopen_station("Bugis")
+        print(f"  After closing Bugis: City Hall tree {stats['tree_cache']}, "
+              f"cache stats {cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
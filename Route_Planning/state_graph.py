@@ -0,0 +1,149 @@
+"""
+Line-Expanded State Graph for MRT Route Planner
+Turns transfer penalties into ordinary edge weights so exact shortest-path
+techniques (labels, trees, oracles) can run on a plain weighted digraph
+"""
+
+import heapq
+from typing import List, Optional, Set, Tuple
+
+from mrt_network_data import TRANSFER_PENALTY_MINUTES
+
+
+INF = float('inf')
+
+# Node kinds
+SOURCE = "source"  # journey starts here (no line yet)
+LINE = "line"      # standing at a station on a given line
+SINK = "sink"      # journey ends here (any line)
+
+
+class LineStateGraph:
+    """
+    Directed graph whose nodes are (station, line) states
+
+    For every station s there is one node per line serving s, plus a source
+    node (edges of weight 0 to each line node) and a sink node (edges of
+    weight 0 from each line node). Riding between stations keeps the line;
+    changing lines at a station costs the transfer penalty. The shortest
+    source(s) -> sink(t) distance is the exact travel time from s to t
+    including transfer penalties.
+    """
+
+    def __init__(self, network, transfer_penalty: int = TRANSFER_PENALTY_MINUTES):
+        self.network = network
+        self.transfer_penalty = transfer_penalty
+
+        self.node_station = []  # node id -> station
+        self.node_line = []     # node id -> line (None for source/sink)
+        self.node_kind = []     # node id -> SOURCE / LINE / SINK
+        self.forward = []       # node id -> [(neighbor id, weight)]
+        self.backward = []      # node id -> [(neighbor id, weight)]
+
+        self.line_nodes = {}    # (station, line) -> node id
+        self.source_node = {}   # station -> node id
+        self.sink_node = {}     # station -> node id
+        self._build()
+
+    def _add_node(self, station: str, line: Optional[str], kind: str) -> int:
+        """Add a node and return its id"""
+        node = len(self.node_station)
+        self.node_station.append(station)
+        self.node_line.append(line)
+        self.node_kind.append(kind)
+        self.forward.append([])
+        self.backward.append([])
+        return node
+
+    def _add_arc(self, u: int, v: int, weight: int):
+        """Add a directed arc u -> v"""
+        self.forward[u].append((v, weight))
+        self.backward[v].append((u, weight))
+
+    def _build(self):
+        """Build the state graph from the network adjacency list"""
+        # Cheapest ride time per (station, neighbor, line); the data has a few
+        # duplicated connections
+        rides = {}
+        lines_at = {}
+        for station in sorted(self.network.graph):
+            for neighbor, travel_time, line in self.network.get_neighbors(station):
+                key = (station, neighbor, line)
+                if key not in rides or travel_time < rides[key]:
+                    rides[key] = travel_time
+                lines_at.setdefault(station, set()).add(line)
+
+        for station in sorted(lines_at):
+            self.source_node[station] = self._add_node(station, None, SOURCE)
+            self.sink_node[station] = self._add_node(station, None, SINK)
+            for line in sorted(lines_at[station]):
+                self.line_nodes[(station, line)] = self._add_node(station, line, LINE)
+
+        for station in sorted(lines_at):
+            source = self.source_node[station]
+            sink = self.sink_node[station]
+            lines = sorted(lines_at[station])
+            for line in lines:
+                node = self.line_nodes[(station, line)]
+                self._add_arc(source, node, 0)
+                self._add_arc(node, sink, 0)
+                for other_line in lines:
+                    if other_line != line:
+                        self._add_arc(node, self.line_nodes[(station, other_line)],
+                                      self.transfer_penalty)
+
+        for (station, neighbor, line), travel_time in sorted(rides.items()):
+            self._add_arc(self.line_nodes[(station, line)],
+                          self.line_nodes[(neighbor, line)], travel_time)
+
+    def __len__(self):
+        return len(self.node_station)
+
+    def node_key(self, node: int) -> Tuple[str, str, Optional[str]]:
+        """Stable identity of a node (kind, station, line)"""
+        return (self.node_kind[node], self.node_station[node], self.node_line[node])
+
+    def stations_on_path(self, node_path: List[int]) -> List[str]:
+        """Collapse a state-node path into the station list it visits"""
+        path = []
+        for node in node_path:
+            station = self.node_station[node]
+            if not path or path[-1] != station:
+                path.append(station)
+        return path
+
+    def is_ride_arc(self, u: int, v: int) -> bool:
+        """True for arcs that travel between two stations (not transfers)"""
+        return (self.node_kind[u] == LINE and self.node_kind[v] == LINE
+                and self.node_station[u] != self.node_station[v])
+
+    def shortest_path_tree(self, root: int, reverse: bool = False,
+                           excluded_arcs: Optional[Set[Tuple[int, int]]] = None
+                           ) -> Tuple[List[float], List[int]]:
+        """
+        Dijkstra from root over forward arcs (or backward arcs if reverse)
+
+        Returns (dist, parent) lists indexed by node id; parent is -1 for the
+        root and unreached nodes. excluded_arcs holds (u, v) forward arcs to
+        skip, e.g. the arcs of a closed segment.
+        """
+        adjacency = self.backward if reverse else self.forward
+        dist = [INF] * len(self.node_station)
+        parent = [-1] * len(self.node_station)
+        dist[root] = 0
+        frontier = [(0, root)]
+
+        while frontier:
+            d, u = heapq.heappop(frontier)
+            if d > dist[u]:
+                continue
+            for v, weight in adjacency[u]:
+                if excluded_arcs and ((v, u) if reverse else (u, v)) in excluded_arcs:
+                    continue
+                nd = d + weight
+                if nd < dist[v]:
+                    dist[v] = nd
+                    parent[v] = u
+                    heapq.heappush(frontier, (nd, v))
+
+        return dist, parent
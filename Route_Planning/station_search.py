@@ -0,0 +1,186 @@
+"""
+Station Search Index for MRT Route Planner
+Prefix (trie) and typo-tolerant (trigram + edit distance) station autocomplete
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from mrt_network_data import INTERCHANGE_STATIONS
+
+
+DEFAULT_RESULT_LIMIT = 10
+MIN_FUZZY_QUERY_LENGTH = 3
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase a station name and strip punctuation for matching"""
+    name = name.lower().replace("'", "")
+    name = re.sub(r"[^a-z0-9]+", " ", name)
+    return name.strip()
+
+
+def trigrams(text: str) -> set:
+    """Get the set of character trigrams of a padded string"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Levenshtein distance between a and b, bounded by max_distance
+    Returns max_distance + 1 as soon as the bound is exceeded
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, char_b in enumerate(b, 1):
+            current[j] = min(previous[j] + 1,
+                             current[j - 1] + 1,
+                             previous[j - 1] + (char_a != char_b))
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+
+    return previous[-1]
+
+
+class TrieNode:
+    """Node of the station name trie"""
+
+    __slots__ = ("children", "station_ids")
+
+    def __init__(self):
+        self.children = {}  # {char: TrieNode}
+        self.station_ids = []  # all stations whose key passes through this node
+
+
+class StationSearchIndex:
+    """
+    Autocomplete index over the stations of one network mode
+
+    Built once per mode; queries never sort the full station list.
+    - Trie over full names and word suffixes ("Airport" finds "Changi Airport")
+    - Trigram index + bounded edit distance for typos ("Tanah Mereh")
+    - Ties ranked by importance (number of interchange lines)
+    """
+
+    def __init__(self, stations: List[str]):
+        # Rank order is fixed at build time: importance first, then name
+        self.stations = sorted(stations, key=lambda s: (-self.importance(s), s))
+        self.normalized = [normalize_name(s) for s in self.stations]
+
+        self.root = TrieNode()
+        self.trigram_index = defaultdict(list)  # {trigram: [station_id]}
+        self._build()
+
+    @staticmethod
+    def importance(station: str) -> int:
+        """Station importance = number of lines meeting at the station"""
+        return len(INTERCHANGE_STATIONS.get(station, []))
+
+    def _build(self):
+        """Populate the trie and trigram index"""
+        # Station ids are inserted in rank order, so every node's list is pre-ranked
+        for station_id, name in enumerate(self.normalized):
+            words = name.split(" ")
+            for start in range(len(words)):
+                self._insert(" ".join(words[start:]), station_id)
+
+            for gram in trigrams(name):
+                self.trigram_index[gram].append(station_id)
+
+    def _insert(self, key: str, station_id: int):
+        """Insert a key into the trie, tagging every node on its path"""
+        node = self.root
+        for char in key:
+            node = node.children.setdefault(char, TrieNode())
+            if not node.station_ids or node.station_ids[-1] != station_id:
+                node.station_ids.append(station_id)
+
+    def _find_node(self, prefix: str) -> Optional[TrieNode]:
+        """Walk the trie to the node for prefix"""
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def _fuzzy_candidates(self, query: str, exclude: set) -> List[Tuple[int, int]]:
+        """Find (distance, station_id) for near-miss spellings, best first"""
+        if len(query) < MIN_FUZZY_QUERY_LENGTH:
+            return []
+
+        # Count shared trigrams to shortlist candidates
+        shared = defaultdict(int)
+        for gram in trigrams(query):
+            for station_id in self.trigram_index.get(gram, ()):
+                shared[station_id] += 1
+
+        max_distance = max(1, len(query) // 4)
+        candidates = []
+        for station_id in shared:
+            if station_id in exclude:
+                continue
+            name = self.normalized[station_id]
+            # Compare against the full name and against the same-length prefix,
+            # so partially typed words with a typo still match
+            distance = min(edit_distance(query, name, max_distance),
+                           edit_distance(query, name[:len(query)], max_distance))
+            if distance <= max_distance:
+                candidates.append((distance, station_id))
+
+        # Station ids follow rank order, so ties fall back to importance
+        candidates.sort()
+        return candidates
+
+    def search(self, query: str, limit: int = DEFAULT_RESULT_LIMIT) -> List[Dict]:
+        """
+        Search stations matching query
+
+        Returns up to limit results ordered by match quality, then importance
+        """
+        query = normalize_name(query)
+        if not query or limit <= 0:
+            return []
+
+        results = []
+        seen = set()
+
+        def add(station_id, match_type, distance=0):
+            if station_id in seen or len(results) >= limit:
+                return
+            seen.add(station_id)
+            station = self.stations[station_id]
+            results.append({
+                'station': station,
+                'match': match_type,
+                'distance': distance,
+                'importance': self.importance(station)
+            })
+
+        node = self._find_node(query)
+        if node is not None:
+            # Exact name and full-name prefixes outrank mid-name word prefixes
+            word_prefix_ids = []
+            for station_id in node.station_ids:
+                if self.normalized[station_id] == query:
+                    add(station_id, 'exact')
+            for station_id in node.station_ids:
+                if self.normalized[station_id].startswith(query):
+                    add(station_id, 'prefix')
+                else:
+                    word_prefix_ids.append(station_id)
+            for station_id in word_prefix_ids:
+                add(station_id, 'word_prefix')
+
+        if len(results) < limit:
+            for distance, station_id in self._fuzzy_candidates(query, seen):
+                add(station_id, 'fuzzy', distance)
+
+        return results
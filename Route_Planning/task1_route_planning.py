@@ -1,4 +1,3 @@
-import heapq
 import time
 import math
 from collections import deque
@@ -17,6 +16,21 @@ from mrt_network_data import (
     AVERAGE_MRT_SPEED_KMH,
     EARTH_RADIUS_KM,
 )
+from hub_labeling import HubLabeling
+from graph_compression import CompressedNetwork
+from priority_queues import make_queue, DEFAULT_QUEUE, INTEGER_KEY_QUEUES
+from connectivity import ConnectivityIndex, segment_key
+from spt_cache import ShortestPathTreeCache
+from via_routing import plan_via_route
+from min_transfer import LineGraph
+from reliability_routing import ReliabilityModel
+from time_dependent import TimeDependentRouter, parse_departure
+
+# Engines that run_compressed can run on the chain-contracted skeleton. BFS
+# (an express edge counts as one hop) and A* (one line per station) would
+# return different routes there than on the full network, so they are not
+# offered; DFS and GBFS make no optimality claim to begin with
+COMPRESSIBLE_ENGINES = ("dfs", "gbfs")
 
 
 class MRTNetwork:
@@ -31,6 +45,13 @@ class MRTNetwork:
         self.graph = {}  # adjacency list: {station: [(neighbor, travel_time, line)]}
         self.coordinates = STATION_COORDINATES.copy()
         self.stations = set()
+        self.available_stations = []  # sorted once at build time
+        
+        # Disruption overlay: closures hide stations/segments from get_neighbors
+        self.closed_stations = set()
+        self.closed_segments = set()  # {(station, station, line)}, stations sorted
+        self.version = 0  # bumped on every overlay change
+        self.disruption_log = []  # [(version, stations touched by the change)]
         self._build_network()
     
     def _build_network(self):
@@ -49,6 +70,15 @@ class MRTNetwork:
             station: coords for station, coords in STATION_COORDINATES.items()
             if station in self.stations
         }
+        
+        # Precompute the sorted station list served to clients
+        if self.mode == "today":
+            # Exclude future-only stations
+            available = self.stations - FUTURE_ONLY_STATIONS
+        else:
+            # Future mode includes all stations
+            available = self.stations
+        self.available_stations = sorted(available)
     
     def _add_edge(self, station1: str, station2: str, time: int, line: str):
         """Add bidirectional edge between stations"""
@@ -92,16 +122,52 @@ class MRTNetwork:
         for station1, station2, travel_time, line in FUTURE_MODE_ADDITIONAL_CONNECTIONS:
             self._add_edge(station1, station2, travel_time, line)
     
+    def _record_disruption(self, touched: Set[str]):
+        """Bump the network version and log which stations a change touched"""
+        self.version += 1
+        self.disruption_log.append((self.version, set(touched)))
+    
+    def close_station(self, station: str):
+        """Close a station: no journey can pass through, start or end there"""
+        if station in self.stations and station not in self.closed_stations:
+            self.closed_stations.add(station)
+            self._record_disruption({station} | {n for n, _, _ in self.graph[station]})
+    
+    def reopen_station(self, station: str):
+        """Reopen a closed station"""
+        if station in self.closed_stations:
+            self.closed_stations.discard(station)
+            self._record_disruption({station} | {n for n, _, _ in self.graph[station]})
+    
+    def close_segment(self, station1: str, station2: str, line: str):
+        """Close the track between two adjacent stations on one line"""
+        key = segment_key(station1, station2, line)
+        if key not in self.closed_segments:
+            self.closed_segments.add(key)
+            self._record_disruption({station1, station2})
+    
+    def reopen_segment(self, station1: str, station2: str, line: str):
+        """Reopen a closed segment"""
+        key = segment_key(station1, station2, line)
+        if key in self.closed_segments:
+            self.closed_segments.discard(key)
+            self._record_disruption({station1, station2})
+    
+    def clear_disruptions(self):
+        """Reopen every closed station and segment"""
+        touched = set()
+        for station in self.closed_stations:
+            touched |= {station} | {n for n, _, _ in self.graph[station]}
+        for a, b, _ in self.closed_segments:
+            touched |= {a, b}
+        if touched:
+            self.closed_stations.clear()
+            self.closed_segments.clear()
+            self._record_disruption(touched)
+    
     def get_available_stations(self) -> List[str]:
         """Get list of available stations for current mode"""
-        if self.mode == "today":
-            # Exclude future-only stations
-            available = set(STATION_COORDINATES.keys()) - FUTURE_ONLY_STATIONS
-            # Only return stations that actually have connections
-            return sorted([station for station in available if station in self.stations])
-        else:
-            # Future mode includes all stations
-            return sorted(list(self.stations))
+        return list(self.available_stations)
     
     def is_station_available(self, station: str) -> bool:
         """Check if a station is available in current mode"""
@@ -111,8 +177,17 @@ class MRTNetwork:
             return station in self.stations
     
     def get_neighbors(self, station: str) -> List[Tuple[str, int, str]]:
-        """Get neighbors of a station"""
-        return self.graph.get(station, [])
+        """Get neighbors of a station (skipping closed stations and segments)"""
+        neighbors = self.graph.get(station, [])
+        if not self.closed_stations and not self.closed_segments:
+            return neighbors
+        if station in self.closed_stations:
+            return []
+        return [
+            (n, t, l) for n, t, l in neighbors
+            if n not in self.closed_stations
+            and segment_key(station, n, l) not in self.closed_segments
+        ]
     
     def get_cost(self, current: str, neighbor: str, current_line: str = None, 
                  crowding_penalty: float = 0) -> float:
@@ -166,9 +241,20 @@ class MRTNetwork:
 class SearchAlgorithms:
     """Implementation of search algorithms for route planning"""
     
-    def __init__(self, network: MRTNetwork):
+    def __init__(self, network: MRTNetwork, queue_type: str = DEFAULT_QUEUE):
         self.network = network
+        self.queue_type = queue_type  # frontier used by A* (and GBFS, if not bucket) unless overridden
         self.stats = {}  # Store statistics for each search
+        self.hub_labels = None  # HubLabeling oracle, built on first use
+        self.compressed = None  # CompressedNetwork skeleton, built on first use
+        self.built_versions = {}  # component name -> network version it was built for
+        self.connectivity = None  # ConnectivityIndex, built on first use
+        self.connectivity_pruning = True  # answer disconnected queries without searching
+        self.tree_cache = None  # ShortestPathTreeCache for hot destinations, built on first use
+        self.line_graph = None  # LineGraph for minimum-transfer routing, built on first use
+        self.reliability_model = None  # ReliabilityModel cost vectors, built on first use
+        self.status_probabilities = None  # P(S|M) for reliable_route; None uses the defaults
+        self.td_router = None  # TimeDependentRouter edge profiles, built on first use
     
     def reconstruct_path(self, came_from: Dict, current: str) -> List[str]:
         """Reconstruct path from came_from dictionary"""
@@ -179,6 +265,25 @@ class SearchAlgorithms:
         path.reverse()
         return path
     
+    def get_connectivity(self) -> ConnectivityIndex:
+        """Get the connectivity index, building it on first use (it tracks closures itself)"""
+        if self.connectivity is None:
+            self.connectivity = ConnectivityIndex(self.network)
+        return self.connectivity
+    
+    def _disconnected_stats(self, start: str, goal: str, algorithm: str,
+                            start_time: float) -> Optional[Dict]:
+        """Failure stats if start and goal are in different components, else None"""
+        if not self.connectivity_pruning or self.get_connectivity().connected(start, goal):
+            return None
+        return {
+            "algorithm": algorithm,
+            "nodes_expanded": 0,
+            "runtime": time.time() - start_time,
+            "error": "No path found",
+            "short_circuit": True
+        }
+    
     def bfs(self, start: str, goal: str) -> Tuple[Optional[List[str]], Dict]:
         """Breadth-First Search"""
         start_time = time.time()
@@ -186,6 +291,10 @@ class SearchAlgorithms:
         if start not in self.network.stations or goal not in self.network.stations:
             return None, {"error": "Invalid start or goal station"}
         
+        disconnected = self._disconnected_stats(start, goal, "BFS", start_time)
+        if disconnected:
+            return None, disconnected
+        
         queue = deque([start])
         came_from = {}
         visited = {start}
@@ -228,6 +337,10 @@ class SearchAlgorithms:
         if start not in self.network.stations or goal not in self.network.stations:
             return None, {"error": "Invalid start or goal station"}
         
+        disconnected = self._disconnected_stats(start, goal, "DFS", start_time)
+        if disconnected:
+            return None, disconnected
+        
         stack = [start]
         came_from = {}
         visited = {start}
@@ -263,21 +376,35 @@ class SearchAlgorithms:
             "error": "No path found"
         }
     
-    def gbfs(self, start: str, goal: str) -> Tuple[Optional[List[str]], Dict]:
-        """Greedy Best-First Search"""
+    def gbfs(self, start: str, goal: str, queue_type: str = None) -> Tuple[Optional[List[str]], Dict]:
+        """
+        Greedy Best-First Search
+        Heuristic keys are fractional, so integer-key queues (bucket) are
+        replaced by the default binary heap
+        """
         start_time = time.time()
         
         if start not in self.network.stations or goal not in self.network.stations:
             return None, {"error": "Invalid start or goal station"}
         
-        # Priority queue: (heuristic, station)
-        frontier = [(self.network.heuristic(start, goal), start)]
+        disconnected = self._disconnected_stats(start, goal, "GBFS", start_time)
+        if disconnected:
+            return None, disconnected
+        
+        # Priority queue keyed by heuristic
+        queue_type = queue_type or self.queue_type
+        if queue_type in INTEGER_KEY_QUEUES:
+            queue_type = DEFAULT_QUEUE
+        frontier = make_queue(queue_type)
+        frontier.push(start, self.network.heuristic(start, goal))
         came_from = {}
         visited = set()
         nodes_expanded = 0
+        queue_pops = 0
         
         while frontier:
-            _, current = heapq.heappop(frontier)
+            _, current = frontier.pop()
+            queue_pops += 1
             
             if current in visited:
                 continue
@@ -294,13 +421,15 @@ class SearchAlgorithms:
                     "nodes_expanded": nodes_expanded,
                     "runtime": end_time - start_time,
                     "path_length": len(path),
-                    "path_cost": self._calculate_path_cost(path)
+                    "path_cost": self._calculate_path_cost(path),
+                    "queue_pops": queue_pops,
+                    **frontier.stats()
                 }
             
             for neighbor, _, _ in self.network.get_neighbors(current):
                 if neighbor not in visited:
                     h = self.network.heuristic(neighbor, goal)
-                    heapq.heappush(frontier, (h, neighbor))
+                    frontier.push(neighbor, h)
                     if neighbor not in came_from:
                         came_from[neighbor] = current
         
@@ -309,26 +438,35 @@ class SearchAlgorithms:
             "algorithm": "GBFS",
             "nodes_expanded": nodes_expanded,
             "runtime": end_time - start_time,
-            "error": "No path found"
+            "error": "No path found",
+            "queue_pops": queue_pops,
+            **frontier.stats()
         }
     
-    def astar(self, start: str, goal: str) -> Tuple[Optional[List[str]], Dict]:
+    def astar(self, start: str, goal: str, queue_type: str = None) -> Tuple[Optional[List[str]], Dict]:
         """A* Search"""
         start_time = time.time()
         
         if start not in self.network.stations or goal not in self.network.stations:
             return None, {"error": "Invalid start or goal station"}
         
-        # Priority queue: (f_score, station)
-        frontier = [(0, start)]
+        disconnected = self._disconnected_stats(start, goal, "A*", start_time)
+        if disconnected:
+            return None, disconnected
+        
+        # Priority queue keyed by f_score
+        frontier = make_queue(queue_type or self.queue_type)
+        frontier.push(start, 0)
         came_from = {}
         g_score = {start: 0}
         visited = set()
         nodes_expanded = 0
+        queue_pops = 0
         line_info = {start: None}  # Track which line we're on
         
         while frontier:
-            _, current = heapq.heappop(frontier)
+            _, current = frontier.pop()
+            queue_pops += 1
             
             if current in visited:
                 continue
@@ -345,7 +483,9 @@ class SearchAlgorithms:
                     "nodes_expanded": nodes_expanded,
                     "runtime": end_time - start_time,
                     "path_length": len(path),
-                    "path_cost": g_score[current]
+                    "path_cost": g_score[current],
+                    "queue_pops": queue_pops,
+                    **frontier.stats()
                 }
             
             for neighbor, travel_time, line in self.network.get_neighbors(current):
@@ -364,16 +504,334 @@ class SearchAlgorithms:
                     
                     h = self.network.heuristic(neighbor, goal)
                     f = tentative_g + h
-                    heapq.heappush(frontier, (f, neighbor))
+                    frontier.push(neighbor, f)
         
         end_time = time.time()
         return None, {
             "algorithm": "A*",
             "nodes_expanded": nodes_expanded,
             "runtime": end_time - start_time,
-            "error": "No path found"
+            "error": "No path found",
+            "queue_pops": queue_pops,
+            **frontier.stats()
         }
     
+    def _network_version(self) -> int:
+        """Disruption overlay version (0 for views without an overlay)"""
+        return getattr(self.network, "version", 0)
+    
+    def _is_stale(self, component: str) -> bool:
+        """Whether a prebuilt component predates the current disruption overlay"""
+        return self.built_versions.get(component) != self._network_version()
+    
+    def get_hub_labels(self) -> HubLabeling:
+        """Get the hub labeling oracle, building it on first use"""
+        if self.hub_labels is None or self._is_stale("hub_labels"):
+            self.hub_labels = HubLabeling(self.network)
+            self.built_versions["hub_labels"] = self._network_version()
+        return self.hub_labels
+    
+    def hub_label_cost(self, start: str, goal: str) -> float:
+        """Exact travel time between two stations (cost only, no path)"""
+        return self.get_hub_labels().query(start, goal)
+    
+    def hub_labeling(self, start: str, goal: str) -> Tuple[Optional[List[str]], Dict]:
+        """Hub Labeling (2-hop cover distance oracle)"""
+        start_time = time.time()
+        
+        if start not in self.network.stations or goal not in self.network.stations:
+            return None, {"error": "Invalid start or goal station"}
+        
+        disconnected = self._disconnected_stats(start, goal, "HL", start_time)
+        if disconnected:
+            return None, disconnected
+        
+        # Label lookups expand no nodes; report the label entries read instead
+        labels = self.get_hub_labels()
+        scanned_before = labels.entries_scanned
+        cost = labels.query(start, goal)
+        path = labels.path(start, goal) if cost != float('inf') else None
+        end_time = time.time()
+        
+        if path is None:
+            return None, {
+                "algorithm": "HL",
+                "nodes_expanded": 0,
+                "label_entries_scanned": labels.entries_scanned - scanned_before,
+                "runtime": end_time - start_time,
+                "error": "No path found"
+            }
+        
+        return path, {
+            "algorithm": "HL",
+            "nodes_expanded": 0,
+            "label_entries_scanned": labels.entries_scanned - scanned_before,
+            "runtime": end_time - start_time,
+            "path_length": len(path),
+            "path_cost": cost
+        }
+    
+    def get_tree_cache(self) -> ShortestPathTreeCache:
+        """Get the hot-destination tree cache (it drops its trees on network changes)"""
+        if self.tree_cache is None:
+            self.tree_cache = ShortestPathTreeCache(self.network)
+        return self.tree_cache
+    
+    def cached_astar(self, start: str, goal: str) -> Tuple[Optional[List[str]], Dict]:
+        """
+        Exact routing with a reverse shortest-path tree cache for hot destinations
+        Cached destinations are answered by walking tree parent pointers;
+        everything else runs one Dijkstra on the same line-state graph, so the
+        answer does not depend on the cache state (unlike A*, which keeps one
+        line per station)
+        """
+        start_time = time.time()
+        
+        if start not in self.network.stations or goal not in self.network.stations:
+            return None, {"error": "Invalid start or goal station"}
+        
+        cache = self.get_tree_cache()
+        tree, status = cache.lookup(goal)
+        if tree is None:
+            path, cost, nodes_expanded = cache.route(start, goal)
+        else:
+            path, cost, nodes_expanded = tree.path(start), tree.cost(start), 0
+        end_time = time.time()
+        
+        if path is None:
+            return None, {
+                "algorithm": "SPT-cache",
+                "nodes_expanded": nodes_expanded,
+                "runtime": end_time - start_time,
+                "error": "No path found",
+                "tree_cache": status
+            }
+        
+        return path, {
+            "algorithm": "SPT-cache",
+            "nodes_expanded": nodes_expanded,
+            "runtime": end_time - start_time,
+            "path_length": len(path),
+            "path_cost": cost,
+            "tree_cache": status
+        }
+    
+    def via_route(self, start: str, goal: str, waypoints: List[str]) -> Tuple[Optional[List[str]], Dict]:
+        """
+        Shortest route forced through an ordered list of waypoints
+        Legs join at (station, line) states so transfers at waypoints are
+        charged exactly; leg trees are reused across queries
+        """
+        start_time = time.time()
+        
+        stops = [start] + list(waypoints) + [goal]
+        if any(station not in self.network.stations for station in stops):
+            return None, {"error": "Invalid start, goal or waypoint station"}
+        
+        connectivity = self.get_connectivity()
+        if self.connectivity_pruning and not all(
+                connectivity.connected(a, b) for a, b in zip(stops, stops[1:])):
+            return None, {
+                "algorithm": "Via",
+                "nodes_expanded": 0,
+                "runtime": time.time() - start_time,
+                "error": "No path found",
+                "short_circuit": True
+            }
+        
+        result = plan_via_route(self.get_tree_cache(), start, goal, waypoints)
+        end_time = time.time()
+        
+        if result["path"] is None:
+            return None, {
+                "algorithm": "Via",
+                "nodes_expanded": 0,
+                "runtime": end_time - start_time,
+                "error": result.get("error", "No path found")
+            }
+        
+        return result["path"], {
+            "algorithm": "Via",
+            "nodes_expanded": 0,
+            "runtime": end_time - start_time,
+            "path_length": len(result["path"]),
+            "path_cost": result["cost"],
+            "waypoints": list(waypoints),
+            "waypoint_costs": result["waypoint_costs"],
+            "trees_built": result["trees_built"]
+        }
+    
+    def get_line_graph(self) -> LineGraph:
+        """Get the line graph, rebuilding it when the disruption overlay changes"""
+        if self.line_graph is None or self._is_stale("line_graph"):
+            self.line_graph = LineGraph(self.network)
+            self.built_versions["line_graph"] = self._network_version()
+        return self.line_graph
+    
+    def min_transfer(self, start: str, goal: str) -> Tuple[Optional[List[str]], Dict]:
+        """Minimum-Transfer routing (fewest line changes, then quickest)"""
+        start_time = time.time()
+        
+        if start not in self.network.stations or goal not in self.network.stations:
+            return None, {"error": "Invalid start or goal station"}
+        
+        disconnected = self._disconnected_stats(start, goal, "MT", start_time)
+        if disconnected:
+            return None, disconnected
+        
+        result = self.get_line_graph().query(start, goal)
+        end_time = time.time()
+        
+        if result["path"] is None:
+            return None, {
+                "algorithm": "MT",
+                "nodes_expanded": 0,
+                "runtime": end_time - start_time,
+                "error": "No path found"
+            }
+        
+        return result["path"], {
+            "algorithm": "MT",
+            "nodes_expanded": result["sequences_checked"],
+            "runtime": end_time - start_time,
+            "path_length": len(result["path"]),
+            "path_cost": result["cost"],
+            "transfers": result["transfers"],
+            "lines": result["lines"],
+            "transfer_stations": result["transfer_stations"]
+        }
+    
+    def get_reliability_model(self) -> ReliabilityModel:
+        """Get the disruption cost vectors, rebuilding them when the overlay changes"""
+        if self.reliability_model is None or self._is_stale("reliability_model"):
+            self.reliability_model = ReliabilityModel(self.network, self.status_probabilities)
+            self.built_versions["reliability_model"] = self._network_version()
+        return self.reliability_model
+    
+    def reliable_route(self, start: str, goal: str, objective: str = "expected",
+                       percentile: float = 0.9, deadline: float = None) -> Tuple[Optional[List[str]], Dict]:
+        """
+        Reliability-aware routing under random service disruptions
+        objective: "expected" travel time or "percentile" (e.g. 0.9)
+        """
+        start_time = time.time()
+        
+        if start not in self.network.stations or goal not in self.network.stations:
+            return None, {"error": "Invalid start or goal station"}
+        
+        if objective not in ("expected", "percentile"):
+            return None, {"error": f"Invalid objective: {objective}"}
+        
+        disconnected = self._disconnected_stats(start, goal, "REL", start_time)
+        if disconnected:
+            return None, disconnected
+        
+        result = self.get_reliability_model().route(start, goal, objective, percentile, deadline)
+        path = result.pop("path")
+        end_time = time.time()
+        
+        if path is None:
+            return None, {
+                "algorithm": "REL",
+                "nodes_expanded": result["nodes_expanded"],
+                "runtime": end_time - start_time,
+                "error": "No path found"
+            }
+        
+        return path, {
+            "algorithm": "REL",
+            "runtime": end_time - start_time,
+            "path_length": len(path),
+            "path_cost": result["expected_time"],
+            "objective": objective,
+            **result
+        }
+    
+    def get_td_router(self) -> TimeDependentRouter:
+        """Get the time-dependent edge profiles, rebuilding them when the overlay changes"""
+        if self.td_router is None or self._is_stale("td_router"):
+            self.td_router = TimeDependentRouter(self.network)
+            self.built_versions["td_router"] = self._network_version()
+        return self.td_router
+    
+    def time_dependent_route(self, start: str, goal: str, departure="Morning") -> Tuple[Optional[List[str]], Dict]:
+        """
+        Earliest-arrival routing with peak/off-peak travel times
+        departure: minutes after midnight, "HH:MM" or a period name ("Morning")
+        """
+        start_time = time.time()
+        
+        if start not in self.network.stations or goal not in self.network.stations:
+            return None, {"error": "Invalid start or goal station"}
+        
+        try:
+            parse_departure(departure)
+        except (ValueError, TypeError):
+            return None, {"error": f"Invalid departure time: {departure}"}
+        
+        disconnected = self._disconnected_stats(start, goal, "TD", start_time)
+        if disconnected:
+            return None, disconnected
+        
+        result = self.get_td_router().route(start, goal, departure)
+        path = result.pop("path")
+        end_time = time.time()
+        
+        if path is None:
+            return None, {
+                "algorithm": "TD",
+                "nodes_expanded": result["nodes_expanded"],
+                "runtime": end_time - start_time,
+                "error": "No path found"
+            }
+        
+        return path, {
+            "algorithm": "TD",
+            "runtime": end_time - start_time,
+            "path_length": len(path),
+            "path_cost": result["travel_time"],
+            **result
+        }
+    
+    def get_compressed_network(self) -> CompressedNetwork:
+        """Get the chain-contracted skeleton, building it on first use"""
+        if self.compressed is None or self._is_stale("compressed"):
+            self.compressed = CompressedNetwork(self.network)
+            self.built_versions["compressed"] = self._network_version()
+        return self.compressed
+    
+    def run_compressed(self, algorithm: str, start: str, goal: str) -> Tuple[Optional[List[str]], Dict]:
+        """
+        Run a graph search engine (see COMPRESSIBLE_ENGINES) on the compressed skeleton
+        Start and goal are attached to their chains for this query only, and the
+        resulting path is expanded back to the full station list
+        """
+        start_time = time.time()
+        
+        if start not in self.network.stations or goal not in self.network.stations:
+            return None, {"error": "Invalid start or goal station"}
+        
+        if algorithm not in COMPRESSIBLE_ENGINES:
+            return None, {"error": f"Algorithm cannot run on the compressed network: {algorithm}"}
+        
+        view = self.get_compressed_network().attach(start, goal)
+        view_searcher = SearchAlgorithms(view)
+        view_searcher.connectivity = self.get_connectivity()
+        view_searcher.connectivity_pruning = self.connectivity_pruning
+        engine = getattr(view_searcher, algorithm)
+        path, stats = engine(start, goal)
+        
+        stats = dict(stats)
+        stats["compressed"] = True
+        stats["searched_stations"] = len(view.stations)
+        if path:
+            path = view.expand_path(path)
+            stats["path_length"] = len(path)
+            stats["path_cost"] = self._calculate_path_cost(path)
+        stats["runtime"] = time.time() - start_time
+        
+        return path, stats
+    
     def _calculate_path_cost(self, path: List[str]) -> float:
         """Calculate total cost of a path"""
         if not path or len(path) < 2:
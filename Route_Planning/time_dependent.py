@@ -0,0 +1,311 @@
+"""
+Time-Dependent Routing for MRT Route Planner
+Peak/off-peak travel times as piecewise-linear functions of departure time,
+with a FIFO time-dependent Dijkstra / A* over the line-state graph
+
+Every ride arc has a profile: its travel time at a fixed set of breakpoints
+across the day (shared by all profiles), linearly interpolated between
+them. Profiles are stored once in a compact float array and arcs keep only
+a profile id, so the many segments with the same base time share storage.
+A lookup is one bisect on the breakpoint grid plus one blend, and the grid
+position is reused for every arc relaxed at the same clock time.
+
+The periods follow the crowding-risk network's time-of-day variable
+('Morning', 'Afternoon', 'Evening'). Profiles must be FIFO (leaving later
+never means arriving earlier, i.e. slope >= -1), which keeps time-dependent
+Dijkstra exact.
+"""
+
+import heapq
+import time
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from state_graph import LineStateGraph, INF
+
+
+MINUTES_PER_DAY = 1440
+
+# Breakpoints (minutes after midnight) shared by every profile
+BREAKPOINTS = np.array([0, 360, 480, 600, 720, 900, 1080, 1200, 1440], dtype=np.float64)
+
+# Network-wide riding-time factor at each breakpoint (peaks at 08:00 and 18:00)
+PEAK_FACTORS = np.array([1.0, 1.0, 1.2, 1.05, 1.0, 1.0, 1.25, 1.05, 1.0])
+
+# Extra dwell/boarding minutes on segments touching the airport stations
+AIRPORT_STATIONS = {"Changi Airport", "Changi Terminal 5"}
+AIRPORT_DWELL = np.array([0.5, 1.0, 2.5, 1.5, 1.5, 2.0, 2.0, 2.5, 0.5])
+
+# Periods of the crowding-risk network and a representative departure time
+PERIODS = {
+    "Morning": (360, 720, 480),
+    "Afternoon": (720, 1020, 840),
+    "Evening": (1020, 1440, 1080),
+}
+
+
+def parse_departure(departure: Union[int, float, str]) -> float:
+    """Minutes after midnight from minutes, "HH:MM" or a period name"""
+    if isinstance(departure, str):
+        if departure in PERIODS:
+            return float(PERIODS[departure][2])
+        hours, minutes = departure.split(":")
+        return float(int(hours) * 60 + int(minutes))
+    return float(departure)
+
+
+def period_of(minutes: float) -> str:
+    """Crowding-network period for a clock time ('Night' outside the three)"""
+    clock = minutes % MINUTES_PER_DAY
+    for name, (start, end, _) in PERIODS.items():
+        if start <= clock < end:
+            return name
+    return "Night"
+
+
+def format_clock(minutes: float) -> str:
+    clock = int(round(minutes)) % MINUTES_PER_DAY
+    return f"{clock // 60:02d}:{clock % 60:02d}"
+
+
+class ProfileStore:
+    """
+    Deduplicated piecewise-linear profiles on a shared breakpoint grid
+
+    values[p] holds profile p's travel time at each breakpoint; slopes[p]
+    holds the per-interval slope so evaluation is one multiply-add.
+    """
+
+    def __init__(self, breakpoints: np.ndarray = BREAKPOINTS):
+        self.breakpoints = breakpoints
+        self.grid = breakpoints.tolist()
+        self.index = {}    # rounded value tuple -> profile id
+        self.rows = []
+        self.values = np.zeros((0, len(breakpoints)), dtype=np.float32)
+        self.slopes = np.zeros((0, len(breakpoints) - 1), dtype=np.float32)
+        self.min_values = np.zeros(0, dtype=np.float32)
+
+    def add(self, values: np.ndarray) -> int:
+        """Register a profile (or find an identical one) and return its id"""
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape != self.breakpoints.shape:
+            raise ValueError("Profile must have one value per breakpoint")
+        slopes = np.diff(values) / np.diff(self.breakpoints)
+        if np.any(slopes < -1):
+            raise ValueError("Profile violates FIFO (travel time falls faster than the clock)")
+
+        key = tuple(np.round(values, 6))
+        if key not in self.index:
+            self.index[key] = len(self.rows)
+            self.rows.append(values)
+        return self.index[key]
+
+    def freeze(self):
+        """Pack the registered profiles into the lookup arrays"""
+        self.values = np.array(self.rows, dtype=np.float32).reshape(-1, len(self.breakpoints))
+        self.slopes = (np.diff(self.values, axis=1) / np.diff(self.breakpoints)).astype(np.float32)
+        self.min_values = self.values.min(axis=1) if len(self.rows) else self.min_values
+        # Plain-list views make scalar lookups in the search loop cheap
+        self._values = self.values.tolist()
+        self._slopes = self.slopes.tolist()
+
+    def locate(self, minutes: float) -> Tuple[int, float]:
+        """Grid interval and offset for a clock time (wraps around midnight)"""
+        clock = minutes % MINUTES_PER_DAY
+        interval = min(bisect_right(self.grid, clock) - 1, len(self.grid) - 2)
+        return interval, clock - self.grid[interval]
+
+    def evaluate(self, profile: int, interval: int, offset: float) -> float:
+        """Travel time of a profile at a located clock time"""
+        return self._values[profile][interval] + self._slopes[profile][interval] * offset
+
+    def travel_time(self, profile: int, minutes: float) -> float:
+        """Travel time of a profile when departing at a clock time"""
+        return self.evaluate(profile, *self.locate(minutes))
+
+    def stats(self) -> Dict:
+        return {
+            "profiles": len(self.rows),
+            "breakpoints": len(self.grid),
+            "bytes": int(self.values.nbytes + self.slopes.nbytes)
+        }
+
+
+def default_profile(base_minutes: float, airport: bool) -> np.ndarray:
+    """Peak-scaled riding time plus airport dwell where it applies"""
+    values = base_minutes * PEAK_FACTORS
+    if airport:
+        values = values + AIRPORT_DWELL
+    return values
+
+
+class TimeDependentRouter:
+    """FIFO time-dependent shortest paths over the line-state graph"""
+
+    def __init__(self, network, profile_fn=default_profile):
+        self.network = network
+        self.graph = LineStateGraph(network)
+        self.profiles = ProfileStore()
+
+        # arc_profiles[u][i] = profile id of forward[u][i], or -1 for constant arcs
+        graph = self.graph
+        self.arc_profiles = []
+        for u in range(len(graph)):
+            ids = []
+            for v, weight in graph.forward[u]:
+                if graph.is_ride_arc(u, v):
+                    airport = (graph.node_station[u] in AIRPORT_STATIONS
+                               or graph.node_station[v] in AIRPORT_STATIONS)
+                    ids.append(self.profiles.add(profile_fn(weight, airport)))
+                else:
+                    ids.append(-1)
+            self.arc_profiles.append(ids)
+        self.profiles.freeze()
+
+        # The straight-line heuristic can overestimate a segment's time, so it
+        # is scaled down until no ride arc is faster than it at any time of
+        # day; the scaled heuristic is then consistent and TD-A* stays exact
+        self.heuristic_scale = 1.0
+        for u in range(len(graph)):
+            for (v, _), profile in zip(graph.forward[u], self.arc_profiles[u]):
+                if profile < 0:
+                    continue
+                straight = network.heuristic(graph.node_station[u], graph.node_station[v])
+                if straight > 0:
+                    self.heuristic_scale = min(self.heuristic_scale,
+                                               float(self.profiles.min_values[profile]) / straight)
+
+    def arc_count(self) -> int:
+        return sum(1 for ids in self.arc_profiles for p in ids if p >= 0)
+
+    def search(self, start: str, goal: str, departure: float, use_heuristic: bool = True
+               ) -> Tuple[Optional[List[int]], float, int]:
+        """
+        Earliest arrival at goal when leaving start at `departure`
+
+        Returns (state-node path, arrival time, nodes expanded). Labels are
+        arrival clock times; FIFO profiles make a settled label final.
+        """
+        graph = self.graph
+        if start not in graph.source_node or goal not in graph.sink_node:
+            return None, INF, 0
+        source, sink = graph.source_node[start], graph.sink_node[goal]
+        profiles = self.profiles
+
+        h = {}
+
+        def heuristic(node):
+            if not use_heuristic:
+                return 0.0
+            station = graph.node_station[node]
+            if station not in h:
+                h[station] = self.network.heuristic(station, goal) * self.heuristic_scale
+            return h[station]
+
+        arrival = {source: departure}
+        parent = {source: -1}
+        frontier = [(departure + heuristic(source), source)]
+        settled = set()
+        while frontier:
+            _, u = heapq.heappop(frontier)
+            if u in settled:
+                continue
+            settled.add(u)
+            if u == sink:
+                node_path = [u]
+                while parent[node_path[-1]] >= 0:
+                    node_path.append(parent[node_path[-1]])
+                return node_path[::-1], arrival[u], len(settled)
+
+            now = arrival[u]
+            interval, offset = profiles.locate(now)
+            for (v, weight), profile in zip(graph.forward[u], self.arc_profiles[u]):
+                if v in settled:
+                    continue
+                step = weight if profile < 0 else profiles.evaluate(profile, interval, offset)
+                candidate = now + step
+                if candidate < arrival.get(v, INF):
+                    arrival[v] = candidate
+                    parent[v] = u
+                    heapq.heappush(frontier, (candidate + heuristic(v), v))
+        return None, INF, len(settled)
+
+    def route(self, start: str, goal: str, departure: Union[int, float, str],
+              use_heuristic: bool = True) -> Dict:
+        """Station path, arrival clock time and travel time for a departure"""
+        depart = parse_departure(departure)
+        node_path, arrive, expanded = self.search(start, goal, depart, use_heuristic)
+        if node_path is None:
+            return {"path": None, "nodes_expanded": expanded}
+        return {
+            "path": self.graph.stations_on_path(node_path),
+            "nodes_expanded": expanded,
+            "departure": format_clock(depart),
+            "arrival": format_clock(arrive),
+            "period": period_of(depart),
+            "travel_time": arrive - depart
+        }
+
+
+def main():
+    """Airport journeys across the day and static vs time-dependent costs"""
+    from task1_route_planning import MRTNetwork
+
+    print("Time-Dependent Routing (piecewise-linear peak profiles)")
+    print("=" * 80)
+
+    queries = [
+        ("Jurong East", "Changi Airport"),
+        ("City Hall", "Changi Airport"),
+        ("Woodlands", "Changi Terminal 5"),
+    ]
+    departures = ["06:00", "Morning", "10:00", "Afternoon", "Evening", "21:00"]
+
+    for mode in ["today", "future"]:
+        network = MRTNetwork(mode=mode)
+        start_time = time.time()
+        router = TimeDependentRouter(network)
+        build_time = time.time() - start_time
+        stats = router.profiles.stats()
+
+        print(f"\n{mode.upper()} network")
+        print("-" * 80)
+        print(f"  {router.arc_count()} ride arcs share {stats['profiles']} profiles "
+              f"({stats['breakpoints']} breakpoints, {stats['bytes']} bytes), "
+              f"built in {build_time * 1000:.1f} ms")
+        print(f"  {'Route':<36} " + " ".join(f"{d:>9}" for d in departures))
+        for origin, destination in queries:
+            if not (network.is_station_available(origin) and network.is_station_available(destination)):
+                continue
+            times = [router.route(origin, destination, d)["travel_time"] for d in departures]
+            print(f"  {origin + ' -> ' + destination:<36} " + " ".join(f"{t:>9.1f}" for t in times))
+
+        # TD-A* against TD-Dijkstra on sampled pairs and departures
+        stations = network.available_stations
+        pairs = [(a, b) for a in stations[::9] for b in stations[::13] if a != b]
+        mismatches = 0
+        astar_time = dijkstra_time = 0.0
+        astar_expanded = dijkstra_expanded = 0
+        for i, (origin, destination) in enumerate(pairs):
+            departure = float(i * 37 % MINUTES_PER_DAY)
+            start_time = time.time()
+            _, arrive_astar, expanded = router.search(origin, destination, departure)
+            astar_time += time.time() - start_time
+            astar_expanded += expanded
+            start_time = time.time()
+            _, arrive_dijkstra, expanded = router.search(origin, destination, departure,
+                                                         use_heuristic=False)
+            dijkstra_time += time.time() - start_time
+            dijkstra_expanded += expanded
+            if abs(arrive_astar - arrive_dijkstra) > 1e-6:
+                mismatches += 1
+        n = len(pairs)
+        print(f"\n  {n} queries: TD-A* {astar_time / n * 1000:.3f} ms "
+              f"({astar_expanded / n:.0f} nodes), TD-Dijkstra {dijkstra_time / n * 1000:.3f} ms "
+              f"({dijkstra_expanded / n:.0f} nodes), arrival mismatches {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+"""
+Trip Assignment for MRT Route Planner
+Replays a day of origin-destination trip records onto the network and
+aggregates passenger loads per ride segment and per station
+
+Trip CSVs (timestamp, origin, destination) are streamed in chunks. Each
+chunk is collapsed to unique (time bucket, origin, destination) counts, and
+every distinct origin-destination pair is routed only once per network
+version, from the reverse shortest-path tree of its destination (a
+ShortestPathTreeCache shared by all pairs ending there). Routes are kept as
+flat edge/station id arrays, so loading a chunk is a single NumPy scatter
+into (bucket x edge) and (bucket x station) count matrices.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from state_graph import INF
+from spt_cache import ShortestPathTreeCache, HOT_DESTINATIONS
+
+
+MINUTES_PER_DAY = 1440
+BUCKET_MINUTES = 15             # width of a time bucket in the load tables
+DEFAULT_CHUNK_SIZE = 200_000    # CSV rows read per chunk
+TRIP_COLUMNS = ["timestamp", "origin", "destination"]
+CLOCK_PATTERN = r"(\d{1,2}):(\d{2})(?::\d{2}(?:\.\d+)?)?"  # "HH:MM[:SS[.ffffff]]"
+
+
+class EdgeIndex:
+    """Stable integer ids for the stations and directed ride edges of a network"""
+
+    def __init__(self, network):
+        # Taken from the full adjacency (closures included) so ids stay fixed
+        # while the disruption overlay changes
+        self.stations = sorted(network.graph)
+        self.station_id = {station: i for i, station in enumerate(self.stations)}
+        self.edges = sorted({(station, neighbor, line)
+                             for station, neighbors in network.graph.items()
+                             for neighbor, _, line in neighbors})
+        self.edge_id = {edge: i for i, edge in enumerate(self.edges)}
+
+
+def minutes_of_day(values: pd.Series) -> np.ndarray:
+    """Minutes after midnight from numeric minutes, "HH:MM[:SS]" or ISO 8601 datetimes"""
+    if pd.api.types.is_numeric_dtype(values):
+        return values.to_numpy(dtype=np.float64) % MINUTES_PER_DAY
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return (values.dt.hour * 60 + values.dt.minute).to_numpy(dtype=np.float64)
+    text = values.astype(str).str.strip()
+    minutes = np.empty(len(text), dtype=np.float64)
+    clock = text.str.fullmatch(CLOCK_PATTERN).to_numpy(dtype=bool)
+    if clock.any():
+        parts = text[clock].str.extract(CLOCK_PATTERN).astype(int)
+        minutes[clock] = (parts[0] * 60 + parts[1]).to_numpy(dtype=np.float64)
+    if not clock.all():
+        stamps = pd.to_datetime(text[~clock], format="ISO8601")
+        minutes[~clock] = (stamps.dt.hour * 60 + stamps.dt.minute).to_numpy(dtype=np.float64)
+    return minutes
+
+
+class TripAssignment:
+    """
+    Streaming all-or-nothing assignment of trip records for one network mode
+
+    bucket_minutes: width of the time buckets loads are counted in
+    cache: tree cache to route through (default: a private one large enough
+    to keep a tree for every destination)
+    """
+
+    def __init__(self, network, bucket_minutes: int = BUCKET_MINUTES,
+                 cache: Optional[ShortestPathTreeCache] = None):
+        self.network = network
+        self.bucket_minutes = bucket_minutes
+        self.index = EdgeIndex(network)
+        self.cache = cache or ShortestPathTreeCache(network, hot_destinations=[],
+                                                    capacity=len(self.index.stations))
+
+        buckets = -(-MINUTES_PER_DAY // bucket_minutes)
+        self.edge_loads = np.zeros((buckets, len(self.index.edges)), dtype=np.int64)
+        self.station_loads = np.zeros((buckets, len(self.index.stations)), dtype=np.int64)
+        self.entries = np.zeros(len(self.index.stations), dtype=np.int64)
+        self.exits = np.zeros(len(self.index.stations), dtype=np.int64)
+
+        # route id per (origin, destination); -1 when no route exists
+        self.route_ids = {}
+        self.route_edges = []     # route id -> edge id array
+        self.route_stations = []  # route id -> station id array
+        self.routes_version = getattr(network, "version", 0)
+        self._flat = None         # CSR views of the routes, rebuilt when routes are added
+
+        self.counters = {"trips": 0, "unique_groups": 0, "routes": 0,
+                         "unroutable_trips": 0, "same_station_trips": 0, "chunks": 0}
+        self.runtime = 0.0
+
+    def _route_id(self, origin: str, destination: str) -> int:
+        """Route a pair on first sight from its destination's reverse tree"""
+        key = (origin, destination)
+        if key in self.route_ids:
+            return self.route_ids[key]
+
+        tree, _ = self.cache.lookup(destination, force=True)
+        if tree is None or tree.cost(origin) == INF:
+            self.route_ids[key] = -1
+            return -1
+
+        graph = tree.graph
+        node = graph.source_node[origin]
+        node_path = [node]
+        edges = []
+        while tree.next_node[node] >= 0:
+            following = tree.next_node[node]
+            if graph.is_ride_arc(node, following):
+                edges.append(self.index.edge_id[(graph.node_station[node],
+                                                 graph.node_station[following],
+                                                 graph.node_line[node])])
+            node = following
+            node_path.append(node)
+        stations = [self.index.station_id[s] for s in graph.stations_on_path(node_path)]
+
+        route = len(self.route_edges)
+        self.route_edges.append(np.array(edges, dtype=np.int64))
+        self.route_stations.append(np.array(stations, dtype=np.int64))
+        self.route_ids[key] = route
+        self.counters["routes"] += 1
+        self._flat = None
+        return route
+
+    def _csr(self):
+        """(offsets, flat ids) for route edges and route stations"""
+        if self._flat is None:
+            self._flat = tuple(
+                (np.concatenate([[0], np.cumsum([len(r) for r in routes])]).astype(np.int64),
+                 np.concatenate(routes) if routes else np.zeros(0, dtype=np.int64))
+                for routes in (self.route_edges, self.route_stations))
+        return self._flat
+
+    @staticmethod
+    def _scatter(loads: np.ndarray, offsets: np.ndarray, flat: np.ndarray,
+                 routes: np.ndarray, buckets: np.ndarray, counts: np.ndarray):
+        """Add counts[i] to loads[buckets[i], id] for every id on route routes[i]"""
+        lengths = offsets[routes + 1] - offsets[routes]
+        row = np.repeat(np.arange(len(routes)), lengths)
+        starts = np.cumsum(lengths) - lengths
+        positions = offsets[routes][row] + np.arange(len(row)) - starts[row]
+        cells = buckets[row] * loads.shape[1] + flat[positions]
+        loads += np.bincount(cells, weights=counts[row],
+                             minlength=loads.size).reshape(loads.shape).astype(np.int64)
+
+    def assign_chunk(self, trips: pd.DataFrame):
+        """Load one chunk of trip records (TRIP_COLUMNS) onto the network"""
+        start_time = time.time()
+        version = getattr(self.network, "version", 0)
+        if version != self.routes_version:
+            self.route_ids.clear()
+            self.route_edges.clear()
+            self.route_stations.clear()
+            self._flat = None
+            self.routes_version = version
+
+        # Trips that start and end at the same station ride no segment and
+        # are counted apart, so they do not enter the entry/exit totals
+        same_station = (trips["origin"] == trips["destination"]).to_numpy()
+        self.counters["same_station_trips"] += int(same_station.sum())
+        self.counters["trips"] += len(trips)
+        trips = trips[~same_station]
+
+        buckets = (minutes_of_day(trips["timestamp"]) // self.bucket_minutes).astype(np.int64)
+        frame = pd.DataFrame({"destination": trips["destination"].to_numpy(),
+                              "origin": trips["origin"].to_numpy(),
+                              "bucket": buckets})
+        # Sorted by destination, so each destination's tree serves a whole run
+        counts = frame.groupby(["destination", "origin", "bucket"], sort=True).size()
+        pair_codes, pairs = pd.factorize(counts.index.droplevel("bucket"))
+        pair_routes = np.array([self._route_id(o, d) for d, o in pairs], dtype=np.int64)
+
+        routes = pair_routes[pair_codes]
+        buckets = counts.index.get_level_values("bucket").to_numpy(dtype=np.int64)
+        counts = counts.to_numpy(dtype=np.int64)
+        routed = routes >= 0
+
+        self.counters["unique_groups"] += len(counts)
+        self.counters["unroutable_trips"] += int(counts[~routed].sum())
+        self.counters["chunks"] += 1
+
+        routes, buckets, counts = routes[routed], buckets[routed], counts[routed]
+        (edge_offsets, edge_flat), (station_offsets, station_flat) = self._csr()
+        self._scatter(self.edge_loads, edge_offsets, edge_flat, routes, buckets, counts)
+        self._scatter(self.station_loads, station_offsets, station_flat, routes, buckets, counts)
+
+        # First and last station of each route are the entry and exit
+        first = station_flat[station_offsets[routes]]
+        last = station_flat[station_offsets[routes + 1] - 1]
+        self.entries += np.bincount(first, weights=counts,
+                                    minlength=len(self.entries)).astype(np.int64)
+        self.exits += np.bincount(last, weights=counts,
+                                  minlength=len(self.exits)).astype(np.int64)
+        self.runtime += time.time() - start_time
+
+    def assign_csv(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Stream a trip CSV through assign_chunk"""
+        reader = pd.read_csv(path, usecols=TRIP_COLUMNS, chunksize=chunk_size,
+                             dtype={"origin": str, "destination": str})
+        for chunk in reader:
+            self.assign_chunk(chunk)
+
+    def _clock(self, bucket: int) -> str:
+        minutes = int(bucket) * self.bucket_minutes
+        return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+    def edge_table(self) -> pd.DataFrame:
+        """Daily trips per directed segment with the busiest bucket, busiest first"""
+        totals = self.edge_loads.sum(axis=0)
+        peaks = self.edge_loads.argmax(axis=0)
+        table = pd.DataFrame(self.index.edges, columns=["from_station", "to_station", "line"])
+        table["trips"] = totals
+        table["peak_bucket"] = [self._clock(b) for b in peaks]
+        table["peak_trips"] = self.edge_loads.max(axis=0)
+        return table.sort_values("trips", ascending=False, kind="stable").reset_index(drop=True)
+
+    def station_table(self) -> pd.DataFrame:
+        """Entries, exits and trips passing through each station, busiest first"""
+        visits = self.station_loads.sum(axis=0)
+        table = pd.DataFrame({"station": self.index.stations,
+                              "entries": self.entries,
+                              "exits": self.exits,
+                              "through": visits - self.entries - self.exits,
+                              "visits": visits})
+        return table.sort_values("visits", ascending=False, kind="stable").reset_index(drop=True)
+
+    def stats(self) -> Dict:
+        """Counters plus throughput in trips per second"""
+        return {
+            **self.counters,
+            "mode": self.network.mode,
+            "runtime": self.runtime,
+            "trips_per_second": self.counters["trips"] / self.runtime if self.runtime else 0.0,
+            "tree_builds": self.cache.counters["builds"]
+        }
+
+
+def generate_trip_log(path: str, stations: List[str], trips: int = 500_000, seed: int = 7):
+    """Write a synthetic day of trips with morning/evening peaks and airport demand"""
+    rng = np.random.default_rng(seed)
+    origins = rng.choice(stations, size=trips)
+    airport = [s for s in HOT_DESTINATIONS if s in stations]
+    destinations = np.where(rng.random(trips) < 0.2,
+                            rng.choice(airport, size=trips), rng.choice(stations, size=trips))
+
+    # Morning peak, evening peak and a flat base across service hours
+    kind = rng.choice(3, size=trips, p=[0.35, 0.35, 0.3])
+    seconds = np.select([kind == 0, kind == 1],
+                        [rng.normal(8 * 3600, 3600, trips), rng.normal(18 * 3600, 4500, trips)],
+                        rng.uniform(5.5 * 3600, 23.5 * 3600, trips))
+    seconds = np.clip(seconds, 0, MINUTES_PER_DAY * 60 - 1).astype(np.int64)
+    stamps = pd.Timestamp("2024-01-15") + pd.to_timedelta(seconds, unit="s")
+
+    frame = pd.DataFrame({"timestamp": stamps, "origin": origins, "destination": destinations})
+    keep = frame["origin"] != frame["destination"]
+    frame[keep].sort_values("timestamp").to_csv(path, index=False,
+                                                date_format="%Y-%m-%d %H:%M:%S")
+
+
+def main():
+    """Assign a trip log (argument, or a synthetic one) onto both network modes"""
+    from task1_route_planning import MRTNetwork, SearchAlgorithms
+
+    print("Trip Assignment (streaming, deduplicated OD, tree-cached routes)")
+    print("=" * 80)
+
+    if len(sys.argv) > 1:
+        path = sys.argv[1]
+    else:
+        path = os.path.join(tempfile.gettempdir(), "mrt_synthetic_trips.csv")
+        start_time = time.time()
+        generate_trip_log(path, MRTNetwork(mode="future").available_stations)
+        print(f"Synthetic trip log written to {path} in {time.time() - start_time:.1f} s")
+
+    for mode in ["today", "future"]:
+        network = MRTNetwork(mode=mode)
+        assignment = TripAssignment(network)
+        assignment.assign_csv(path)
+        stats = assignment.stats()
+
+        print(f"\n{mode.upper()} network")
+        print("-" * 80)
+        print(f"  {stats['trips']:,} trips in {stats['chunks']} chunks -> "
+              f"{stats['unique_groups']:,} (bucket, OD) groups, {stats['routes']:,} routes, "
+              f"{stats['tree_builds']} trees; {stats['unroutable_trips']:,} unroutable, "
+              f"{stats['same_station_trips']:,} same-station")
+        print(f"  {stats['runtime']:.2f} s, {stats['trips_per_second']:,.0f} trips/s")
+
+        # Baseline: one A* per trip on a sample
+        sample = pd.read_csv(path, nrows=2000)
+        searcher = SearchAlgorithms(network)
+        start_time = time.time()
+        for origin, destination in zip(sample["origin"], sample["destination"]):
+            searcher.astar(origin, destination)
+        print(f"  Per-trip A* baseline: {len(sample) / (time.time() - start_time):,.0f} trips/s")
+
+        print(f"\n  {'Segment':<44} {'Line':<5} {'Trips':>9} {'Peak':>6} {'Peak trips':>11}")
+        for row in assignment.edge_table().head(10).itertuples():
+            print(f"  {row.from_station + ' -> ' + row.to_station:<44} {row.line:<5} "
+                  f"{row.trips:>9,} {row.peak_bucket:>6} {row.peak_trips:>11,}")
+
+        print(f"\n  {'Station':<25} {'Entries':>9} {'Exits':>9} {'Through':>9}")
+        for row in assignment.station_table().head(5).itertuples():
+            print(f"  {row.station:<25} {row.entries:>9,} {row.exits:>9,} {row.through:>9,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Waypoint-Constrained Routing for MRT Route Planner
+Shortest journeys forced through an ordered list of waypoints ("via Expo")
+
+Chaining independent searches restarts at every waypoint with no line, so
+a line change at the waypoint goes uncharged and the legs need not agree
+on the train the passenger is actually on. Instead every leg joins at the
+waypoint's (station, line) states: a dynamic program over the lines at each
+waypoint keeps the best cost of arriving on every line. Leg distances come
+from cached trees rooted at those states (reverse trees for the first leg,
+forward trees after), so a popular waypoint such as Expo costs only array
+lookups once its trees exist.
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+from state_graph import INF
+from spt_cache import ShortestPathTreeCache
+
+
+def plan_via_route(cache: ShortestPathTreeCache, origin: str, destination: str,
+                   waypoints: List[str]) -> Dict:
+    """
+    Exact shortest journey origin -> waypoints (in order) -> destination
+
+    Returns a dict with the station path (None if any leg is impossible),
+    total cost, the cost at which each waypoint is reached and the number
+    of trees that had to be built.
+    """
+    graph = cache.state_graph()
+    builds_before = cache.counters["state_builds"]
+    for station in [origin] + list(waypoints) + [destination]:
+        if station not in graph.source_node:
+            return {"path": None, "cost": INF, "waypoint_costs": [], "trees_built": 0,
+                    "error": f"Station unavailable: {station}"}
+
+    source = graph.source_node[origin]
+    sink = graph.sink_node[destination]
+    if not waypoints:
+        tree = cache.state_tree(source)
+        return _result(graph, tree.node_path(sink), tree.dist[sink], [], cache, builds_before)
+
+    # layers[i][state] = (best cost arriving at waypoint i in that line state,
+    #                     (tree holding the leg, state the leg started from))
+    # The first leg reads reverse trees rooted at the first waypoint's states,
+    # so it is shared by every origin
+    layers = [{}]
+    for node in _line_states(graph, waypoints[0]):
+        tree = cache.state_tree(node, reverse=True)
+        layers[0][node] = (tree.dist[source], (tree, source))
+
+    for waypoint in waypoints[1:]:
+        layer = {}
+        for node, (cost, _) in layers[-1].items():
+            if cost == INF:
+                continue
+            tree = cache.state_tree(node)
+            for target in _line_states(graph, waypoint):
+                candidate = cost + tree.dist[target]
+                if target not in layer or candidate < layer[target][0]:
+                    layer[target] = (candidate, (tree, node))
+        layers.append(layer)
+
+    # Final leg into the destination's sink
+    final_cost, final_leg = INF, None
+    for node, (cost, _) in layers[-1].items():
+        if cost == INF:
+            continue
+        tree = cache.state_tree(node)
+        if cost + tree.dist[sink] < final_cost:
+            final_cost, final_leg = cost + tree.dist[sink], (tree, node)
+
+    if final_leg is None:
+        return _result(graph, None, INF, [], cache, builds_before)
+
+    # Walk the back-pointers, stitching legs together at the join states so
+    # the line a passenger arrives on is the line the next leg departs on
+    tree, node = final_leg
+    legs = [tree.node_path(sink)]
+    waypoint_costs = []
+    for layer in reversed(layers):
+        cost, (tree, previous) = layer[node]
+        waypoint_costs.append(cost)
+        legs.append(tree.node_path(previous if tree.reverse else node))
+        node = previous
+    legs.reverse()
+    waypoint_costs.reverse()
+
+    node_path = list(legs[0])
+    for leg in legs[1:]:
+        node_path.extend(leg[1:])  # each leg starts at the previous leg's end state
+
+    return _result(graph, node_path, final_cost, waypoint_costs, cache, builds_before)
+
+
+def _line_states(graph, station: str) -> List[int]:
+    """The (station, line) nodes of a station (the heads of its source arcs)"""
+    return [node for node, _ in graph.forward[graph.source_node[station]]]
+
+
+def _result(graph, node_path: Optional[List[int]], cost: float,
+            waypoint_costs: List[float], cache: ShortestPathTreeCache,
+            builds_before: int) -> Dict:
+    return {
+        "path": graph.stations_on_path(node_path) if node_path and cost < INF else None,
+        "cost": cost,
+        "waypoint_costs": waypoint_costs,
+        "trees_built": cache.counters["state_builds"] - builds_before
+    }
+
+
+def chained_independent_cost(searcher, stops: List[str]) -> Tuple[float, float]:
+    """Baseline: one exact search per leg, restarting with no line at each stop"""
+    start_time = time.time()
+    total = 0
+    for leg_start, leg_end in zip(stops, stops[1:]):
+        total += searcher.hub_label_cost(leg_start, leg_end)
+    return total, time.time() - start_time
+
+
+def main():
+    """Via-Expo airport routes and a comparison with chained per-leg searches"""
+    from task1_route_planning import MRTNetwork, SearchAlgorithms
+
+    print("Waypoint-Constrained Routing")
+    print("=" * 80)
+
+    queries = [
+        ("Raffles Place", "Changi Airport", ["Expo"]),
+        ("Jurong East", "Changi Airport", ["Expo"]),
+        ("Bishan", "Changi Airport", ["Tampines", "Expo"]),
+        ("Tanah Merah", "Changi Airport", ["Expo"]),
+        ("Woodlands", "City Hall", ["Bishan", "Dhoby Ghaut"]),
+    ]
+
+    for mode in ["today", "future"]:
+        network = MRTNetwork(mode=mode)
+        searcher = SearchAlgorithms(network)
+
+        print(f"\n{mode.upper()} network")
+        print("-" * 80)
+        for origin, destination, waypoints in queries:
+            stops = [origin] + waypoints + [destination]
+            if not all(network.is_station_available(s) for s in stops):
+                continue
+            path, stats = searcher.via_route(origin, destination, waypoints)
+            if not path:
+                print(f"  {' -> '.join(stops)}: {stats['error']}")
+                continue
+            chained, _ = chained_independent_cost(searcher, stops)
+            print(f"  {' -> '.join(stops)}")
+            print(f"    Cost {stats['path_cost']} min (chained legs {chained} min), "
+                  f"{stats['path_length']} stations, trees built {stats['trees_built']}, "
+                  f"{stats['runtime'] * 1000:.3f} ms")
+
+        # Repeated via-Expo queries reuse the waypoint's trees
+        origins = [s for s in network.available_stations if s not in ("Expo", "Changi Airport")]
+        start_time = time.time()
+        for origin in origins:
+            searcher.via_route(origin, "Changi Airport", ["Expo"])
+        via_time = time.time() - start_time
+
+        start_time = time.time()
+        for origin in origins:
+            searcher.astar(origin, "Expo")
+            searcher.astar("Expo", "Changi Airport")
+        chained_time = time.time() - start_time
+        print(f"\n  {len(origins)} origins via Expo: cached trees {via_time * 1000:.1f} ms, "
+              f"two A* searches each {chained_time * 1000:.1f} ms")
+        print(f"  Tree cache: {searcher.get_tree_cache().stats()}")
+
+
+if __name__ == "__main__":
+    main()
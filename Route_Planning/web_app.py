@@ -5,7 +5,9 @@ A Flask web interface for planning MRT routes in Singapore
 
 from flask import Flask, render_template, request, jsonify
 import json
+import time
 from task1_route_planning import MRTNetwork, SearchAlgorithms
+from station_search import StationSearchIndex, DEFAULT_RESULT_LIMIT
 from mrt_network_data import LINE_NAMES, LINE_COLORS, TEST_PAIRS_TODAY, TEST_PAIRS_FUTURE, FUTURE_ONLY_STATIONS
 
 app = Flask(__name__)
@@ -13,14 +15,19 @@ app = Flask(__name__)
 # Global variables for network and searcher
 networks = {}
 searchers = {}
+search_indexes = {}
 
 def initialize_networks():
     """Initialize both network modes"""
-    global networks, searchers
+    global networks, searchers, search_indexes
     
     for mode in ['today', 'future']:
         networks[mode] = MRTNetwork(mode=mode)
         searchers[mode] = SearchAlgorithms(networks[mode])
+        search_indexes[mode] = StationSearchIndex(networks[mode].available_stations)
+        searchers[mode].get_hub_labels()
+        searchers[mode].get_connectivity()
+        searchers[mode].get_tree_cache().warm()
 
 @app.route('/')
 def index():
@@ -33,9 +40,20 @@ def get_stations(mode):
     if mode not in networks:
         return jsonify({'error': 'Invalid mode'}), 400
     
-    # Use the network's method to get available stations for the mode
-    stations = networks[mode].get_available_stations()
-    return jsonify({'stations': stations})
+    # Station list is sorted once when the network is built
+    return jsonify({'stations': networks[mode].available_stations})
+
+@app.route('/api/stations/<mode>/search')
+def search_stations(mode):
+    """Autocomplete station names for a given mode"""
+    if mode not in search_indexes:
+        return jsonify({'error': 'Invalid mode'}), 400
+    
+    query = request.args.get('q', '')
+    limit = request.args.get('limit', DEFAULT_RESULT_LIMIT, type=int)
+    
+    results = search_indexes[mode].search(query, limit)
+    return jsonify({'query': query, 'results': results})
 
 @app.route('/api/test-routes/<mode>')
 def get_test_routes(mode):
@@ -60,6 +78,8 @@ def plan_route():
     destination = data.get('destination')
     mode = data.get('mode', 'today')
     algorithm = data.get('algorithm', 'all')
+    compressed = bool(data.get('compressed', False))
+    waypoints = data.get('waypoints') or []
     
     # Validate inputs
     if not origin or not destination:
@@ -77,14 +97,24 @@ def plan_route():
     if not network.is_station_available(destination):
         return jsonify({'error': f'Station "{destination}" is not available in {mode} mode'}), 400
     
-    if origin == destination:
+    if origin == destination and not waypoints:
         return jsonify({'error': 'Origin and destination cannot be the same'}), 400
     
+    if not isinstance(waypoints, list) or not all(isinstance(w, str) for w in waypoints):
+        return jsonify({'error': 'waypoints must be a list of stations'}), 400
+    
+    for waypoint in waypoints:
+        if not network.is_station_available(waypoint):
+            return jsonify({'error': f'Station "{waypoint}" is not available in {mode} mode'}), 400
+    
     # Get searcher for the mode
     searcher = searchers[mode]
     
     # Define algorithms to run
-    if algorithm == 'all':
+    if waypoints:
+        # Via-point routing replaces the algorithm choice
+        algorithms = [('Via', lambda o, d: searcher.via_route(o, d, waypoints))]
+    elif algorithm == 'all':
         algorithms = [
             ('BFS', searcher.bfs),
             ('DFS', searcher.dfs),
@@ -96,7 +126,17 @@ def plan_route():
             'BFS': searcher.bfs,
             'DFS': searcher.dfs,
             'GBFS': searcher.gbfs,
-            'A*': searcher.astar
+            'A*': searcher.astar,
+            'HL': searcher.hub_labeling,
+            'A*-cached': searcher.cached_astar,
+            'MT': searcher.min_transfer,
+            'REL': lambda o, d: searcher.reliable_route(
+                o, d,
+                objective=data.get('objective', 'expected'),
+                percentile=float(data.get('percentile', 0.9)),
+                deadline=data.get('deadline')),
+            'TD': lambda o, d: searcher.time_dependent_route(
+                o, d, departure=data.get('departure', 'Morning'))
         }
         if algorithm not in algo_map:
             return jsonify({'error': f'Invalid algorithm: {algorithm}'}), 400
@@ -107,12 +147,18 @@ def plan_route():
         'origin': origin,
         'destination': destination,
         'mode': mode,
+        'waypoints': waypoints,
         'algorithms': {}
     }
     
     for algo_name, algo_func in algorithms:
         try:
-            path, stats = algo_func(origin, destination)
+            if compressed and not waypoints and algo_name in ('DFS', 'GBFS'):
+                # Run the same engine on the chain-contracted skeleton; engines whose
+                # answers would change there (BFS, A*, HL) always search the full network
+                path, stats = searcher.run_compressed(algo_func.__name__, origin, destination)
+            else:
+                path, stats = algo_func(origin, destination)
             
             detailed_route = []
             if path and len(path) > 1:
@@ -132,6 +178,129 @@ def plan_route():
     
     return jsonify(results)
 
+@app.route('/api/travel-times', methods=['POST'])
+def travel_times():
+    """Cost-only batch lookup of exact travel times using hub labels"""
+    data = request.get_json()
+    
+    mode = data.get('mode', 'today')
+    pairs = data.get('pairs', [])
+    
+    if mode not in networks:
+        return jsonify({'error': 'Invalid mode'}), 400
+    
+    if not isinstance(pairs, list) or not all(
+            isinstance(p, list) and len(p) == 2 and all(isinstance(s, str) for s in p)
+            for p in pairs):
+        return jsonify({'error': 'pairs must be a list of [origin, destination]'}), 400
+    
+    network = networks[mode]
+    labels = searchers[mode].get_hub_labels()
+    
+    start_time = time.time()
+    results = []
+    for origin, destination in pairs:
+        cost = None
+        if network.is_station_available(origin) and network.is_station_available(destination):
+            cost = labels.query(origin, destination)
+            if cost == float('inf'):
+                cost = None
+        results.append({'origin': origin, 'destination': destination, 'cost': cost})
+    
+    return jsonify({
+        'mode': mode,
+        'results': results,
+        'runtime': time.time() - start_time
+    })
+
+def _closure_target(data, network):
+    """Parse a station or [station, station, line] segment from a request body"""
+    station = data.get('station')
+    segment = data.get('segment')
+    if station:
+        if not isinstance(station, str) or station not in network.stations:
+            return None, None, f'Unknown station: {station}'
+        return station, None, None
+    if (isinstance(segment, list) and len(segment) == 3
+            and all(isinstance(part, str) for part in segment)):
+        station1, station2, line = segment
+        for name in (station1, station2):
+            if name not in network.stations:
+                return None, None, f'Unknown station: {name}'
+        # Check the full adjacency so closed segments can still be reopened
+        if not any(n == station2 and l == line for n, _, l in network.graph[station1]):
+            return None, None, f'No {line} segment between {station1} and {station2}'
+        return None, (station1, station2, line), None
+    return None, None, 'Provide a station or a segment [station, station, line]'
+
+@app.route('/api/disruptions', methods=['POST'])
+def update_disruptions():
+    """Close or reopen a station or segment in the disruption overlay"""
+    data = request.get_json()
+    
+    mode = data.get('mode', 'today')
+    action = data.get('action')
+    
+    if mode not in networks:
+        return jsonify({'error': 'Invalid mode'}), 400
+    
+    network = networks[mode]
+    if action == 'clear':
+        network.clear_disruptions()
+    elif action in ('close', 'reopen'):
+        station, segment, error = _closure_target(data, network)
+        if error:
+            return jsonify({'error': error}), 400
+        if station:
+            (network.close_station if action == 'close' else network.reopen_station)(station)
+        else:
+            (network.close_segment if action == 'close' else network.reopen_segment)(*segment)
+    else:
+        return jsonify({'error': f'Invalid action: {action}'}), 400
+    
+    return jsonify({
+        'mode': mode,
+        'version': network.version,
+        'closed_stations': sorted(network.closed_stations),
+        'closed_segments': sorted(network.closed_segments),
+        'connectivity': searchers[mode].get_connectivity().summary()
+    })
+
+@app.route('/api/closure-impact', methods=['POST'])
+def closure_impact():
+    """Whether closing a station or segment would disconnect origin from destination"""
+    data = request.get_json()
+    
+    mode = data.get('mode', 'today')
+    origin = data.get('origin')
+    destination = data.get('destination')
+    
+    if mode not in networks:
+        return jsonify({'error': 'Invalid mode'}), 400
+    
+    network = networks[mode]
+    if origin not in network.stations or destination not in network.stations:
+        return jsonify({'error': 'Origin and destination must be valid stations'}), 400
+    
+    station, segment, error = _closure_target(data, network)
+    if error:
+        return jsonify({'error': error}), 400
+    
+    start_time = time.time()
+    index = searchers[mode].get_connectivity()
+    if station:
+        disconnects = index.station_closure_disconnects(station, origin, destination)
+    else:
+        disconnects = index.segment_closure_disconnects(segment, origin, destination)
+    
+    return jsonify({
+        'mode': mode,
+        'origin': origin,
+        'destination': destination,
+        'disconnects': disconnects,
+        'runtime': time.time() - start_time
+    })
+
 def get_detailed_route(network, path):
     """Get detailed route with line information"""
     if not path or len(path) < 2: